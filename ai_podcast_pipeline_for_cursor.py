@@ -24,8 +24,21 @@ from googleapiclient.http import MediaFileUpload
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 import pickle
+import hashlib
+import uuid
+import atexit
+import threading
+import queue
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from google.cloud import storage
+from google.api_core import exceptions as gcs_exceptions
 from google.cloud import texttospeech
+try:
+    import resource  # peak RSS for step instrumentation; not available on Windows
+except ImportError:
+    resource = None
 print(storage.__version__)
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -33,6 +46,34 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 # Load environment variables from .env file
 load_dotenv()
 
+# -----------------------------------------
+# SHARED CLIENT REGISTRY
+# -----------------------------------------
+# Storage, Drive, TTS and model clients are created lazily once per process and
+# reused, so credentials are parsed once and TLS sessions stay pooled. Google
+# credentials held by these clients refresh themselves when they expire.
+_shared_clients = {}
+_shared_clients_lock = threading.RLock()
+HTTP_POOL_MAXSIZE = 16
+
+def get_shared_client(name, factory):
+    """Return the process-wide client registered under name, creating it once with factory()."""
+    with _shared_clients_lock:
+        if name not in _shared_clients:
+            _shared_clients[name] = factory()
+            print(f"🔌 Created shared {name} client")
+        return _shared_clients[name]
+
+def get_http_session():
+    """Shared requests.Session with a connection pool sized for parallel chunk requests."""
+    def create_session():
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    return get_shared_client('http', create_session)
+
 # -----------------------------------------
 # GOOGLE CLOUD STORAGE CONFIGURATION
 # -----------------------------------------
@@ -40,19 +81,66 @@ GCS_BUCKET_NAME = 'jmio-podcast-storage'  # Replace with your bucket name
 GCS_SERVICE_ACCOUNT_FILE = 'jmio-google-api.json'  # Your existing service account key file
 
 def get_gcs_client():
-    """Initialize and return a Google Cloud Storage client."""
+    """Return the shared Google Cloud Storage client, creating it on first use."""
     try:
-        client = storage.Client.from_service_account_json(GCS_SERVICE_ACCOUNT_FILE)
-        return client
+        return get_shared_client('gcs', lambda: storage.Client.from_service_account_json(GCS_SERVICE_ACCOUNT_FILE))
     except Exception as e:
         print(f"❌ Error initializing GCS client: {e}")
         return None
 
+# Large files (MP3s) go up as resumable uploads in chunks of this size (a multiple of 256 KiB)
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Per-folder index of the newest upload, so "latest file" is one GET instead of a listing.
+# Only uploads through this script update it (record_latest_gcs_upload); files added by
+# other tools or by hand are picked up when the manifest is older than the max age below,
+# or right away if the uploader also calls record_latest_gcs_upload or deletes the manifest.
+GCS_LATEST_MANIFEST_NAME = '_latest.json'
+GCS_LATEST_HISTORY_LENGTH = 20
+GCS_LATEST_MANIFEST_MAX_AGE_SECONDS = 6 * 60 * 60
+GCS_MANIFEST_UPDATE_ATTEMPTS = 5
+GCS_RESUMABLE_THRESHOLD_BYTES = 8 * 1024 * 1024
+TEXT_CONTENT_TYPE = 'text/plain; charset=utf-8'
+
+def gcs_content_type_for(name):
+    lower = str(name).lower()
+    if lower.endswith('.txt'):
+        return TEXT_CONTENT_TYPE
+    if lower.endswith('.mp3'):
+        return 'audio/mpeg'
+    return None
+
+def upload_bytes_to_gcs(data, destination_blob_name, content_type=None, cache_control=None):
+    """
+    Upload in-memory text or bytes straight to GCS (no temp file) and return the public URL.
+    Metadata is set before the upload so no follow-up patch request is needed.
+    """
+    try:
+        client = get_gcs_client()
+        if not client:
+            return None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+            content_type = content_type or TEXT_CONTENT_TYPE
+        blob = client.bucket(GCS_BUCKET_NAME).blob(destination_blob_name)
+        if cache_control:
+            blob.cache_control = cache_control
+        with network_timer():
+            blob.upload_from_string(data, content_type=content_type or gcs_content_type_for(destination_blob_name) or 'application/octet-stream')
+        record_step_metric("bytes_out", len(data))
+        print(f"✅ Uploaded {len(data)} bytes from memory to gs://{GCS_BUCKET_NAME}/{destination_blob_name}")
+        record_latest_gcs_upload(destination_blob_name)
+        return f"https://storage.googleapis.com/{GCS_BUCKET_NAME}/{destination_blob_name}"
+    except Exception as e:
+        print(f"❌ Error uploading to GCS: {e}")
+        return None
+
 def upload_file_to_gcs(file_path, destination_blob_name):
     """Upload a file to Google Cloud Storage and return the public URL."""
     try:
+        is_text_file = str(file_path).endswith('.txt') or destination_blob_name.endswith('.txt')
+        cleaned_text = None
         # FINAL MOJIBAKE PROTECTION FOR TEXT FILES
-        if str(file_path).endswith('.txt') or destination_blob_name.endswith('.txt'):
+        if is_text_file:
             print(f"🔍 upload_file_to_gcs: Detected text file upload, applying final mojibake protection")
             print(f"🔍 File: {file_path} → {destination_blob_name}")
             
@@ -65,82 +153,31 @@ def upload_file_to_gcs(file_path, destination_blob_name):
                 print(f"🔍 Original file content sample: {original_sample}")
                 
                 # Apply all our encoding fixes
-                content = fix_text_encoding(content)
-                content = force_clean_mojibake(content)
-                
-                # ULTRA-AGGRESSIVE FINAL CLEANING
-                ultra_aggressive_patterns = {
-                    # Visual mojibake patterns
-                    'â€™': "'",    # Right single quotation mark
-                    'â€œ': '"',    # Left double quotation mark  
-                    'â€': '"',     # Right double quotation mark
-                    'â€"': '—',    # Em dash
-                    'â€"': '–',    # En dash
-                    'â€¦': '...',  # Ellipsis
-                    'â€¢': '•',    # Bullet
-                    'â€˜': "'",    # Left single quotation mark
-                    
-                    # UTF-8 byte sequences
-                    '\u00e2\u0080\u0099': "'",  # Right single quotation mark
-                    '\u00e2\u0080\u009c': '"',  # Left double quotation mark
-                    '\u00e2\u0080\u009d': '"',  # Right double quotation mark
-                    '\u00e2\u0080\u0094': '—',  # Em dash
-                    '\u00e2\u0080\u0093': '–',  # En dash
-                    '\u00e2\u0080\u00a6': '...', # Ellipsis
-                    
-                    # Raw UTF-8 bytes
-                    '\xe2\x80\x99': "'",
-                    '\xe2\x80\x9c': '"',
-                    '\xe2\x80\x9d': '"',
-                    '\xe2\x80\x94': '—',
-                    '\xe2\x80\x93': '–',
-                    '\xe2\x80\xa6': '...',
-                    
-                    # Windows-1252 patterns
-                    '\x91': "'",  # LEFT SINGLE QUOTATION MARK
-                    '\x92': "'",  # RIGHT SINGLE QUOTATION MARK
-                    '\x93': '"',  # LEFT DOUBLE QUOTATION MARK
-                    '\x94': '"',  # RIGHT DOUBLE QUOTATION MARK
-                    '\x96': '–',  # EN DASH
-                    '\x97': '—',  # EM DASH
-                }
-                
-                # Apply ultra-aggressive cleaning
-                changes_made = 0
-                for bad_pattern, good_replacement in ultra_aggressive_patterns.items():
-                    if bad_pattern in content:
-                        content = content.replace(bad_pattern, good_replacement)
-                        changes_made += 1
-                        print(f"🔧 ULTRA-AGGRESSIVE: Replaced {repr(bad_pattern)} → {repr(good_replacement)}")
-                
-                if changes_made > 0:
-                    print(f"🔧 ULTRA-AGGRESSIVE: Made {changes_made} mojibake replacements")
+                content = clean_text(content)
                 
                 # FINAL VERIFICATION
                 final_sample = content[:200]
                 print(f"🔍 Final cleaned content sample: {final_sample}")
                 
                 # Check for any remaining mojibake
-                remaining_mojibake = []
-                for pattern in ultra_aggressive_patterns.keys():
-                    if pattern in content:
-                        remaining_mojibake.append(pattern)
-                
-                if remaining_mojibake:
-                    print(f"⚠️ CRITICAL WARNING: Still found mojibake after ultra-aggressive cleaning: {remaining_mojibake}")
+                remaining = remaining_mojibake(content)
+                if remaining:
+                    print(f"⚠️ CRITICAL WARNING: Still found mojibake after cleaning: {remaining}")
                 else:
-                    print("✅ ULTRA-AGGRESSIVE: File is completely clean of all mojibake patterns")
-                
-                # Write the cleaned content back to the file
-                with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                    f.write(content)
+                    print("✅ File is completely clean of all mojibake patterns")
                 
+                # Upload the cleaned content from memory instead of writing it back to disk
+                cleaned_text = content
                 print(f"✅ Text file cleaned and ready for GCS upload")
                 
             except Exception as e:
                 print(f"⚠️ Warning: Could not apply final mojibake protection to text file: {e}")
                 # Continue with upload even if cleaning fails
         
+        if cleaned_text is not None:
+            # Correct Content-Type so browsers use UTF-8; no-cache avoids stale cached headers
+            return upload_bytes_to_gcs(cleaned_text, destination_blob_name, content_type=TEXT_CONTENT_TYPE, cache_control='no-cache')
+        
         client = get_gcs_client()
         if not client:
             return None
@@ -149,18 +186,17 @@ def upload_file_to_gcs(file_path, destination_blob_name):
         blob = bucket.blob(destination_blob_name)
         
         # Ensure correct Content-Type for text files so browsers use UTF-8
-        if str(file_path).endswith('.txt') or destination_blob_name.endswith('.txt'):
-            blob.upload_from_filename(file_path, content_type='text/plain; charset=utf-8')
-            try:
-                blob.content_type = 'text/plain; charset=utf-8'
-                # Optional: avoid stale cached incorrect headers
+        with network_timer():
+            if is_text_file:
                 blob.cache_control = 'no-cache'
-                blob.patch()
-                print("✅ Set GCS metadata: Content-Type text/plain; charset=utf-8, Cache-Control no-cache")
-            except Exception as meta_err:
-                print(f"⚠️ Warning: Failed to set GCS metadata for text file: {meta_err}")
-        else:
-            blob.upload_from_filename(file_path)
+                blob.upload_from_filename(file_path, content_type=TEXT_CONTENT_TYPE)
+            else:
+                # Chunked resumable upload for large audio so a dropped connection only resends one chunk
+                if os.path.getsize(file_path) > GCS_RESUMABLE_THRESHOLD_BYTES:
+                    blob.chunk_size = GCS_UPLOAD_CHUNK_SIZE
+                blob.upload_from_filename(file_path, content_type=gcs_content_type_for(file_path))
+        record_step_metric("bytes_out", os.path.getsize(file_path))
+        record_latest_gcs_upload(destination_blob_name)
         
         # For uniform bucket-level access, we don't need to make individual objects public
         # The bucket's IAM permissions control access
@@ -179,7 +215,9 @@ def download_file_from_gcs(blob_name, local_file_path):
         bucket = client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(blob_name)
         
-        blob.download_to_filename(local_file_path)
+        with network_timer():
+            blob.download_to_filename(local_file_path)
+        record_step_metric("bytes_in", os.path.getsize(local_file_path))
         return local_file_path
     except Exception as e:
         print(f"❌ Error downloading from GCS: {e}")
@@ -195,26 +233,104 @@ def list_files_in_gcs_folder(folder_prefix):
         bucket = client.bucket(GCS_BUCKET_NAME)
         blobs = bucket.list_blobs(prefix=folder_prefix)
         
-        return [blob.name for blob in blobs]
+        return [blob.name for blob in blobs if blob.name.rsplit('/', 1)[-1] != GCS_LATEST_MANIFEST_NAME]
     except Exception as e:
         print(f"❌ Error listing GCS files: {e}")
         return []
 
+def gcs_latest_manifest_name(folder_prefix):
+    folder = str(folder_prefix).strip('/')
+    return f"{folder}/{GCS_LATEST_MANIFEST_NAME}" if folder else GCS_LATEST_MANIFEST_NAME
+
+def record_latest_gcs_upload(blob_name):
+    """
+    Point the uploaded blob's folder manifest at blob_name, keeping a short history.
+    The write is conditional on the manifest generation that was read, so concurrent
+    uploaders retry instead of overwriting each other.
+    """
+    folder = blob_name.rsplit('/', 1)[0] if '/' in blob_name else ''
+    manifest_name = gcs_latest_manifest_name(folder)
+    if blob_name == manifest_name:
+        return False
+    try:
+        client = get_gcs_client()
+        if not client:
+            return False
+        bucket = client.bucket(GCS_BUCKET_NAME)
+        for attempt in range(GCS_MANIFEST_UPDATE_ATTEMPTS):
+            existing = bucket.get_blob(manifest_name)
+            generation = existing.generation if existing else 0
+            manifest = {}
+            if existing:
+                try:
+                    manifest = json.loads(existing.download_as_text(if_generation_match=generation))
+                except gcs_exceptions.PreconditionFailed:
+                    continue
+                except ValueError:
+                    manifest = {}
+            history = [blob_name] + [name for name in manifest.get('history', []) if name != blob_name]
+            updated = {
+                'latest': blob_name,
+                'updated_at': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'updated_ts': time.time(),
+                'history': history[:GCS_LATEST_HISTORY_LENGTH],
+            }
+            try:
+                bucket.blob(manifest_name).upload_from_string(
+                    json.dumps(updated),
+                    content_type='application/json; charset=utf-8',
+                    if_generation_match=generation,
+                )
+                return True
+            except gcs_exceptions.PreconditionFailed:
+                print(f"[DEBUG] {manifest_name} changed concurrently, retrying ({attempt+1}/{GCS_MANIFEST_UPDATE_ATTEMPTS})")
+        print(f"⚠️ Could not update {manifest_name} after {GCS_MANIFEST_UPDATE_ATTEMPTS} attempts")
+    except Exception as e:
+        print(f"⚠️ Could not update latest-file manifest for {blob_name}: {e}")
+    return False
+
 def get_latest_file_in_gcs_folder(folder_prefix):
-    """Get the latest file in a GCS folder based on creation time."""
+    """
+    Get the latest file in a GCS folder from its manifest, after checking the named blob still
+    exists. Falls back to the newest blob by creation time when there is no manifest, it points
+    at a missing blob, or it is older than GCS_LATEST_MANIFEST_MAX_AGE_SECONDS.
+    """
     try:
         client = get_gcs_client()
         if not client:
             return None
             
         bucket = client.bucket(GCS_BUCKET_NAME)
-        blobs = list(bucket.list_blobs(prefix=folder_prefix))
+        manifest_name = gcs_latest_manifest_name(folder_prefix)
+        try:
+            manifest = json.loads(bucket.blob(manifest_name).download_as_text())
+            latest = manifest.get('latest')
+            manifest_age = time.time() - float(manifest.get('updated_ts') or 0)
+            if latest and manifest_age > GCS_LATEST_MANIFEST_MAX_AGE_SECONDS:
+                print(f"[DEBUG] {manifest_name} is {manifest_age / 3600:.1f}h old; re-listing {folder_prefix}")
+            elif latest and bucket.get_blob(latest) is not None:
+                return latest
+            elif latest:
+                print(f"⚠️ {manifest_name} points at missing {latest}; re-listing {folder_prefix}")
+        except gcs_exceptions.NotFound:
+            pass
+        except ValueError as e:
+            print(f"⚠️ Ignoring unreadable {manifest_name}: {e}")
+        
+        # No usable manifest (folder written by something else): fall back to a listing
+        blobs = [
+            blob for blob in bucket.list_blobs(prefix=folder_prefix)
+            if blob.name.rsplit('/', 1)[-1] != GCS_LATEST_MANIFEST_NAME
+        ]
         
         if not blobs:
             return None
             
         # Sort by creation time (newest first)
         latest_blob = max(blobs, key=lambda x: x.time_created)
+        # Seed the manifest so the next lookup is a single GET
+        if gcs_latest_manifest_name(latest_blob.name.rsplit('/', 1)[0] if '/' in latest_blob.name else '') == manifest_name:
+            record_latest_gcs_upload(latest_blob.name)
         return latest_blob.name
     except Exception as e:
         print(f"❌ Error getting latest file from GCS: {e}")
@@ -262,8 +378,7 @@ def download_latest_text_file_from_gcs(folder_prefix):
                 print(f"🔧 Applying emergency mojibake cleaning to downloaded content...")
                 
                 # Emergency cleaning
-                content = fix_text_encoding(content)
-                content = force_clean_mojibake(content)
+                content = clean_text(content)
                 
                 # Additional aggressive cleaning
                 for pattern in ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']:
@@ -310,6 +425,18 @@ def upload_audio_to_gcs(audio_file_path, destination_blob_name):
     """Uploads an audio file to Google Cloud Storage and returns the public URL."""
     return upload_file_to_gcs(audio_file_path, destination_blob_name)
 
+def temp_download_path(file_name):
+    """Private temp path for a downloaded file.
+
+    Steps that read the same source can run at the same time, so every download gets its
+    own file; one step's cleanup can't delete, and a re-download can't overwrite, another's copy.
+    """
+    return MP3_OUTPUT_DIR / f"temp_{uuid.uuid4().hex[:8]}_{file_name}"
+
+def gcs_temp_download_path(blob_name):
+    """Temp path for a downloaded MP3, named after the full blob path so same-named files in different folders are easy to tell apart."""
+    return temp_download_path(blob_name.strip('/').replace('/', '_'))
+
 def download_latest_mp3_from_gcs(folder_prefix):
     """Downloads the latest MP3 file from a Google Cloud Storage folder."""
     try:
@@ -319,7 +446,7 @@ def download_latest_mp3_from_gcs(folder_prefix):
             return None
             
         # Download to temporary file
-        temp_path = MP3_OUTPUT_DIR / f"temp_{os.path.basename(latest_file)}"
+        temp_path = gcs_temp_download_path(latest_file)
         result = download_file_from_gcs(latest_file, temp_path)
         
         if result:
@@ -336,8 +463,13 @@ def download_mp3_file_from_gcs(blob_name):
     """Downloads a specific MP3 file from Google Cloud Storage."""
     try:
         # Download to temporary file
-        temp_path = MP3_OUTPUT_DIR / f"temp_{os.path.basename(blob_name)}"
-        result = download_file_from_gcs(blob_name, temp_path)
+        temp_path = gcs_temp_download_path(blob_name)
+        if ASSET_CACHE_ENABLED:
+            # Static files come from the local asset cache; callers still get their own copy to delete
+            cached_path = cached_gcs_asset(blob_name)
+            result = shutil.copyfile(cached_path, temp_path) if cached_path else None
+        else:
+            result = download_file_from_gcs(blob_name, temp_path)
         
         if result:
             print(f"✅ Downloaded MP3 file: {temp_path}")
@@ -364,89 +496,15 @@ def upload_text_to_gcs(text_content, destination_blob_name):
         initial_sample = text_content[:300]
         print(f"🔍 Initial text sample: {initial_sample}")
         
-        # Apply encoding fix before saving
-        text_content = fix_text_encoding(text_content)
-
-        # AGGRESSIVE MOJIBAKE CLEANING - Apply multiple passes
-        # Pass 1: Standard force_clean_mojibake
-        before_first_pass = text_content[:300]
-        text_content = force_clean_mojibake(text_content)
-        after_first_pass = text_content[:300]
-        
-        # Pass 2: Additional aggressive pattern matching for persistent cases
-        additional_patterns = {
-            # Even more specific byte sequences that might slip through
-            '\xe2\x80\x99': "'",     # UTF-8 bytes for right single quotation mark
-            '\xe2\x80\x9c': '"',     # UTF-8 bytes for left double quotation mark
-            '\xe2\x80\x9d': '"',     # UTF-8 bytes for right double quotation mark
-            '\xe2\x80\x94': '—',     # UTF-8 bytes for em dash
-            '\xe2\x80\x93': '–',     # UTF-8 bytes for en dash
-            '\xe2\x80\xa6': '...',   # UTF-8 bytes for ellipsis
-            
-            # Raw byte representations that might appear
-            b'\xe2\x80\x99'.decode('latin1'): "'",
-            b'\xe2\x80\x9c'.decode('latin1'): '"',
-            b'\xe2\x80\x9d'.decode('latin1'): '"',
-            
-            # Windows-1252 double-encoding patterns
-            'â€™': "'",
-            'â€œ': '"',
-            'â€': '"',
-            'â€"': '—',
-            'â€"': '–',
-            'â€¦': '...',
-            'â€¢': '•',
-            'â€˜': "'",
-            
-            # ISO-8859-1 misinterpretations
-            'Ã¢â‚¬â„¢': "'",
-            'Ã¢â‚¬Å"': '"',
-            'Ã¢â‚¬Â': '"',
-        }
-        
-        before_second_pass = text_content[:300]
-        for bad_pattern, good_replacement in additional_patterns.items():
-            if bad_pattern in text_content:
-                text_content = text_content.replace(bad_pattern, good_replacement)
-                print(f"🔧 Replaced pattern: {repr(bad_pattern)} → {repr(good_replacement)}")
-        
-        after_second_pass = text_content[:300]
-        
-        # Pass 3: Character-by-character scan for any remaining problematic sequences
-        # Look for the specific problematic sequences mentioned by user
-        final_check_patterns = ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']
-        before_final_check = text_content
-        
-        for pattern in final_check_patterns:
-            if pattern in text_content:
-                print(f"⚠️ CRITICAL: Found persistent mojibake pattern: {repr(pattern)}")
-                # Apply more aggressive replacement
-                if pattern == 'â€™':
-                    text_content = text_content.replace(pattern, "'")
-                elif pattern == 'â€':
-                    text_content = text_content.replace(pattern, '"')
-                elif pattern == 'â€œ':
-                    text_content = text_content.replace(pattern, '"')
-                elif pattern == 'â€"':
-                    text_content = text_content.replace(pattern, '—')
-                elif pattern == 'â€¦':
-                    text_content = text_content.replace(pattern, '...')
-                print(f"🔧 AGGRESSIVE: Replaced {repr(pattern)} → appropriate character")
+        # One pass of the shared mojibake table
+        text_content = clean_text(text_content)
         
         # COMPREHENSIVE MOJIBAKE VERIFICATION
         final_sample = text_content[:300]
-        all_mojibake_patterns = [
-            'â€™', 'â€œ', 'â€', 'â€"', 'â€¦', 'â€¢', 'â€˜',
-            '\u00e2\u0080\u0099', '\u00e2\u0080\u009c', '\u00e2\u0080\u009d',
-            '\xe2\x80\x99', '\xe2\x80\x9c', '\xe2\x80\x9d'
-        ]
-        
-        remaining_issues = [pattern for pattern in all_mojibake_patterns if pattern in text_content]
+        remaining_issues = remaining_mojibake(text_content)
         
         print(f"🔍 Mojibake cleaning summary:")
         print(f"   Initial:     {initial_sample}")
-        print(f"   After pass 1: {after_first_pass}")
-        print(f"   After pass 2: {after_second_pass}")
         print(f"   Final:       {final_sample}")
         print(f"   Remaining mojibake patterns: {len(remaining_issues)}")
         
@@ -461,35 +519,11 @@ def upload_text_to_gcs(text_content, destination_blob_name):
         print(f"🔍 Final verification - text length: {len(text_content)}")
         print(f"🔍 Final text sample: {text_content[:200]}{'...' if len(text_content) > 200 else ''}")
 
-        # Create temporary file with explicit UTF-8 encoding
-        temp_path = MP3_OUTPUT_DIR / f"temp_text_{int(time.time())}.txt"
-        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
-            f.write(text_content)
-        
-        # Verify the file was written correctly
-        with open(temp_path, 'r', encoding='utf-8') as f:
-            read_back = f.read()
-        
-        if read_back != text_content:
-            print("⚠️ WARNING: File read-back doesn't match written content!")
-        
-        # Check for mojibake in the read-back content
-        read_back_issues = [pattern for pattern in all_mojibake_patterns if pattern in read_back]
-        if read_back_issues:
-            print(f"⚠️ CRITICAL: Mojibake found in file read-back: {read_back_issues}")
-        else:
-            print("✅ File verification passed - no mojibake in written file")
-
-        # Upload to GCS
-        result = upload_file_to_gcs(temp_path, destination_blob_name)
+        # Encode once with explicit UTF-8
+        payload = text_content.encode('utf-8')
 
-        # Clean up temp file
-        try:
-            os.remove(temp_path)
-        except:
-            pass
-
-        return result
+        # Upload to GCS straight from memory
+        return upload_bytes_to_gcs(payload, destination_blob_name, content_type=TEXT_CONTENT_TYPE, cache_control='no-cache')
 
     except Exception as e:
         print(f"❌ Error uploading text to GCS: {e}")
@@ -610,6 +644,8 @@ OPENAI_WEB_SEARCH_FOLLOWUP_MAX_OUTPUT_TOKENS = 2500
 ANTHROPIC_DEFAULT_TIMEOUT_SECONDS = 180
 ANTHROPIC_WEB_SEARCH_TIMEOUT_SECONDS = 300
 ANTHROPIC_MAX_RETRIES = 0
+# Gemini has no client-level timeout; each generate_content call gets this deadline
+GOOGLE_MODEL_TIMEOUT_SECONDS = get_env_int("GOOGLE_MODEL_TIMEOUT_SECONDS", 300)
 
 # Manual model-ID overrides to support deterministic workflow codes like M198.
 # This keeps workflows resilient even before the Models sheet is updated.
@@ -706,6 +742,24 @@ ELEVENLABS_MODEL_ID_ALIASES = {
     "eleven_v2": ELEVENLABS_DEFAULT_MODEL_ID,
     "eleven_multilingual_v2": ELEVENLABS_DEFAULT_MODEL_ID,
 }
+# ElevenLabs caps simultaneous requests per subscription tier (Free 2, Starter 3,
+# Creator 5, Pro 10+). Chunk synthesis never runs wider than this setting.
+ELEVENLABS_MAX_CONCURRENCY = get_env_int("ELEVENLABS_MAX_CONCURRENCY", 3)
+ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS = 4
+# Shared by every chunk and every workflow step so parallel TTS steps stay within the tier limit
+_elevenlabs_request_slots = threading.BoundedSemaphore(max(1, ELEVENLABS_MAX_CONCURRENCY))
+# Chunk planning: sizes are balanced across the chunk count instead of packed greedily,
+# so parallel synthesis is not held up by one full chunk next to a short tail.
+# TTS_CHUNK_TARGET_PARALLELISM > 0 splits further (down to TTS_MIN_CHUNK_CHARS) to fill that many workers.
+TTS_CHUNK_TARGET_PARALLELISM = get_env_int("TTS_CHUNK_TARGET_PARALLELISM", 0)
+TTS_MIN_CHUNK_CHARS = get_env_int("TTS_MIN_CHUNK_CHARS", 600)
+# Rough synthesis throughput used for the plan's time estimates
+TTS_EST_CHARS_PER_SECOND = get_env_int("TTS_EST_CHARS_PER_SECOND", 100)
+# Streaming mode writes chunk audio straight into the episode file (and a resumable GCS
+# upload) in chunk order instead of per-chunk temp files plus a merge.
+ELEVENLABS_STREAM_TO_OUTPUT = get_env_int("ELEVENLABS_STREAM_TO_OUTPUT", 0) != 0
+# SDK endpoint used by streaming mode: "convert" or "stream"
+ELEVENLABS_TTS_ENDPOINT = os.getenv("ELEVENLABS_TTS_ENDPOINT", "convert").strip().lower()
 
 # Instantiate the OpenAI client once using the API key from environment variables
 if not OPENAI_API_KEY:
@@ -729,8 +783,43 @@ except Exception as e:
     print(f"⚠️ Google Text-to-Speech client initialization failed: {e}")
     google_tts_client = None
 
-# Configure OpenAI client for predictable timeouts and no hidden retries
-client = OpenAI(api_key=OPENAI_API_KEY, timeout=OPENAI_DEFAULT_TIMEOUT_SECONDS, max_retries=0)
+# --- PROVIDER CLIENTS ---
+# One long-lived client per provider so every model call reuses the same
+# connection pool instead of paying connection and TLS setup each time.
+def get_openai_client():
+    # Predictable timeouts and no hidden retries
+    return get_shared_client('openai', lambda: OpenAI(
+        api_key=OPENAI_API_KEY, timeout=OPENAI_DEFAULT_TIMEOUT_SECONDS, max_retries=0))
+
+client = get_openai_client()
+
+def get_anthropic_client():
+    import anthropic
+    return get_shared_client('anthropic', lambda: anthropic.Anthropic(
+        api_key=os.getenv('ANTHROPIC_API_KEY'),
+        timeout=ANTHROPIC_DEFAULT_TIMEOUT_SECONDS,
+        max_retries=ANTHROPIC_MAX_RETRIES,
+    ))
+
+def get_gemini_module():
+    """google.generativeai keeps its configuration globally, so configure it once."""
+    def configure():
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
+        return genai
+    return get_shared_client('gemini', configure)
+
+def deadline_after(seconds):
+    """Monotonic deadline for a call budget, or None when the call is unbounded."""
+    return time.monotonic() + seconds if seconds else None
+
+def remaining_seconds(deadline):
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+def deadline_passed(deadline):
+    return deadline is not None and time.monotonic() >= deadline
 
 print(f"[DEBUG] Python version: {sys.version}")
 print(f"[DEBUG] requests version: {requests.__version__}")
@@ -743,6 +832,8 @@ except ImportError:
 # Set the directory for generated mp3 files
 MP3_OUTPUT_DIR = Path("generated_mp3")
 MP3_OUTPUT_DIR.mkdir(exist_ok=True)
+# Caches that should outlive a run; CI restores this directory with actions/cache
+ASSET_CACHE_DIR = Path(os.getenv("ASSET_CACHE_DIR", ".asset_cache"))
 
 # Clean up old mp3 files (older than 5 days)
 def cleanup_old_mp3_files():
@@ -759,11 +850,582 @@ def cleanup_old_mp3_files():
 # Call cleanup at the start of the script
 cleanup_old_mp3_files()
 
+# -----------------------------------------
+# TTS AUDIO CACHE
+# -----------------------------------------
+# Synthesized chunks are stored under a hash of everything that affects the audio
+# (provider, text, voice, model, settings, neighbor context), so a re-run after a
+# late-step failure reuses them instead of paying for the same audio again. The local
+# tier sits in the persistent cache directory, outside generated_mp3/ and its cleanup.
+TTS_CACHE_ENABLED = get_env_int("TTS_CACHE_ENABLED", 1) != 0
+TTS_CACHE_DIR = ASSET_CACHE_DIR / "tts_cache"
+TTS_CACHE_MAX_MB = get_env_int("TTS_CACHE_MAX_MB", 500)
+# Optional shared tier in the GCS bucket, e.g. TTS_CACHE_GCS_PREFIX=tts_cache
+TTS_CACHE_GCS_PREFIX = os.getenv("TTS_CACHE_GCS_PREFIX", "").strip().strip("/")
+_tts_cache_lock = threading.Lock()
+
+
+def build_tts_cache_key(provider, **fields):
+    """Return a stable sha256 key for a TTS request."""
+    payload = json.dumps({"provider": provider, **fields}, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _tts_cache_blob_name(key, suffix):
+    return f"{TTS_CACHE_GCS_PREFIX}/{key}{suffix}"
+
+
+def _local_tts_cache_path(key, suffix):
+    """Return the local cache file for key (pulling it from GCS if needed), or None on a miss."""
+    cache_path = TTS_CACHE_DIR / f"{key}{suffix}"
+    if not cache_path.is_file() and TTS_CACHE_GCS_PREFIX:
+        gcs_client = get_gcs_client()
+        if gcs_client:
+            blob = gcs_client.bucket(GCS_BUCKET_NAME).blob(_tts_cache_blob_name(key, suffix))
+            if blob.exists():
+                TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+                blob.download_to_filename(str(partial_path))
+                os.replace(partial_path, cache_path)
+                print(f"[CACHE] Pulled TTS chunk {key[:12]} from gs://{GCS_BUCKET_NAME}/{TTS_CACHE_GCS_PREFIX}")
+    if not cache_path.is_file():
+        return None
+    # Touch the entry so eviction treats it as recently used
+    os.utime(cache_path, None)
+    return cache_path
+
+
+def fetch_tts_cache(key, output_path, suffix=".mp3"):
+    """Copy a cached TTS result to output_path. Returns True on a cache hit."""
+    if not TTS_CACHE_ENABLED:
+        return False
+    try:
+        cache_path = _local_tts_cache_path(key, suffix)
+        if cache_path is None:
+            return False
+        shutil.copyfile(cache_path, output_path)
+        print(f"[CACHE] TTS cache hit {key[:12]} -> {output_path}")
+        return True
+    except Exception as e:
+        print(f"⚠️ TTS cache read failed for {key[:12]}: {e}")
+        return False
+
+
+def fetch_tts_cache_bytes(key, suffix):
+    """Return the cached TTS result for key as bytes, or None on a miss."""
+    if not TTS_CACHE_ENABLED:
+        return None
+    try:
+        cache_path = _local_tts_cache_path(key, suffix)
+        if cache_path is None:
+            return None
+        print(f"[CACHE] TTS cache hit {key[:12]}")
+        return cache_path.read_bytes()
+    except Exception as e:
+        print(f"⚠️ TTS cache read failed for {key[:12]}: {e}")
+        return None
+
+
+def store_tts_cache(key, source_path, suffix=".mp3"):
+    """Save a freshly synthesized file (a path, or the audio bytes) into the cache and the GCS tier when configured."""
+    if not TTS_CACHE_ENABLED:
+        return
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = TTS_CACHE_DIR / f"{key}{suffix}"
+        partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        if isinstance(source_path, (bytes, bytearray, memoryview)):
+            partial_path.write_bytes(source_path)
+        else:
+            shutil.copyfile(source_path, partial_path)
+        os.replace(partial_path, cache_path)
+        if TTS_CACHE_GCS_PREFIX:
+            gcs_client = get_gcs_client()
+            if gcs_client:
+                blob = gcs_client.bucket(GCS_BUCKET_NAME).blob(_tts_cache_blob_name(key, suffix))
+                blob.upload_from_filename(str(cache_path))
+        evict_tts_cache()
+    except Exception as e:
+        print(f"⚠️ TTS cache write failed for {key[:12]}: {e}")
+
+
+def evict_tts_cache(max_bytes=None):
+    """Delete least-recently-used cache entries until the local cache fits within TTS_CACHE_MAX_MB."""
+    if max_bytes is None:
+        max_bytes = TTS_CACHE_MAX_MB * 1024 * 1024
+    with _tts_cache_lock:
+        if not TTS_CACHE_DIR.is_dir():
+            return
+        entries = []
+        for cache_file in TTS_CACHE_DIR.iterdir():
+            if cache_file.is_file() and not cache_file.name.endswith(".part"):
+                stat = cache_file.stat()
+                entries.append((stat.st_mtime, stat.st_size, cache_file))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, cache_file in sorted(entries):
+            if total_bytes <= max_bytes:
+                break
+            try:
+                cache_file.unlink()
+                total_bytes -= size
+                print(f"[CACHE] Evicted TTS cache entry: {cache_file.name}")
+            except Exception as e:
+                print(f"[CACHE ERROR] Could not evict {cache_file}: {e}")
+
+# -----------------------------------------
+# STATIC ASSET CACHE
+# -----------------------------------------
+# Intro/outro and other File-type audio rarely changes, so downloads are kept in a
+# persistent directory (restored by the CI cache) next to the validator they were
+# fetched at: the GCS blob generation or the Drive md5/revision. Each run only makes
+# a metadata request and downloads again when the validator has moved.
+ASSET_CACHE_ENABLED = get_env_int("ASSET_CACHE_ENABLED", 1) != 0
+
+
+def _asset_cache_paths(source, file_name):
+    """Return (content path, metadata path) for a cached asset."""
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:32]
+    suffix = Path(file_name).suffix or ".bin"
+    return ASSET_CACHE_DIR / f"{digest}{suffix}", ASSET_CACHE_DIR / f"{digest}.json"
+
+
+def read_asset_cache_entry(source, file_name):
+    """Return (cached path, validator) for source, or (None, None) when nothing usable is cached."""
+    content_path, meta_path = _asset_cache_paths(source, file_name)
+    try:
+        if content_path.is_file() and meta_path.is_file():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("source") == source and meta.get("size") == content_path.stat().st_size:
+                return content_path, meta.get("validator")
+    except Exception as e:
+        print(f"⚠️ Asset cache entry for {source} is unreadable: {e}")
+    return None, None
+
+
+def write_asset_cache_entry(source, file_name, validator, write_content):
+    """Store a fresh download. write_content(path) writes the asset bytes to path."""
+    ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    content_path, meta_path = _asset_cache_paths(source, file_name)
+    partial_path = content_path.with_name(f"{content_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+    write_content(partial_path)
+    os.replace(partial_path, content_path)
+    meta = {"source": source, "validator": validator, "size": content_path.stat().st_size, "cached_at": time.time()}
+    meta_partial = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+    meta_partial.write_text(json.dumps(meta), encoding="utf-8")
+    os.replace(meta_partial, meta_path)
+    return content_path
+
+
+def cached_gcs_asset(blob_name):
+    """
+    Return a local path holding the current contents of blob_name, downloading only when
+    the blob generation differs from the cached copy. Returns None if the blob cannot be read.
+    """
+    source = f"gs://{GCS_BUCKET_NAME}/{blob_name}"
+    cached_path, cached_generation = read_asset_cache_entry(source, blob_name)
+    try:
+        client = get_gcs_client()
+        if not client:
+            return cached_path
+        bucket = client.bucket(GCS_BUCKET_NAME)
+        try:
+            # 304 when the cached generation is still current
+            blob = bucket.get_blob(blob_name, if_generation_not_match=cached_generation) if cached_path else bucket.get_blob(blob_name)
+        except gcs_exceptions.NotModified:
+            print(f"[ASSET CACHE] Hit {blob_name} (generation {cached_generation})")
+            return cached_path
+        if blob is None:
+            print(f"❌ GCS asset not found: {blob_name}")
+            return None
+        print(f"[ASSET CACHE] Downloading {blob_name} (generation {blob.generation})")
+        with network_timer():
+            cached_path = write_asset_cache_entry(
+                source, blob_name, blob.generation,
+                lambda path: blob.download_to_filename(str(path), if_generation_match=blob.generation),
+            )
+        record_step_metric("bytes_in", cached_path.stat().st_size)
+        return cached_path
+    except Exception as e:
+        if cached_path:
+            print(f"⚠️ Could not revalidate {blob_name} ({e}); using cached copy")
+            return cached_path
+        print(f"❌ Error fetching GCS asset {blob_name}: {e}")
+        return None
+
+
+def cached_drive_asset(file_id, file_name, validator, download_content):
+    """
+    Return a local path for a Drive file whose md5/revision is validator, calling
+    download_content(path) only when the cached copy is missing or stale.
+    """
+    source = f"drive://{file_id}"
+    cached_path, cached_validator = read_asset_cache_entry(source, file_name)
+    if cached_path and validator and cached_validator == validator:
+        print(f"[ASSET CACHE] Hit {file_name} (revision {validator})")
+        return cached_path
+    print(f"[ASSET CACHE] Downloading {file_name} (revision {validator})")
+    return write_asset_cache_entry(source, file_name, validator, download_content)
+
+# -----------------------------------------
+# WORKFLOW CHECKPOINTS
+# -----------------------------------------
+# The workflow state (all_outputs, output_record, workflow_steps_records) is saved
+# before every step so a failed run can be resumed with RESUME_OUTPUT_ID=<Output ID>.
+# Checkpoints are mirrored to GCS because CI runners do not keep generated_mp3/.
+CHECKPOINT_DIR = MP3_OUTPUT_DIR / "checkpoints"
+CHECKPOINT_GCS_PREFIX = os.getenv("CHECKPOINT_GCS_PREFIX", "checkpoints").strip().strip("/")
+
+
+def _checkpoint_filename(output_id):
+    return f"output_{output_id}.json"
+
+
+def save_workflow_checkpoint(checkpoint):
+    """Persist a workflow checkpoint locally and, when configured, to GCS."""
+    filename = _checkpoint_filename(checkpoint["output_id"])
+    payload = json.dumps(checkpoint, ensure_ascii=False, default=str)
+    try:
+        CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+        partial_path = CHECKPOINT_DIR / f"{filename}.part"
+        with open(partial_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(partial_path, CHECKPOINT_DIR / filename)
+    except Exception as e:
+        print(f"⚠️ Could not write local checkpoint {filename}: {e}")
+    if CHECKPOINT_GCS_PREFIX:
+        try:
+            gcs_client = get_gcs_client()
+            if gcs_client:
+                blob = gcs_client.bucket(GCS_BUCKET_NAME).blob(f"{CHECKPOINT_GCS_PREFIX}/{filename}")
+                blob.upload_from_string(payload.encode("utf-8"), content_type="application/json; charset=utf-8")
+        except Exception as e:
+            print(f"⚠️ Could not mirror checkpoint {filename} to GCS: {e}")
+
+
+def load_workflow_checkpoint(output_id):
+    """Load the checkpoint for an Output ID from the local store, falling back to GCS."""
+    filename = _checkpoint_filename(output_id)
+    local_path = CHECKPOINT_DIR / filename
+    try:
+        if local_path.is_file():
+            with open(local_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        if CHECKPOINT_GCS_PREFIX:
+            gcs_client = get_gcs_client()
+            if gcs_client:
+                blob = gcs_client.bucket(GCS_BUCKET_NAME).blob(f"{CHECKPOINT_GCS_PREFIX}/{filename}")
+                if blob.exists():
+                    return json.loads(blob.download_as_text(encoding="utf-8"))
+    except Exception as e:
+        print(f"⚠️ Could not load checkpoint {filename}: {e}")
+    return None
+
+# -----------------------------------------
+# STEP INSTRUMENTATION
+# -----------------------------------------
+# Every workflow step collects wall time, time spent waiting on providers/GCS/HTTP
+# (summed across its parallel requests), bytes moved, model tokens, TTS characters,
+# retries and the process peak RSS. The numbers are appended to the step's Workflow
+# Steps row and written to a local JSONL trace (uploaded with the CI logs).
+STEP_METRIC_COLUMNS = [
+    ("wall_s", "Wall Seconds"),
+    ("network_s", "Network Seconds"),
+    ("bytes_in", "Bytes In"),
+    ("bytes_out", "Bytes Out"),
+    ("tokens_in", "Tokens In"),
+    ("tokens_out", "Tokens Out"),
+    ("tts_chars", "TTS Characters"),
+    ("retries", "Retries"),
+    ("peak_rss_mb", "Peak RSS MB"),
+]
+WORKFLOW_STEPS_BASE_COLUMNS = 9  # Workflow Steps ID ... Log, as built in the main loop
+STEP_TRACE_PATH = Path(os.getenv("STEP_TRACE_PATH", "logs/step_trace.jsonl"))
+_current_step_metrics = contextvars.ContextVar("current_step_metrics", default=None)
+_step_metrics_lock = threading.Lock()
+
+
+def record_step_metric(name, amount=1):
+    """Add amount to the named metric of the step running in this context (no-op outside a step)."""
+    metrics = _current_step_metrics.get()
+    if metrics is not None and amount:
+        with _step_metrics_lock:
+            metrics[name] = metrics.get(name, 0) + amount
+
+
+@contextmanager
+def network_timer():
+    """Count the enclosed block as network time for the current step."""
+    start_time = time.time()
+    try:
+        yield
+    finally:
+        record_step_metric("network_s", time.time() - start_time)
+
+
+def record_model_usage(response):
+    """Record token usage from an OpenAI, Anthropic or Gemini response, whichever fields it has."""
+    usage = getattr(response, "usage", None) or getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    tokens_in = (getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", None)
+                 or getattr(usage, "prompt_token_count", None) or 0)
+    tokens_out = (getattr(usage, "output_tokens", None) or getattr(usage, "completion_tokens", None)
+                  or getattr(usage, "candidates_token_count", None) or 0)
+    if isinstance(tokens_in, int):
+        record_step_metric("tokens_in", tokens_in)
+    if isinstance(tokens_out, int):
+        record_step_metric("tokens_out", tokens_out)
+
+
+def submit_in_context(executor, fn, *args):
+    """executor.submit that carries the caller's context, so pool threads report into the same step."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def current_peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def step_type_of(step):
+    """Short name of the step kind, used to group the trace."""
+    if step in ('PPU', 'UM'):
+        return step
+    if re.fullmatch(r'PPL\d+', step):
+        return 'PPL'
+    if re.fullmatch(r'R\d+SL\d+(?:T\d+)?', step):
+        return 'save'
+    if re.fullmatch(r'L\d+E\d+SL\d+(?:T\d+)?', step):
+        return 'elevenlabs'
+    if re.fullmatch(r'L\d+GV\d+SL\d+(?:T\d+)?', step):
+        return 'google_voice'
+    if re.fullmatch(r'L\d+(?:&L\d+)*SL\d+(?:T\d+)?', step):
+        return 'merge'
+    return 'model'
+
+
+def step_metric_values(metrics):
+    """Metric cells for a Workflow Steps row, in STEP_METRIC_COLUMNS order."""
+    values = []
+    for key, _ in STEP_METRIC_COLUMNS:
+        value = metrics.get(key)
+        values.append(round(value, 3) if isinstance(value, float) else (value if value is not None else ''))
+    return values
+
+
+def ensure_step_metric_headers(worksheet):
+    """
+    Make sure the Workflow Steps header carries the metric columns after the base columns.
+    Returns False (metrics then go to the trace only) when those columns hold something else.
+    """
+    try:
+        header = worksheet.row_values(1)
+        names = [name for _, name in STEP_METRIC_COLUMNS]
+        if header[WORKFLOW_STEPS_BASE_COLUMNS:WORKFLOW_STEPS_BASE_COLUMNS + len(names)] == names:
+            return True
+        if len(header) > WORKFLOW_STEPS_BASE_COLUMNS:
+            print(f"⚠️ Workflow Steps has extra columns {header[WORKFLOW_STEPS_BASE_COLUMNS:]}; step metrics go to {STEP_TRACE_PATH} only")
+            return False
+        needed_cols = WORKFLOW_STEPS_BASE_COLUMNS + len(names)
+        if worksheet.col_count < needed_cols:
+            worksheet.add_cols(needed_cols - worksheet.col_count)
+        header_range = f"{gspread.utils.rowcol_to_a1(1, WORKFLOW_STEPS_BASE_COLUMNS + 1)}:{gspread.utils.rowcol_to_a1(1, needed_cols)}"
+        queue_sheet_update(worksheet, header_range, [names])
+        print(f"✅ Added step metric columns to Workflow Steps ({header_range})")
+        return True
+    except Exception as e:
+        print(f"⚠️ Could not prepare Workflow Steps metric columns: {e}")
+        return False
+
+
+def write_step_trace(entry):
+    try:
+        STEP_TRACE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _step_metrics_lock:
+            with open(STEP_TRACE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+    except Exception as e:
+        print(f"⚠️ Could not write step trace: {e}")
+
+
+def run_instrumented_step(run_step, i, step, records, trace_fields=None, attach_to_sheet=True):
+    """
+    Run run_step(i, step) while collecting its metrics. On success the metrics are appended
+    to the step's last Workflow Steps row in records; every run (including failures) is
+    written to the JSONL trace.
+    """
+    metrics = {key: 0 for key, _ in STEP_METRIC_COLUMNS}
+    token = _current_step_metrics.set(metrics)
+    started_at = time.time()
+    status = "failed"
+    try:
+        run_step(i, step)
+        status = "ok"
+    finally:
+        _current_step_metrics.reset(token)
+        metrics["wall_s"] = time.time() - started_at
+        metrics["peak_rss_mb"] = current_peak_rss_mb()
+        if status == "ok" and attach_to_sheet and records:
+            row = list(records[-1][:WORKFLOW_STEPS_BASE_COLUMNS])
+            row += [''] * (WORKFLOW_STEPS_BASE_COLUMNS - len(row))
+            records[-1] = row + step_metric_values(metrics)
+        print(f"[METRICS] Step {i+1} ({step}) {status} in {metrics['wall_s']:.2f}s, network {metrics['network_s']:.2f}s, "
+              f"tokens {metrics['tokens_in']}/{metrics['tokens_out']}, TTS chars {metrics['tts_chars']}, retries {metrics['retries']}")
+        write_step_trace({
+            **(trace_fields or {}),
+            "step_index": i + 1,
+            "step": step,
+            "step_type": step_type_of(step),
+            "status": status,
+            "started_at": pd.Timestamp.fromtimestamp(started_at).isoformat(timespec="seconds"),
+            **{key: (round(value, 3) if isinstance(value, float) else value) for key, value in metrics.items()},
+        })
+    return metrics
+
+# -----------------------------------------
+# WORKFLOW STEP SCHEDULING
+# -----------------------------------------
+# Steps run as a dependency graph: a step waits only for the earlier steps it
+# references (R#/T# outputs, L# folders written by SL#, Posted Podcasts for PPL).
+# WORKFLOW_MAX_PARALLEL_STEPS=1 restores strict left-to-right execution.
+WORKFLOW_MAX_PARALLEL_STEPS = get_env_int("WORKFLOW_MAX_PARALLEL_STEPS", 3)
+MODEL_STEP_PATTERN = re.compile(r'(?:[PRC]\d*)(?:&(?:[PRC]\d*))*(?:SL\d+(?:T\d+)?)?')
+
+
+def _is_known_step(step):
+    if step in ('PPU', 'UM') or re.fullmatch(r'PPL\d+', step):
+        return True
+    if re.fullmatch(r'R\d+SL\d+(?:T\d+)?', step):
+        return True
+    if re.fullmatch(r'L\d+(?:E|GV)\d+SL\d+(?:T\d+)?', step) or re.fullmatch(r'L\d+(?:&L\d+)*SL\d+(?:T\d+)?', step):
+        return True
+    return bool(MODEL_STEP_PATTERN.fullmatch(re.sub(r'M\d+', '', step).replace(' ', '')))
+
+
+def build_step_dependencies(steps):
+    """
+    Return deps where deps[i] is the set of earlier step indices step i must wait for.
+    Steps the scheduler does not understand act as barriers so they keep their sequential meaning.
+    """
+    deps = []
+    last_barrier = None
+    writers_by_location = {}  # location id -> indices of earlier steps that save there (SL#)
+    readers_by_location = {}  # location id -> indices of earlier steps that read from there (L#)
+    posted_podcasts_writers = []
+    for i, step in enumerate(steps):
+        step_deps = set()
+        if last_barrier is not None:
+            step_deps.add(last_barrier)
+        if not _is_known_step(step):
+            step_deps.update(range(i))
+            last_barrier = i
+        if re.fullmatch(r'PPL\d+', step):
+            step_deps.update(posted_podcasts_writers)
+        # R# and T# read earlier step outputs (1-based)
+        for ref in re.findall(r'[RT](\d+)', step):
+            ref_idx = int(ref) - 1
+            if 0 <= ref_idx < i:
+                step_deps.add(ref_idx)
+        read_locations = re.findall(r'(?<![SP])L(\d+)', step)
+        write_locations = re.findall(r'SL(\d+)', step)
+        for location_id in read_locations:
+            # Read after write: wait for every earlier step saving to this folder
+            step_deps.update(writers_by_location.get(location_id, []))
+        for location_id in write_locations:
+            # Keep writes to one folder ordered, and after earlier reads of it
+            step_deps.update(writers_by_location.get(location_id, []))
+            step_deps.update(readers_by_location.get(location_id, []))
+        for location_id in read_locations:
+            readers_by_location.setdefault(location_id, []).append(i)
+        for location_id in write_locations:
+            writers_by_location.setdefault(location_id, []).append(i)
+        if step == 'PPU':
+            posted_podcasts_writers.append(i)
+        step_deps.discard(i)
+        deps.append(step_deps)
+    return deps
+
+
+def run_steps_as_dag(steps, run_step, dependencies, max_workers, completed=None, on_step_done=None):
+    """
+    Run run_step(i, step) for every step not already in completed, each as soon as its
+    dependencies finish, with at most max_workers steps in flight. Ready steps start in
+    workflow order. The first failure stops new steps from starting; running steps are
+    allowed to finish and the failure is then re-raised.
+    """
+    done = set(completed or ())
+    pending = [i for i in range(len(steps)) if i not in done]
+    max_workers = max(1, int(max_workers or 1))
+    if max_workers == 1:
+        for i in pending:
+            run_step(i, steps[i])
+            done.add(i)
+            if on_step_done:
+                on_step_done(i)
+        return
+
+    print(f"[DEBUG] Scheduling {len(pending)} step(s) with up to {max_workers} in parallel")
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow-step")
+    running = {}
+    failure = None
+    try:
+        while pending or running:
+            if failure is None:
+                for i in list(pending):
+                    if len(running) >= max_workers:
+                        break
+                    if dependencies[i] <= done:
+                        pending.remove(i)
+                        running[executor.submit(run_step, i, steps[i])] = i
+            if not running:
+                if failure is None and pending:
+                    raise RuntimeError(f"Workflow steps {[i + 1 for i in pending]} have unsatisfiable dependencies")
+                break
+            finished = next(as_completed(running))
+            i = running.pop(finished)
+            try:
+                finished.result()
+            except BaseException as e:
+                if failure is None:
+                    failure = e
+                continue
+            done.add(i)
+            if on_step_done:
+                on_step_done(i)
+    finally:
+        executor.shutdown(wait=True)
+    if failure is not None:
+        raise failure
+
 # -----------------------------------------
 # GOOGLE DRIVE OAUTH AUTHENTICATION (KEPT FOR REFERENCE - NOT USED WITH GCS)
 # -----------------------------------------
+_drive_local = threading.local()
+
 def get_drive_service_oauth():
-    """Authenticate as the user via OAuth and return a Drive service object."""
+    """Return a Drive service object for this thread, built once on the shared OAuth credentials.
+
+    httplib2 connections are not thread-safe, so each worker thread keeps its own
+    service; credentials are loaded once and refreshed only after they expire.
+    """
+    with _shared_clients_lock:
+        creds = get_shared_client('drive_credentials', load_drive_credentials_oauth)
+        if not creds.valid and creds.expired and creds.refresh_token:
+            print("🔄 Refreshing expired Drive OAuth token")
+            creds.refresh(Request())
+            with open('token.pickle', 'wb') as token:
+                pickle.dump(creds, token)
+    service = getattr(_drive_local, 'service', None)
+    if service is None:
+        service = build('drive', 'v3', credentials=creds)
+        _drive_local.service = service
+    return service
+
+def load_drive_credentials_oauth():
+    """Authenticate as the user via OAuth and return Drive credentials."""
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
     creds = None
     # The file token.pickle stores the user's access and refresh tokens
@@ -781,8 +1443,7 @@ def get_drive_service_oauth():
         # Save the credentials for the next run
         with open('token.pickle', 'wb') as token:
             pickle.dump(creds, token)
-    service = build('drive', 'v3', credentials=creds)
-    return service
+    return creds
 
 # -----------------------------------------
 # GOOGLE SHEET SUPPORT
@@ -848,11 +1509,488 @@ def try_load_google_sheet():
                 spreadsheet = create_and_setup_google_sheet(gc, GOOGLE_SHEET_NAME, GOOGLE_DRIVE_FOLDER_ID, SHARE_SHEET_WITH_EMAIL)
         except gspread.exceptions.SpreadsheetNotFound:
             spreadsheet = create_and_setup_google_sheet(gc, GOOGLE_SHEET_NAME, GOOGLE_DRIVE_FOLDER_ID, SHARE_SHEET_WITH_EMAIL)
-        return {ws.title: pd.DataFrame(ws.get_all_records()) for ws in spreadsheet.worksheets()}
+        return load_workbook_snapshot(spreadsheet)
     except Exception as e:
         print(f"❌ Google Sheets not accessible: {e}")
         return None
 
+def sheet_values_to_records(values):
+    """Convert a values range (header row first) into records, numericised like get_all_records."""
+    if not values or not values[0]:
+        return []
+    width = max(len(row) for row in values)
+    keys = list(values[0]) + [""] * (width - len(values[0]))
+    records = []
+    for row in values[1:]:
+        padded = list(row) + [""] * (width - len(row))
+        records.append(dict(zip(keys, gspread.utils.numericise_all(padded, False, ""))))
+    return records
+
+
+def batch_get_sheet_ranges(spreadsheet, ranges_by_tab):
+    """
+    Fetch ranges from several worksheets with a single values_batch_get request.
+    ranges_by_tab maps a tab title to a list of A1 ranges within that tab (None = whole tab).
+    Returns {tab title: [values for each requested range, in order]}.
+    """
+    request_ranges = []
+    owners = []
+    for title, tab_ranges in ranges_by_tab.items():
+        for range_name in tab_ranges:
+            request_ranges.append(gspread.utils.absolute_range_name(title, range_name) if range_name else gspread.utils.absolute_range_name(title))
+            owners.append(title)
+    if not request_ranges:
+        return {}
+    start_time = time.time()
+    response = spreadsheet.values_batch_get(request_ranges)
+    results = {title: [] for title in ranges_by_tab}
+    for title, value_range in zip(owners, response.get("valueRanges", [])):
+        results[title].append(value_range.get("values", []))
+    print(f"[DEBUG] Loaded {len(request_ranges)} range(s) from {len(ranges_by_tab)} tab(s) in one request ({time.time() - start_time:.2f}s)")
+    return results
+
+
+# -----------------------------------------
+# WORKBOOK SNAPSHOT
+# -----------------------------------------
+# The spreadsheet is read once into a snapshot that the main loop shares. Queuing a
+# write to a tab marks it stale; the next read of that tab flushes pending writes
+# and re-reads only that tab.
+# History tabs (Outputs, Workflow Steps, Logs) only grow, and the pipeline only needs
+# their header rows (IDs come from the ID counters), so only row 1 is downloaded.
+# Tabs not listed here (Requests, Posted Podcasts, Settings) are not read at startup.
+WORKBOOK_TAB_RANGES = {
+    "Workflows": [None],
+    "Prompts": [None],
+    "Models": [None],
+    "Locations": [None],
+    "Eleven": [None],
+    "Outputs": ["1:1"],
+    "Workflow Steps": ["1:1"],
+    "Logs": ["1:1"],
+}
+HISTORY_TABS = ("Outputs", "Workflow Steps", "Logs")
+# Columns used when a tab is missing (older sheets) or empty
+WORKBOOK_EMPTY_COLUMNS = {
+    "Locations": ["Location ID", "Location Description", "Type", "File Or Folder", "Location", "Latest"],
+    "Eleven": ["Eleven ID", "Voice", "Model", "Stability", "Similarity Boost", "Style", "Speed"],
+    "Logs": ["Log ID", "Log Timestamp", "Log Message"],
+}
+_workbook_lock = threading.RLock()
+_workbook_snapshot = None
+
+
+def _workbook_values_to_frame(title, values, worksheet):
+    if title in HISTORY_TABS:
+        header = values[0][0] if values[0] and values[0][0] else WORKBOOK_EMPTY_COLUMNS.get(title, [])
+        return pd.DataFrame(columns=header)
+    df = pd.DataFrame(sheet_values_to_records(values[0]))
+    if df.empty and title in WORKBOOK_EMPTY_COLUMNS:
+        df = pd.DataFrame(columns=WORKBOOK_EMPTY_COLUMNS[title])
+    return df
+
+
+def refresh_workbook_tabs(snapshot, titles):
+    """Re-read the given tabs into the snapshot with one values_batch_get."""
+    titles = [title for title in titles if title in snapshot['worksheets']]
+    values = batch_get_sheet_ranges(snapshot['spreadsheet'], {title: WORKBOOK_TAB_RANGES[title] for title in titles})
+    for title in titles:
+        snapshot['frames'][title] = _workbook_values_to_frame(title, values[title], snapshot['worksheets'][title])
+        snapshot['stale'].discard(title)
+
+
+def load_workbook_snapshot(spreadsheet):
+    """Load every tab in WORKBOOK_TAB_RANGES and make the result the shared workbook snapshot."""
+    global _workbook_snapshot
+    snapshot = {
+        'spreadsheet': spreadsheet,
+        # One metadata request for every worksheet handle instead of one per tab
+        'worksheets': {ws.title: ws for ws in spreadsheet.worksheets()},
+        'frames': {},
+        'stale': set(),
+    }
+    refresh_workbook_tabs(snapshot, list(WORKBOOK_TAB_RANGES))
+    with _workbook_lock:
+        _workbook_snapshot = snapshot
+    return snapshot
+
+
+def workbook_frame(title, snapshot=None):
+    """Return the snapshot DataFrame for a tab, re-reading it first if it was written to since it was loaded."""
+    snapshot = snapshot or _workbook_snapshot
+    with _workbook_lock:
+        if title not in snapshot['worksheets']:
+            return pd.DataFrame(columns=WORKBOOK_EMPTY_COLUMNS.get(title, []))
+        if title in snapshot['stale']:
+            flush_sheet_writes(f"refresh {title}")
+            refresh_workbook_tabs(snapshot, [title])
+        return snapshot['frames'][title]
+
+
+def invalidate_workbook_tab(title):
+    """Mark a tab stale in the shared snapshot after the pipeline writes to it."""
+    with _workbook_lock:
+        if _workbook_snapshot is not None and title in _workbook_snapshot['frames']:
+            _workbook_snapshot['stale'].add(title)
+
+
+# -----------------------------------------
+# BATCHED GOOGLE SHEETS WRITES
+# -----------------------------------------
+# Row appends and range updates are queued and sent as one append_rows call per
+# worksheet plus one values_batch_update per spreadsheet, so Sheets write quota
+# scales with the number of flushes instead of the number of rows written.
+SHEETS_FLUSH_INTERVAL_SECONDS = get_env_int("SHEETS_FLUSH_INTERVAL_SECONDS", 30)
+SHEETS_WRITE_RETRY_ATTEMPTS = 5
+SHEETS_WRITE_BACKOFF_SECONDS = 2
+_sheet_write_lock = threading.Lock()
+_sheet_flush_lock = threading.Lock()
+_pending_sheet_appends = {}  # worksheet id -> (worksheet, [rows])
+_pending_sheet_updates = {}  # spreadsheet id -> (spreadsheet, {absolute A1 range: values})
+_sheet_write_state = {"last_flush": time.time()}
+
+
+def is_sheets_retryable_error(error):
+    """Return True for Sheets quota (429) and transient server errors."""
+    code = getattr(error, "code", None)
+    if code in (429, 500, 502, 503, 504):
+        return True
+    error_text = str(error).lower()
+    return "429" in error_text or "rate_limit_exceeded" in error_text or "quota exceeded" in error_text
+
+
+def call_sheets_with_backoff(request_fn, label):
+    """Run a Sheets API call, retrying with exponential backoff on 429s and transient errors."""
+    for attempt in range(SHEETS_WRITE_RETRY_ATTEMPTS + 1):
+        try:
+            return request_fn()
+        except Exception as e:
+            if attempt >= SHEETS_WRITE_RETRY_ATTEMPTS or not is_sheets_retryable_error(e):
+                raise
+            wait_s = min(SHEETS_WRITE_BACKOFF_SECONDS * (2 ** attempt), 64)
+            print(f"⚠️ Sheets write throttled ({label}): {e}. Retrying in {wait_s}s ({attempt+1}/{SHEETS_WRITE_RETRY_ATTEMPTS})...")
+            time.sleep(wait_s)
+
+
+def queue_sheet_append(worksheet, row):
+    """Queue a row to be appended to worksheet on the next flush."""
+    with _sheet_write_lock:
+        _pending_sheet_appends.setdefault(worksheet.id, (worksheet, []))[1].append(list(row))
+    invalidate_workbook_tab(worksheet.title)
+
+
+def queue_sheet_update(worksheet, range_name, values):
+    """Queue a range update; a later update to the same range replaces the earlier one."""
+    range_key = gspread.utils.absolute_range_name(worksheet.title, range_name)
+    spreadsheet = worksheet.spreadsheet
+    with _sheet_write_lock:
+        pending = _pending_sheet_updates.setdefault(spreadsheet.id, (spreadsheet, {}))[1]
+        pending.pop(range_key, None)
+        pending[range_key] = values
+    invalidate_workbook_tab(worksheet.title)
+
+
+def _sheet_cell_value(value):
+    """Cell value as written to Sheets: blanks for None/NaN, plain Python scalars otherwise."""
+    if value is None:
+        return ''
+    try:
+        if pd.isna(value):
+            return ''
+    except (TypeError, ValueError):
+        pass
+    return value.item() if hasattr(value, 'item') else value
+
+
+def diff_sheet_grid(current_rows, desired_rows, start_row=1, start_col=1):
+    """
+    Compare two grids cell by cell and return [(A1 range, values)] covering only the changed cells.
+    Changed cells in a row form runs; runs over the same columns on consecutive rows merge into
+    one block. Cells that exist only in current_rows are cleared. start_row/start_col give the
+    sheet position of grid cell [0][0].
+    """
+    def cell(row, col):
+        return str(_sheet_cell_value(row[col])) if col < len(row) else ''
+
+    blocks = []
+    open_blocks = {}  # (first col, last col) -> block still growing downwards
+    for r in range(max(len(current_rows), len(desired_rows))):
+        current = list(current_rows[r]) if r < len(current_rows) else []
+        desired = list(desired_rows[r]) if r < len(desired_rows) else []
+        width = max(len(current), len(desired))
+        col = 0
+        while col < width:
+            if cell(current, col) == cell(desired, col):
+                col += 1
+                continue
+            first = col
+            while col < width and cell(current, col) != cell(desired, col):
+                col += 1
+            values = [_sheet_cell_value(desired[k]) if k < len(desired) else '' for k in range(first, col)]
+            block = open_blocks.get((first, col - 1))
+            if block and block["last_row"] == r - 1:
+                block["values"].append(values)
+                block["last_row"] = r
+            else:
+                block = {"first_row": r, "last_row": r, "first_col": first, "last_col": col - 1, "values": [values]}
+                open_blocks[(first, col - 1)] = block
+                blocks.append(block)
+    return [
+        (
+            f"{gspread.utils.rowcol_to_a1(block['first_row'] + start_row, block['first_col'] + start_col)}:"
+            f"{gspread.utils.rowcol_to_a1(block['last_row'] + start_row, block['last_col'] + start_col)}",
+            block["values"],
+        )
+        for block in blocks
+    ]
+
+
+def queue_sheet_diff(worksheet, current_rows, desired_rows, start_row=1, start_col=1):
+    """
+    Queue updates for only the cells where desired_rows differs from current_rows (the loaded
+    snapshot). They go out with the next flush in a single values_batch_update.
+    Returns the number of ranges queued; 0 means the sheet already matches.
+    """
+    ranges = diff_sheet_grid(current_rows, desired_rows, start_row, start_col)
+    for range_name, values in ranges:
+        queue_sheet_update(worksheet, range_name, values)
+    return len(ranges)
+
+
+def requeue_sheet_writes(appends=(), updates=()):
+    """Put writes that failed to send back on the queues, ahead of anything queued since."""
+    with _sheet_write_lock:
+        for worksheet, rows in appends:
+            pending = _pending_sheet_appends.setdefault(worksheet.id, (worksheet, []))[1]
+            pending[:0] = rows
+        for spreadsheet, data in updates:
+            pending = _pending_sheet_updates.setdefault(spreadsheet.id, (spreadsheet, {}))[1]
+            # A range queued again since the failed flush already holds newer values
+            merged = {range_key: values for range_key, values in data.items() if range_key not in pending}
+            merged.update(pending)
+            pending.clear()
+            pending.update(merged)
+
+
+def flush_sheet_writes(reason=None):
+    """Send every queued append and update now. Returns the number of API calls made.
+
+    Writes that fail stay queued for the next flush and a RuntimeError is raised once
+    everything else has been sent.
+    """
+    with _sheet_flush_lock:
+        with _sheet_write_lock:
+            appends = list(_pending_sheet_appends.values())
+            updates = list(_pending_sheet_updates.values())
+            _pending_sheet_appends.clear()
+            _pending_sheet_updates.clear()
+            _sheet_write_state["last_flush"] = time.time()
+        if not appends and not updates:
+            return 0
+
+        api_calls = 0
+        failed_appends = []
+        failed_updates = []
+        errors = []
+        # Appends go first so queued updates can target rows they create
+        for worksheet, rows in appends:
+            try:
+                call_sheets_with_backoff(
+                    lambda: worksheet.append_rows(rows, value_input_option='RAW'),
+                    f"append {len(rows)} row(s) to {worksheet.title}",
+                )
+                api_calls += 1
+            except Exception as e:
+                print(f"❌ Failed to append {len(rows)} row(s) to {worksheet.title}: {e}")
+                failed_appends.append((worksheet, rows))
+                errors.append(e)
+        for spreadsheet, data in updates:
+            body = {
+                "valueInputOption": "RAW",
+                "data": [{"range": range_key, "values": values} for range_key, values in data.items()],
+            }
+            try:
+                call_sheets_with_backoff(
+                    lambda: spreadsheet.values_batch_update(body),
+                    f"update {len(data)} range(s)",
+                )
+                api_calls += 1
+            except Exception as e:
+                print(f"❌ Failed to update {len(data)} range(s): {e}")
+                failed_updates.append((spreadsheet, data))
+                errors.append(e)
+
+        row_count = sum(len(rows) for _, rows in appends) - sum(len(rows) for _, rows in failed_appends)
+        range_count = sum(len(data) for _, data in updates) - sum(len(data) for _, data in failed_updates)
+        reason_text = f" ({reason})" if reason else ""
+        print(f"[SHEETS] Flushed {row_count} appended row(s) and {range_count} range update(s) in {api_calls} call(s){reason_text}")
+        if errors:
+            requeue_sheet_writes(failed_appends, failed_updates)
+            raise RuntimeError(
+                f"Google Sheets flush failed for {len(failed_appends)} append batch(es) and "
+                f"{len(failed_updates)} update batch(es); unsent writes were kept queued: {errors[0]}"
+            ) from errors[0]
+        return api_calls
+
+
+def flush_sheet_writes_if_due(reason="step boundary"):
+    """Flush queued writes once SHEETS_FLUSH_INTERVAL_SECONDS has passed since the last flush.
+
+    A failed periodic flush does not stop the workflow; the writes stay queued and the
+    closing flush_sheet_writes call retries them and raises if they still fail.
+    """
+    if time.time() - _sheet_write_state["last_flush"] >= SHEETS_FLUSH_INTERVAL_SECONDS:
+        try:
+            return flush_sheet_writes(reason)
+        except RuntimeError as e:
+            print(f"⚠️ {e}")
+    return 0
+
+
+def flush_sheet_writes_at_exit():
+    """Last-chance flush on interpreter exit; reports writes that still could not be sent."""
+    try:
+        flush_sheet_writes("exit")
+    except Exception as e:
+        print(f"❌ Queued Google Sheets writes were not saved before exit: {e}")
+
+
+# Never lose queued rows when the script exits early (sys.exit on a failed step)
+atexit.register(flush_sheet_writes_at_exit)
+
+# -----------------------------------------
+# ID ALLOCATION
+# -----------------------------------------
+# Output, Workflow Steps and Log IDs come from counters stored as spreadsheet developer
+# metadata (the value is the last ID handed out), so no history tab is read to mint an ID.
+# A reservation is a compare-and-swap: the update only matches the counter while it still
+# holds the value this process last saw, so runs triggered together never share IDs.
+# The last seen value is cached, making a reservation a single batch_update unless
+# another run reserved IDs in between.
+ID_COUNTER_KEYS = {
+    "Outputs": "last_output_id",
+    "Workflow Steps": "last_workflow_steps_id",
+    "Logs": "last_log_id",
+}
+ID_RESERVE_MAX_ATTEMPTS = 8
+# Log IDs are reserved this many at a time and handed out locally; unused ones are skipped
+LOG_ID_BLOCK_SIZE = 20
+_id_counter_lock = threading.Lock()
+_id_counter_cache = {}  # (spreadsheet id, metadata key) -> {"metadata_id", "value"}
+_id_block_lock = threading.Lock()
+_id_blocks = {}  # (spreadsheet id, tab title) -> [next ID, end of block (exclusive)]
+
+
+def read_id_counters(spreadsheet):
+    """Return {metadata key: {'metadata_id', 'value'}} for the ID counters on the spreadsheet."""
+    with network_timer():
+        metadata = spreadsheet.fetch_sheet_metadata(params={"fields": "developerMetadata"})
+    counters = {}
+    for entry in metadata.get("developerMetadata", []):
+        key = entry.get("metadataKey")
+        if key not in ID_COUNTER_KEYS.values():
+            continue
+        # Two runs seeding at once can both create the key; every run settles on the oldest
+        if key in counters and counters[key]["metadata_id"] < entry["metadataId"]:
+            continue
+        counters[key] = {"metadata_id": entry["metadataId"], "value": int(entry.get("metadataValue") or 0)}
+    return counters
+
+
+def max_history_id(worksheet):
+    """Highest whole ID in column A of a history tab (0 when empty); only used to seed a counter."""
+    with network_timer():
+        values = worksheet.col_values(1)[1:]
+    ids = []
+    for value in values:
+        try:
+            ids.append(int(float(value)))
+        except (TypeError, ValueError):
+            continue
+    return max(ids, default=0)
+
+
+def create_id_counter(spreadsheet, key, value):
+    body = {"requests": [{"createDeveloperMetadata": {"developerMetadata": {
+        "metadataKey": key,
+        "metadataValue": str(value),
+        "location": {"spreadsheet": True},
+        "visibility": "DOCUMENT",
+    }}}]}
+    with network_timer():
+        call_sheets_with_backoff(lambda: spreadsheet.batch_update(body), f"create {key}")
+
+
+def compare_and_swap_id_counter(spreadsheet, counter, new_value):
+    """Set the counter to new_value if it still holds counter['value']. Returns True on success."""
+    body = {"requests": [{"updateDeveloperMetadata": {
+        "dataFilters": [{"developerMetadataLookup": {
+            "metadataId": counter["metadata_id"],
+            "metadataValue": str(counter["value"]),
+        }}],
+        "developerMetadata": {"metadataValue": str(new_value)},
+        "fields": "metadataValue",
+    }}]}
+    try:
+        with network_timer():
+            response = call_sheets_with_backoff(lambda: spreadsheet.batch_update(body), "reserve IDs")
+    except gspread.exceptions.APIError as e:
+        # No entry matched the filter: the value moved on
+        if getattr(e, "code", None) == 400:
+            return False
+        raise
+    reply = (response.get("replies") or [{}])[0].get("updateDeveloperMetadata", {})
+    return bool(reply.get("developerMetadata"))
+
+
+def reserve_ids(worksheet, count=1):
+    """Reserve `count` consecutive IDs for a history tab and return the first one."""
+    key = ID_COUNTER_KEYS[worksheet.title]
+    spreadsheet = worksheet.spreadsheet
+    cache_key = (spreadsheet.id, key)
+    with _id_counter_lock:
+        for attempt in range(ID_RESERVE_MAX_ATTEMPTS):
+            counter = _id_counter_cache.get(cache_key)
+            if counter is None:
+                counter = read_id_counters(spreadsheet).get(key)
+                if counter is None:
+                    seed = max_history_id(worksheet)
+                    create_id_counter(spreadsheet, key, seed)
+                    print(f"[IDS] Seeded {key} at {seed} from the {worksheet.title} tab")
+                    continue  # re-read, in case another run seeded it at the same time
+                _id_counter_cache[cache_key] = counter
+            if compare_and_swap_id_counter(spreadsheet, counter, counter["value"] + count):
+                _id_counter_cache[cache_key] = {**counter, "value": counter["value"] + count}
+                return counter["value"] + 1
+            print(f"[IDS] {key} was advanced by another run; re-reading ({attempt+1}/{ID_RESERVE_MAX_ATTEMPTS})")
+            _id_counter_cache.pop(cache_key, None)
+    raise RuntimeError(f"Could not reserve {count} ID(s) for {worksheet.title} after {ID_RESERVE_MAX_ATTEMPTS} attempts")
+
+
+def next_block_id(worksheet, block_size):
+    """Return the next ID from a block held by this process, reserving a new block when it runs out."""
+    block_key = (worksheet.spreadsheet.id, worksheet.title)
+    with _id_block_lock:
+        block = _id_blocks.get(block_key)
+        if block is None or block[0] >= block[1]:
+            first_id = reserve_ids(worksheet, block_size)
+            block = _id_blocks[block_key] = [first_id, first_id + block_size]
+        block[0] += 1
+        return block[0] - 1
+
+
+def append_sheet_row(worksheet, row):
+    """Append one row now (not queued) and return the sheet row number it was written to."""
+    response = call_sheets_with_backoff(
+        lambda: worksheet.append_rows([list(row)], value_input_option='RAW'),
+        f"append row to {worksheet.title}",
+    )
+    invalidate_workbook_tab(worksheet.title)
+    # e.g. "'Outputs'!A57:Z57"
+    first_cell = response["updates"]["updatedRange"].split("!")[-1].split(":")[0]
+    return gspread.utils.a1_to_rowcol(first_cell)[0]
+
+
 # -----------------------------------------
 # EXCEL FALLBACK STRUCTURE
 # -----------------------------------------
@@ -1309,7 +2447,7 @@ MATERIAL TO USE (facts come from below or verified optional script-stage search)
 def fetch_openai_models():
     """Fetch the latest models from OpenAI API."""
     try:
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), timeout=OPENAI_DEFAULT_TIMEOUT_SECONDS, max_retries=0)
+        client = get_openai_client()
         models_response = client.models.list()
         
         # Filter for text-based chat models (excluding vision, audio, embedding models)
@@ -1410,14 +2548,12 @@ def openai_chat_uses_max_completion_tokens(model_id):
 def fetch_anthropic_models():
     """Fetch the latest models from Anthropic API, with a Models-tab-aligned fallback."""
     try:
-        import anthropic
-        
         api_key = os.getenv('ANTHROPIC_API_KEY')
         if not api_key:
             print("⚠️ ANTHROPIC_API_KEY not set, skipping Anthropic models")
             return []
         
-        client = anthropic.Anthropic(api_key=api_key)
+        client = get_anthropic_client()
         
         # Try to fetch models from Anthropic API (available in newer SDK)
         try:
@@ -1457,53 +2593,163 @@ def fetch_anthropic_models():
         return []
 
 
-def fetch_google_models():
-    """Fetch the latest models from Google Gemini API."""
+def fetch_google_models():
+    """Fetch the latest models from Google Gemini API."""
+    try:
+        get_gemini_module()
+        
+        text_models = []
+        for model_id in GOOGLE_FALLBACK_MODELS:
+            # Google models don't support web search in the same way as OpenAI
+            text_models.append({
+                'id': model_id,
+                'provider': 'google',
+                'web_search': False
+            })
+        
+        return text_models
+    except Exception as e:
+        print(f"❌ Error fetching Google models: {e}")
+        return []
+
+
+# -----------------------------------------
+# MODEL CATALOG CACHE
+# -----------------------------------------
+# The merged provider catalog is kept in the persistent asset cache directory (and
+# optionally a GCS blob) for MODEL_CATALOG_CACHE_TTL_SECONDS. The cache also remembers
+# which catalog hash was last written to the Models tab, so UM can skip the rewrite.
+MODEL_CATALOG_CACHE_TTL_SECONDS = get_env_int("MODEL_CATALOG_CACHE_TTL_SECONDS", 24 * 60 * 60)
+# Optional shared copy, e.g. MODEL_CATALOG_CACHE_GCS_BLOB=cache/model_catalog.json
+MODEL_CATALOG_CACHE_GCS_BLOB = os.getenv("MODEL_CATALOG_CACHE_GCS_BLOB", "").strip().strip("/")
+MODELS_TAB_HEADERS = ['Model ID', 'Model Name', 'Model Default', 'Web Search', 'Deprecated']
+
+
+def model_catalog_cache_path():
+    return ASSET_CACHE_DIR / "model_catalog.json"
+
+
+def model_catalog_hash(models):
+    payload = json.dumps(models, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def model_rows_hash(rows):
+    """Hash of Models tab rows (dicts keyed by header, or lists in header order), as the sheet shows them."""
+    normalized = []
+    for row in rows:
+        values = [row.get(col, '') for col in MODELS_TAB_HEADERS] if isinstance(row, dict) else list(row)
+        normalized.append([str(value).strip() for value in values])
+    return model_catalog_hash(normalized)
+
+
+def read_json_cache_candidates(cache_path, gcs_blob_name, label):
+    """Return the dicts stored in the local cache file and the optional GCS blob (either may be missing)."""
+    candidates = []
+    try:
+        if cache_path.is_file():
+            candidates.append(json.loads(cache_path.read_text(encoding="utf-8")))
+    except Exception as e:
+        print(f"⚠️ Could not read {label}: {e}")
+    if gcs_blob_name:
+        try:
+            gcs_client = get_gcs_client()
+            if gcs_client:
+                blob = gcs_client.bucket(GCS_BUCKET_NAME).get_blob(gcs_blob_name)
+                if blob is not None:
+                    candidates.append(json.loads(blob.download_as_text(encoding="utf-8")))
+        except Exception as e:
+            print(f"⚠️ Could not read {label} from GCS: {e}")
+    return [c for c in candidates if isinstance(c, dict)]
+
+
+def write_json_cache(cache_path, gcs_blob_name, payload, label):
+    """Atomically write payload to the local cache file and, if configured, the GCS blob."""
     try:
-        import google.generativeai as genai
-        
-        genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-        
-        text_models = []
-        for model_id in GOOGLE_FALLBACK_MODELS:
-            # Google models don't support web search in the same way as OpenAI
-            text_models.append({
-                'id': model_id,
-                'provider': 'google',
-                'web_search': False
-            })
-        
-        return text_models
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        partial_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(partial_path, cache_path)
+        if gcs_blob_name:
+            gcs_client = get_gcs_client()
+            if gcs_client:
+                blob = gcs_client.bucket(GCS_BUCKET_NAME).blob(gcs_blob_name)
+                blob.upload_from_string(json.dumps(payload), content_type="application/json")
     except Exception as e:
-        print(f"❌ Error fetching Google models: {e}")
-        return []
+        print(f"⚠️ Could not save {label}: {e}")
+
+
+def load_model_catalog_cache():
+    """Return the newest cached catalog from the local file or the GCS blob, or {}."""
+    candidates = read_json_cache_candidates(model_catalog_cache_path(), MODEL_CATALOG_CACHE_GCS_BLOB, "model catalog cache")
+    candidates = [c for c in candidates if isinstance(c.get("models"), list)]
+    return max(candidates, key=lambda c: c.get("fetched_at", 0)) if candidates else {}
+
+
+def save_model_catalog_cache(cache):
+    write_json_cache(model_catalog_cache_path(), MODEL_CATALOG_CACHE_GCS_BLOB, cache, "model catalog cache")
+
+
+def fetch_model_catalog(force_refresh=False):
+    """
+    Return {'models', 'hash', 'fetched_at', 'applied', 'source'} for the merged provider catalog.
+    A cached catalog younger than MODEL_CATALOG_CACHE_TTL_SECONDS is reused; otherwise the three
+    providers are queried concurrently and the result is cached when every provider answered.
+    """
+    cached = load_model_catalog_cache()
+    age = time.time() - cached.get("fetched_at", 0) if cached else None
+    if cached and not force_refresh and age < MODEL_CATALOG_CACHE_TTL_SECONDS:
+        print(f"[CACHE] Using model catalog cached {age / 3600:.1f}h ago ({len(cached['models'])} models)")
+        return {**cached, "source": "cache"}
+
+    start_time = time.time()
+    fetchers = [fetch_openai_models, fetch_anthropic_models, fetch_google_models]
+    with ThreadPoolExecutor(max_workers=len(fetchers), thread_name_prefix="model-catalog") as executor:
+        futures = [submit_in_context(executor, fetcher) for fetcher in fetchers]
+        openai_models, anthropic_models, google_models = [future.result() for future in futures]
+    all_models = openai_models + anthropic_models + google_models
+    print(f"[DEBUG] Fetched {len(all_models)} models from providers in {time.time() - start_time:.2f}s")
+
+    catalog = {
+        "models": all_models,
+        "hash": model_catalog_hash(all_models),
+        "fetched_at": time.time(),
+        "applied": cached.get("applied") if cached else None,
+    }
+    # A provider that failed returns []; don't pin a partial catalog for a whole TTL
+    if openai_models and google_models and (anthropic_models or not os.getenv('ANTHROPIC_API_KEY')):
+        save_model_catalog_cache(catalog)
+    else:
+        print("⚠️ A provider returned no models; model catalog not cached")
+    return {**catalog, "source": "providers"}
+
+
+def record_applied_model_catalog(catalog, rows):
+    """Remember the catalog hash and resulting Models tab rows the sheet was last written with."""
+    cached = load_model_catalog_cache()
+    if cached.get("hash") != catalog["hash"]:
+        return
+    cached["applied"] = {"catalog_hash": catalog["hash"], "rows_hash": model_rows_hash(rows)}
+    save_model_catalog_cache(cached)
 
 
 def fetch_all_models():
-    """Fetch models from all supported providers."""
-    all_models = []
-    
-    # Fetch OpenAI models
-    openai_models = fetch_openai_models()
-    all_models.extend(openai_models)
-    
-    # Fetch Anthropic models
-    anthropic_models = fetch_anthropic_models()
-    all_models.extend(anthropic_models)
-    
-    # Fetch Google models
-    google_models = fetch_google_models()
-    all_models.extend(google_models)
-    
-    return all_models
+    """Fetch models from all supported providers (concurrently, or from the catalog cache)."""
+    return fetch_model_catalog()["models"]
 
 
 def update_models_tab(spreadsheet, models_df):
     """Update the Models tab by preserving existing rows, marking non-real models as Deprecated='Y',
     and ensuring for each real model there is one baseline row (Web Search='N') and, if supported, a second row (Web Search='Y')."""
     try:
+        # The tab as loaded, in sheet order, for the cell diff below
+        current_grid = None
+        if models_df is not None and list(models_df.columns) == MODELS_TAB_HEADERS:
+            current_grid = [MODELS_TAB_HEADERS] + models_df.values.tolist()
+        
         # Fetch latest functional models from all providers
-        latest_models = fetch_all_models()
+        catalog = fetch_model_catalog()
+        latest_models = catalog["models"]
         latest_model_names = {model['id'] for model in latest_models}
         latest_model_name_to_search = {model['id']: bool(model.get('web_search', False)) for model in latest_models}
         
@@ -1527,6 +2773,13 @@ def update_models_tab(spreadsheet, models_df):
             models_df = models_df.sort_values(by='Model ID', kind='stable')
             existing_rows = models_df.to_dict(orient='records')
 
+        # Same catalog as the last write and nobody edited the tab since: nothing to do
+        applied = catalog.get("applied") or {}
+        if applied.get("catalog_hash") == catalog["hash"] and applied.get("rows_hash") == model_rows_hash(existing_rows):
+            log_msg = f"Models tab already up to date (model catalog unchanged, {len(existing_rows)} models)."
+            print(f"    > {log_msg}")
+            return log_msg
+
         # Update Deprecated for existing rows; preserve everything else
         for row in existing_rows:
             model_id = row.get('Model ID')
@@ -1593,15 +2846,24 @@ def update_models_tab(spreadsheet, models_df):
 
         # Write back to the sheet
         if updated_models:
-            headers = ['Model ID', 'Model Name', 'Model Default', 'Web Search', 'Deprecated']
+            headers = MODELS_TAB_HEADERS
             models_ws = spreadsheet.worksheet('Models')
-            models_ws.clear()
-            models_ws.update('A1:E1', [headers])
-            models_ws.update(f'A2:E{len(updated_models)+1}', updated_models)
+            if current_grid is not None:
+                # Only changed cells are sent, batched with the other queued sheet writes
+                changed_ranges = queue_sheet_diff(models_ws, current_grid, [headers] + updated_models)
+                write_note = f"{changed_ranges} changed range(s)"
+            else:
+                # Unexpected column layout: rewrite the tab in the standard layout
+                models_ws.clear()
+                models_ws.update('A1:E1', [headers])
+                models_ws.update(f'A2:E{len(updated_models)+1}', updated_models)
+                invalidate_workbook_tab('Models')
+                write_note = "full rewrite"
+            record_applied_model_catalog(catalog, updated_models)
             
             log_msg = (
                 f"Updated Models tab with {len(updated_models)} models "
-                f"({new_models_added} new models added, {deprecated_updated} deprecated status updated)."
+                f"({new_models_added} new models added, {deprecated_updated} deprecated status updated; {write_note})."
             )
             print(f"    > {log_msg}")
             return log_msg
@@ -1615,6 +2877,198 @@ def update_models_tab(spreadsheet, models_df):
         print(f"    > {log_msg}")
         return log_msg
 
+# -----------------------------------------
+# POSTED PODCASTS RSS SYNC
+# -----------------------------------------
+# PPU revalidates the feed with ETag/If-Modified-Since and parses it while it streams in,
+# stopping at the first episode already on the Posted Podcasts tab (the feed lists newest
+# first). Only the new episodes are appended. The validators, known GUIDs and row count
+# live in the persistent asset cache directory (optionally mirrored to GCS); without them,
+# or when the tab no longer matches, PPU rebuilds the whole tab as before.
+POSTED_PODCASTS_RSS_URL = os.getenv("POSTED_PODCASTS_RSS_URL", "https://anchor.fm/s/101530384/podcast/rss")
+# Optional shared copy, e.g. POSTED_PODCASTS_STATE_GCS_BLOB=cache/posted_podcasts_rss.json
+POSTED_PODCASTS_STATE_GCS_BLOB = os.getenv("POSTED_PODCASTS_STATE_GCS_BLOB", "").strip().strip("/")
+RSS_FETCH_TIMEOUT_SECONDS = get_env_int("RSS_FETCH_TIMEOUT_SECONDS", 60)
+RSS_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def posted_podcasts_state_path():
+    return ASSET_CACHE_DIR / "posted_podcasts_rss.json"
+
+
+def load_posted_podcasts_state():
+    """Return the newest saved RSS sync state from the local file or the GCS blob, or {}."""
+    candidates = read_json_cache_candidates(posted_podcasts_state_path(), POSTED_PODCASTS_STATE_GCS_BLOB, "RSS sync state")
+    candidates = [c for c in candidates if isinstance(c.get("guids"), list)]
+    return max(candidates, key=lambda c: c.get("synced_at", 0)) if candidates else {}
+
+
+def save_posted_podcasts_state(state):
+    write_json_cache(posted_podcasts_state_path(), POSTED_PODCASTS_STATE_GCS_BLOB, state, "RSS sync state")
+
+
+def parse_rss_episode(item):
+    """Return {'guid', 'title', 'description', 'description_short'} for an RSS <item> element."""
+    title = html.unescape(item.findtext('title', default=''))
+    description = html.unescape(item.findtext('description', default=''))
+    # Remove HTML tags from description
+    description_clean = re.sub(r'<.*?>', '', description)
+    guid = (item.findtext('guid') or item.findtext('link') or title).strip()
+    return {
+        "guid": guid,
+        "title": title,
+        "description": description_clean,
+        # Description Short: up to 'Help support'
+        "description_short": description_clean.split('Help support')[0].strip(),
+    }
+
+
+def fetch_new_rss_episodes(url, known_guids=(), etag=None, last_modified=None):
+    """
+    Conditionally GET the feed and stream-parse its items until one whose GUID is known.
+    Returns {'not_modified', 'episodes' (newest first), 'reached_known', 'etag',
+    'last_modified', 'bytes_in'}. Nothing after the first known item is downloaded.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    known = set(known_guids)
+    result = {"not_modified": False, "episodes": [], "reached_known": False,
+              "etag": etag, "last_modified": last_modified, "bytes_in": 0}
+    with network_timer():
+        response = get_http_session().get(url, headers=headers, stream=True, timeout=RSS_FETCH_TIMEOUT_SECONDS)
+        try:
+            if response.status_code == 304:
+                result["not_modified"] = True
+                return result
+            response.raise_for_status()
+            result["etag"] = response.headers.get("ETag")
+            result["last_modified"] = response.headers.get("Last-Modified")
+            parser = ET.XMLPullParser(events=("end",))
+            for chunk in response.iter_content(chunk_size=RSS_STREAM_CHUNK_BYTES):
+                result["bytes_in"] += len(chunk)
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if element.tag != 'item':
+                        continue
+                    episode = parse_rss_episode(element)
+                    element.clear()
+                    if episode["guid"] in known:
+                        result["reached_known"] = True
+                        break
+                    result["episodes"].append(episode)
+                if result["reached_known"]:
+                    break
+            else:
+                parser.close()
+        finally:
+            response.close()
+    return result
+
+
+def posted_podcast_rows(episodes, first_id):
+    """Posted Podcasts rows (ID, Title, Description, Description Short) for oldest-first episodes."""
+    return [
+        [first_id + n, episode["title"], episode["description"], episode["description_short"]]
+        for n, episode in enumerate(episodes)
+    ]
+
+
+def sync_posted_podcasts(spreadsheet, full_refresh=False):
+    """Bring the Posted Podcasts tab up to date with the RSS feed. Returns the step log message."""
+    state = {} if full_refresh else load_posted_podcasts_state()
+    incremental = bool(state.get("guids")) and state.get("url") == POSTED_PODCASTS_RSS_URL
+    if incremental:
+        result = fetch_new_rss_episodes(POSTED_PODCASTS_RSS_URL, state["guids"], state.get("etag"), state.get("last_modified"))
+    else:
+        result = fetch_new_rss_episodes(POSTED_PODCASTS_RSS_URL)
+    record_step_metric("bytes_in", result["bytes_in"])
+    if result["not_modified"]:
+        log_msg = f"Posted Podcasts tab already up to date (feed not modified, {state.get('rows', 0)} episodes)."
+        print(f"    > {log_msg}")
+        return log_msg
+
+    posted_ws = spreadsheet.worksheet('Posted Podcasts')
+    known_rows = state.get("rows", 0)
+    new_episodes = result["episodes"][::-1]  # oldest first
+    if incremental and result["reached_known"] and posted_ws.row_count == known_rows + 1:
+        if new_episodes:
+            rows = posted_podcast_rows(new_episodes, known_rows + 1)
+            call_sheets_with_backoff(
+                lambda: posted_ws.append_rows(rows, value_input_option='RAW', insert_data_option='INSERT_ROWS'),
+                f"append {len(rows)} row(s) to Posted Podcasts",
+            )
+            invalidate_workbook_tab('Posted Podcasts')
+        guids = state["guids"] + [episode["guid"] for episode in new_episodes]
+        log_msg = f"Appended {len(new_episodes)} new episode(s) to Posted Podcasts tab ({known_rows + len(new_episodes)} episodes)."
+    else:
+        if incremental:
+            print("[DEBUG] Posted Podcasts tab does not match the saved RSS state; rebuilding it")
+            if result["reached_known"]:
+                # Only the newest items were read; fetch the whole feed
+                result = fetch_new_rss_episodes(POSTED_PODCASTS_RSS_URL)
+                record_step_metric("bytes_in", result["bytes_in"])
+                new_episodes = result["episodes"][::-1]
+        rows = posted_podcast_rows(new_episodes, 1)
+        posted_ws.resize(rows=len(rows) + 1, cols=4)
+        if rows:
+            posted_ws.update(values=rows, range_name='A2')
+        invalidate_workbook_tab('Posted Podcasts')
+        guids = [episode["guid"] for episode in new_episodes]
+        known_rows = 0
+        log_msg = f"Updated Posted Podcasts tab with {len(rows)} episodes."
+
+    save_posted_podcasts_state({
+        "url": POSTED_PODCASTS_RSS_URL,
+        "etag": result["etag"],
+        "last_modified": result["last_modified"],
+        "guids": guids,
+        "rows": known_rows + len(new_episodes),
+        "synced_at": time.time(),
+    })
+    print(f"    > {log_msg}")
+    return log_msg
+
+
+def read_last_posted_podcasts(spreadsheet, count):
+    """
+    Return the newest `count` Posted Podcasts records (dicts keyed by header), newest first.
+    Only the header and the last `count` rows are requested, in one batch_get; if the tail
+    holds blank rows the whole tab is read instead.
+    The grid size is the tail: the PPU sync keeps it at one row per episode, and the saved
+    sync state can be stale when rows are added by hand or by another run.
+    """
+    posted_ws = spreadsheet.worksheet('Posted Podcasts')
+    last_row = posted_ws.row_count
+    if count <= 0 or last_row < 2:
+        return []
+    first_row = max(2, last_row - count + 1)
+    last_col = gspread.utils.rowcol_to_a1(1, posted_ws.col_count).rstrip('1')
+    with network_timer():
+        header_range, tail_range = posted_ws.batch_get([f"A1:{last_col}1", f"A{first_row}:{last_col}{last_row}"])
+    headers = header_range[0] if header_range else []
+    records = [dict(zip(headers, row + [''] * (len(headers) - len(row)))) for row in tail_range if any(row)]
+    if len(records) < min(count, last_row - 1):
+        print(f"[DEBUG] Posted Podcasts tail A{first_row}:{last_col}{last_row} has blank rows; reading the whole tab")
+        with network_timer():
+            records = posted_ws.get_all_records()
+    try:
+        records = sorted(records, key=lambda r: int(r.get('Posted Podcasts ID')), reverse=True)
+    except Exception:
+        records = records[::-1]
+    return records[:count]
+
+
+def format_posted_podcasts(records):
+    """PPL# output: Title and Description Short for each episode."""
+    return '\n\n'.join(
+        f"Title: {record.get('Title', '')}\nDescription Short: {record.get('Description Short', '')}"
+        for record in records
+    )
+
+
 def generate_excel_template(file_path):
     template_dfs = get_template_dataframes()
     with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
@@ -1626,15 +3080,76 @@ def generate_excel_template(file_path):
 # DATA LOADING FROM FILE OR GOOGLE
 # -----------------------------------------
 def load_workbook():
-    data = try_load_google_sheet()
-    if data:
-        return data
+    snapshot = try_load_google_sheet()
+    if snapshot:
+        return snapshot
     print("❌ Google Sheets not accessible. Please check your credentials, network, or sharing settings.")
     exit(1)
 
 # -----------------------------------------
 # UTILITY FUNCTIONS
 # -----------------------------------------
+def _df_records(df):
+    return df.to_dict('records') if df is not None and not df.empty else []
+
+
+def build_lookup_registry(models_df, prompts_df, locations_df, eleven_df):
+    """
+    Index the reference tabs once after loading so step parsing uses O(1) dict lookups
+    instead of scanning DataFrames. The first row wins for duplicate IDs and names,
+    matching the old scans. MODEL_ID_OVERRIDES fill in models the Models tab lacks.
+    """
+    model_name_by_id = {}
+    model_web_search_by_id = {}
+    model_id_by_name = {}
+    web_search_rows_by_name = {}
+    for row in _df_records(models_df):
+        model_id = str(row.get('Model ID', ''))
+        model_name = row.get('Model Name', '')
+        if model_id not in model_name_by_id:
+            name = str(model_name).strip()
+            override = MODEL_ID_OVERRIDES.get(model_id)
+            model_name_by_id[model_id] = name or (override["name"] if override else None)
+            model_web_search_by_id[model_id] = str(row.get('Web Search', 'N')).strip().upper() == 'Y'
+        model_id_by_name.setdefault(model_name, model_id)
+        deprecated = str(row.get('Deprecated', '')).strip().upper() == 'Y'
+        web_search = str(row.get('Web Search', 'N')).strip().upper() == 'Y'
+        web_search_rows_by_name.setdefault(model_name, []).append((deprecated, web_search))
+
+    model_web_search_by_name = {}
+    for model_name, rows in web_search_rows_by_name.items():
+        # Prefer non-deprecated entries; the model is web-search enabled if any of them say Y
+        active_rows = [row for row in rows if not row[0]] or rows
+        model_web_search_by_name[model_name] = any(web_search for _, web_search in active_rows)
+
+    for model_id, override in MODEL_ID_OVERRIDES.items():
+        model_name_by_id.setdefault(model_id, override["name"])
+        model_web_search_by_id.setdefault(model_id, bool(override["web_search"]))
+        model_id_by_name.setdefault(override["name"], model_id)
+    override_web_search_by_name = {}
+    for override in MODEL_ID_OVERRIDES.values():
+        override_web_search_by_name[override["name"]] = override_web_search_by_name.get(override["name"], False) or bool(override["web_search"])
+    for model_name, web_search in override_web_search_by_name.items():
+        model_web_search_by_name.setdefault(model_name, web_search)
+
+    def first_by(records, key):
+        index = {}
+        for row in records:
+            index.setdefault(str(row.get(key, '')), row)
+        return index
+
+    prompts_by_id = first_by(_df_records(prompts_df), 'Prompt ID')
+    return {
+        'model_name_by_id': model_name_by_id,
+        'model_id_by_name': model_id_by_name,
+        'model_web_search_by_id': model_web_search_by_id,
+        'model_web_search_by_name': model_web_search_by_name,
+        'prompt_desc_by_id': {prompt_id: row.get('Prompt Description') for prompt_id, row in prompts_by_id.items()},
+        'location_by_id': first_by(_df_records(locations_df), 'Location ID'),
+        'eleven_by_id': first_by(_df_records(eleven_df), 'Eleven ID'),
+    }
+
+
 def get_model_for_step(row, step_key, settings_df):
     override = row.get(f"Model: {step_key}")
     if override and str(override).strip():
@@ -1657,6 +3172,8 @@ def get_intro_outro_paths(row, settings_df):
 
 def fix_text_encoding(text):
     """Fix common encoding issues in text, particularly mojibake characters."""
+    if isinstance(text, CleanText):
+        return text
     if not isinstance(text, str):
         return str(text)
     
@@ -1674,23 +3191,8 @@ def fix_text_encoding(text):
             print(f"Failed to fix encoding with latin1 method: {e}")
             
             try:
-                # Alternative fix: replace common mojibake patterns
-                replacements = {
-                    'â€™': "'",
-                    'â€œ': '"',
-                    'â€': '"',
-                    'â€"': '—',
-                    'â€¦': '…',
-                    'â€¢': '•',
-                    'â€"': '–',
-                    'â€˜': "'",
-                    'â€™': "'",
-                    'â€œ': '"',
-                    'â€': '"'
-                }
-                fixed_text = text
-                for mojibake, correct in replacements.items():
-                    fixed_text = fixed_text.replace(mojibake, correct)
+                # Alternative fix: replace known mojibake patterns
+                fixed_text = replace_known_mojibake(text)
                 print(f"Fixed text with replacements sample: {fixed_text[:200]}...")
                 return fixed_text
             except Exception as e2:
@@ -1699,86 +3201,131 @@ def fix_text_encoding(text):
     
     return text
 
-def force_clean_mojibake(text):
-    """Force replace all known mojibake patterns with correct characters."""
-    if not isinstance(text, str):
-        text = str(text)
+# Known mojibake sequences, applied in this order by the original cleaner.
+# Some entries are shadowed by earlier, shorter ones; the engine below keeps that behaviour.
+MOJIBAKE_REPLACEMENTS = {
+    # Triple-encoded quotes (ISO-8859-1 misinterpretations of the patterns below)
+    'Ã¢â‚¬â„¢': "'",
+    'Ã¢â‚¬Å"': '"',
+    'Ã¢â‚¬Â': '"',
+
+    # Smart quotes and apostrophes (most common issue)
+    'â€™': "'",      # Right single quotation mark (U+2019) - Microsoft's issue
+    'â€˜': "'",      # Left single quotation mark (U+2018)
+    'â€œ': '"',      # Left double quotation mark (U+201C)
+    'â€': '"',      # Right double quotation mark (U+201D)
     
-    # First handle common mojibake patterns - Enhanced with more comprehensive replacements
-    replacements = {
-        # Smart quotes and apostrophes (most common issue)
-        'â€™': "'",      # Right single quotation mark (U+2019) - Microsoft's issue
-        'â€˜': "'",      # Left single quotation mark (U+2018)
-        'â€œ': '"',      # Left double quotation mark (U+201C)
-        'â€': '"',      # Right double quotation mark (U+201D)
-        
-        # Alternative encodings of the same characters
-        '\u00e2\u0080\u0099': "'",  # UTF-8 bytes for right single quotation mark
-        '\u00e2\u0080\u0098': "'",  # UTF-8 bytes for left single quotation mark  
-        '\u00e2\u0080\u009c': '"',  # UTF-8 bytes for left double quotation mark
-        '\u00e2\u0080\u009d': '"',  # UTF-8 bytes for right double quotation mark
-        
-        # Dashes
-        'â€"': '—',      # Em dash (U+2014)
-        'â€"': '–',      # En dash (U+2013)
-        '\u00e2\u0080\u0094': '—',  # UTF-8 bytes for em dash
-        '\u00e2\u0080\u0093': '–',  # UTF-8 bytes for en dash
-        
-        # Other punctuation
-        'â€¦': '…',      # Horizontal ellipsis (U+2026)
-        'â€¢': '•',      # Bullet (U+2022)
-        '\u00e2\u0080\u00a6': '...',  # UTF-8 bytes for ellipsis -> simple dots
-        '\u00e2\u0080\u00a2': '•',   # UTF-8 bytes for bullet
-        
-        # Common accented characters (double-encoded)
-        'Ã©': 'é',       # é (e with acute)
-        'Ã': 'à',       # à (a with grave)
-        'Ã¡': 'á',       # á (a with acute)
-        'Ã­': 'í',       # í (i with acute)
-        'Ã³': 'ó',       # ó (o with acute)
-        'Ãº': 'ú',       # ú (u with acute)
-        'Ã±': 'ñ',       # ñ (n with tilde)
-        'Ã§': 'ç',       # ç (c with cedilla)
-        
-        # Stray characters
-        'Â': '',         # Often appears as stray character (U+00C2)
-        'Ã‚': '',        # Another stray
-        
-        # Zero-width and spacing characters
-        'â€‹': '',       # Zero width space (U+200B)
-        'â€‚': ' ',       # En space (U+2002)
-        'â€ƒ': ' ',       # Em space (U+2003)
-        'â€‰': ' ',       # Thin space (U+2009)
-        'â€Š': ' ',       # Hair space (U+200A)
-        'â€Œ': '',       # Zero width non-joiner (U+200C)
-        'â€': '',       # Zero width joiner (U+200D)
-        'â€Ž': '',       # Left-to-right mark (U+200E)
-        'â€': '',       # Right-to-left mark (U+200F)
-        
-        # Windows-1252 to UTF-8 mojibake patterns
-        '\x91': "'",     # LEFT SINGLE QUOTATION MARK in Windows-1252
-        '\x92': "'",     # RIGHT SINGLE QUOTATION MARK in Windows-1252
-        '\x93': '"',     # LEFT DOUBLE QUOTATION MARK in Windows-1252
-        '\x94': '"',     # RIGHT DOUBLE QUOTATION MARK in Windows-1252
-        '\x96': '–',     # EN DASH in Windows-1252
-        '\x97': '—',     # EM DASH in Windows-1252
-    }
+    # Alternative encodings of the same characters
+    '\u00e2\u0080\u0099': "'",  # UTF-8 bytes for right single quotation mark
+    '\u00e2\u0080\u0098': "'",  # UTF-8 bytes for left single quotation mark  
+    '\u00e2\u0080\u009c': '"',  # UTF-8 bytes for left double quotation mark
+    '\u00e2\u0080\u009d': '"',  # UTF-8 bytes for right double quotation mark
     
-    for mojibake, correct in replacements.items():
-        text = text.replace(mojibake, correct)
+    # Dashes
+    'â€"': '—',      # Em dash (U+2014)
+    'â€"': '–',      # En dash (U+2013)
+    '\u00e2\u0080\u0094': '—',  # UTF-8 bytes for em dash
+    '\u00e2\u0080\u0093': '–',  # UTF-8 bytes for en dash
+    
+    # Other punctuation
+    'â€¦': '…',      # Horizontal ellipsis (U+2026)
+    'â€¢': '•',      # Bullet (U+2022)
+    '\u00e2\u0080\u00a6': '...',  # UTF-8 bytes for ellipsis -> simple dots
+    '\u00e2\u0080\u00a2': '•',   # UTF-8 bytes for bullet
+    
+    # Common accented characters (double-encoded)
+    'Ã©': 'é',       # é (e with acute)
+    'Ã': 'à',       # à (a with grave)
+    'Ã¡': 'á',       # á (a with acute)
+    'Ã­': 'í',       # í (i with acute)
+    'Ã³': 'ó',       # ó (o with acute)
+    'Ãº': 'ú',       # ú (u with acute)
+    'Ã±': 'ñ',       # ñ (n with tilde)
+    'Ã§': 'ç',       # ç (c with cedilla)
+    
+    # Stray characters
+    'Â': '',         # Often appears as stray character (U+00C2)
+    'Ã‚': '',        # Another stray
     
-    # Additional smart quote normalization
-    # Handle various smart quote encodings
-    text = text.replace(''', "'")  # Left single quotation mark
-    text = text.replace(''', "'")  # Right single quotation mark
-    text = text.replace('"', '"')  # Left double quotation mark
-    text = text.replace('"', '"')  # Right double quotation mark
-    text = text.replace('–', '-')  # En dash
-    text = text.replace('—', '-')  # Em dash
-    text = text.replace('…', '...')  # Ellipsis
+    # Zero-width and spacing characters
+    'â€‹': '',       # Zero width space (U+200B)
+    'â€‚': ' ',       # En space (U+2002)
+    'â€ƒ': ' ',       # Em space (U+2003)
+    'â€‰': ' ',       # Thin space (U+2009)
+    'â€Š': ' ',       # Hair space (U+200A)
+    'â€Œ': '',       # Zero width non-joiner (U+200C)
+    'â€': '',       # Zero width joiner (U+200D)
+    'â€Ž': '',       # Left-to-right mark (U+200E)
+    'â€': '',       # Right-to-left mark (U+200F)
     
+    # Windows-1252 to UTF-8 mojibake patterns
+    '\x91': "'",     # LEFT SINGLE QUOTATION MARK in Windows-1252
+    '\x92': "'",     # RIGHT SINGLE QUOTATION MARK in Windows-1252
+    '\x93': '"',     # LEFT DOUBLE QUOTATION MARK in Windows-1252
+    '\x94': '"',     # RIGHT DOUBLE QUOTATION MARK in Windows-1252
+    '\x96': '–',     # EN DASH in Windows-1252
+    '\x97': '—',     # EM DASH in Windows-1252
+}
+
+# Applied after MOJIBAKE_REPLACEMENTS: plain punctuation for TTS-friendly text.
+# Curly quotes are left as they are.
+MOJIBAKE_NORMALIZATION = {
+    '–': '-',  # En dash
+    '—': '-',  # Em dash
+    '…': '...',  # Ellipsis
+}
+
+
+class CleanText(str):
+    """A str that has already been through clean_text; cleaning it again is a no-op."""
+    __slots__ = ()
+
+
+def _apply_mojibake_rules(text):
+    """Reference cleaner: every replacement in order, one str.replace at a time."""
+    for mojibake, correct in MOJIBAKE_REPLACEMENTS.items():
+        text = text.replace(mojibake, correct)
+    for original, plain in MOJIBAKE_NORMALIZATION.items():
+        text = text.replace(original, plain)
     return text
 
+
+# Each known sequence maps to whatever the full ordered rule chain turns it into,
+# so a single longest-match-first regex pass gives the same result for real-world text.
+_MOJIBAKE_TABLE = {
+    pattern: _apply_mojibake_rules(pattern)
+    for pattern in list(MOJIBAKE_REPLACEMENTS) + list(MOJIBAKE_NORMALIZATION)
+}
+_MOJIBAKE_PATTERN = re.compile(
+    "|".join(re.escape(pattern) for pattern in sorted(_MOJIBAKE_TABLE, key=len, reverse=True))
+)
+
+
+def replace_known_mojibake(text):
+    """One pass of the compiled table over text."""
+    return _MOJIBAKE_PATTERN.sub(lambda match: _MOJIBAKE_TABLE[match.group(0)], text)
+
+
+def remaining_mojibake(text):
+    """Known mojibake sequences still present in text, for logging after a clean."""
+    return [pattern for pattern in MOJIBAKE_REPLACEMENTS if pattern in text]
+
+
+def force_clean_mojibake(text):
+    """Force replace all known mojibake patterns with correct characters."""
+    if isinstance(text, CleanText):
+        return text
+    if not isinstance(text, str):
+        text = str(text)
+    return CleanText(replace_known_mojibake(text))
+
+
+def clean_text(text):
+    """fix_text_encoding followed by force_clean_mojibake; returns a CleanText so later stages skip it."""
+    if isinstance(text, CleanText):
+        return text
+    return force_clean_mojibake(fix_text_encoding(text))
+
 # -----------------------------------------
 # API CALLS
 # -----------------------------------------
@@ -1786,29 +3333,29 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
     """Calls the OpenAI API, using the correct endpoint for web search and model type. Logs all errors and unexpected responses."""
     import sys
     import time
-    import signal
-    from threading import Timer
     
+    client = get_openai_client()
     if not client.api_key:
         msg = "❌ OpenAI API key is not configured. Please check your .env file."
         log_error(msg)
         sys.exit(1)
     
-    # Timeout handling
-    timeout_occurred = False
+    # Timeout handling: one deadline for the whole call, including retries and
+    # continuations, so every request is capped at the time that is left.
     # Keep a safety guard, but do not make the script-length target a hard cutoff.
     configured_timeout = OPENAI_WEB_SEARCH_TIMEOUT_SECONDS if web_search else (900 if "deep-research" in model else None)
-    request_timeout_kwargs = {"timeout": configured_timeout} if configured_timeout else {}
-    
-    def timeout_handler():
-        nonlocal timeout_occurred
-        timeout_occurred = True
-        print(f"⏰ Timeout reached ({configured_timeout} seconds) for model {model}. Cancelling API call.")
+    deadline = deadline_after(configured_timeout)
+
+    def timeout_occurred():
+        if deadline_passed(deadline):
+            print(f"⏰ Timeout reached ({configured_timeout} seconds) for model {model}. Cancelling API call.")
+            return True
+        return False
+
+    def request_timeout_kwargs():
+        return {"timeout": remaining_seconds(deadline)} if deadline is not None else {}
 
-    timer = None
     if configured_timeout:
-        timer = Timer(configured_timeout, timeout_handler)
-        timer.start()
         print(f"⏱️ Starting request with {configured_timeout}-second timeout for model {model}")
 
     def is_transient_openai_error(err_text):
@@ -1880,9 +3427,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 web_search_options["user_location"] = {"type": "approximate", "approximate": {"country": "US"}}
             
             # Check for timeout before making API call
-            if timeout_occurred:
-                if timer:
-                    timer.cancel()
+            if timeout_occurred():
                 return "⏰ Research timeout reached. Please try with a more specific request or use a different model."
             
             # Some models reject temperature; only include max_tokens here
@@ -1895,11 +3440,11 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 messages=[{"role": "user", "content": limited_prompt}],
                     web_search_options={**web_search_options, "search_context_size": cc_search_context_size},
                     max_tokens=cc_max_tokens,
-                    **request_timeout_kwargs
+                    **request_timeout_kwargs()
                 )
             except Exception as e:
                 err_text = str(e)
-                if (("rate limit" in err_text.lower() or "429" in err_text) or is_transient_openai_error(err_text)) and not timeout_occurred:
+                if (("rate limit" in err_text.lower() or "429" in err_text) or is_transient_openai_error(err_text)) and not timeout_occurred():
                     # Parse suggested wait if present
                     import re
                     import time
@@ -1909,7 +3454,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                     # Reduce budgets
                     cc_max_tokens = max(300, cc_max_tokens // 2)
                     cc_search_context_size = "low"
-                    remaining = configured_timeout if configured_timeout else 0
+                    remaining = remaining_seconds(deadline) or 0
                     if remaining:
                         # Best-effort sleep bounded by remaining time
                         time.sleep(min(wait_s, max(0.0, remaining - 2)))
@@ -1921,13 +3466,14 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                         try:
                             if attempt > 0:
                                 print(f"⚠️ Retrying transient web-search error ({attempt+1}/{max_attempts}) for model {model}...")
+                                record_step_metric("retries")
                                 time.sleep(min(4 * attempt, 10))
                             response = client.chat.completions.create(
                                 model=model,
                                 messages=[{"role": "user", "content": limited_prompt[:1000]}],
                                 web_search_options={**web_search_options, "search_context_size": cc_search_context_size},
                                 max_tokens=cc_max_tokens,
-                                **request_timeout_kwargs
+                                **request_timeout_kwargs()
                             )
                             break
                         except Exception as retry_error:
@@ -1938,16 +3484,14 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                         raise last_retry_error
                 else:
                     raise
+            record_model_usage(response)
             # Robust error logging for chat completions
             if hasattr(response, 'error') and response.error:
                 log_error(f"OpenAI ChatCompletions error: {response.error}\nFull response: {response}")
                 sys.exit(1)
             if hasattr(response, 'choices') and response.choices:
                 raw_response = response.choices[0].message.content.strip()
-                # Clean up timer if it exists
-                if timer:
-                    timer.cancel()
-                return fix_text_encoding(raw_response)
+                return clean_text(raw_response)
             log_error(f"OpenAI ChatCompletions: Unexpected empty or malformed response. Full response: {response}")
             sys.exit(1)
         # Case 2: Responses API with web_search tool (base models)
@@ -1967,9 +3511,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
             }
             
             # Check for timeout before making API call
-            if timeout_occurred:
-                if timer:
-                    timer.cancel()
+            if timeout_occurred():
                 return "⏰ Research timeout reached. Please try with a more specific request or use a different model."
             
             # Attempt with enough room for the requested brief without inviting costly sprawl.
@@ -1998,7 +3540,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 }
                 if web_search_instructions:
                     responses_kwargs["instructions"] = web_search_instructions
-                responses_kwargs.update(request_timeout_kwargs)
+                responses_kwargs.update(request_timeout_kwargs())
 
                 # Give GPT-5-family web search enough reasoning for story selection without overspending.
                 if _is_gpt5:
@@ -2008,7 +3550,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 response = client.responses.create(**responses_kwargs)
             except Exception as e:
                 err_text = str(e)
-                if (("rate limit" in err_text.lower() or "429" in err_text) or is_transient_openai_error(err_text)) and not timeout_occurred:
+                if (("rate limit" in err_text.lower() or "429" in err_text) or is_transient_openai_error(err_text)) and not timeout_occurred():
                     import re, time
                     m = re.search(r"try again in ([0-9]+\.?[0-9]*)s", err_text)
                     # Longer default wait for 5xx transient platform errors
@@ -2035,7 +3577,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                     }
                     if web_search_instructions:
                         responses_kwargs_retry["instructions"] = web_search_instructions
-                    responses_kwargs_retry.update(request_timeout_kwargs)
+                    responses_kwargs_retry.update(request_timeout_kwargs())
 
                     # Keep retry quality reasonable without repeating the most expensive path.
                     if _is_gpt5:
@@ -2048,18 +3590,20 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                         try:
                             if attempt > 0:
                                 print(f"⚠️ Retrying transient web-search error ({attempt+1}/{max_attempts}) for model {model}...")
+                                record_step_metric("retries")
                                 time.sleep(min(5 * attempt, 12))
                             response = client.responses.create(**responses_kwargs_retry)
                             break
                         except Exception as retry_error:
                             retry_text = str(retry_error)
                             last_retry_error = retry_error
-                            if not (is_transient_openai_error(retry_text) and not timeout_occurred):
+                            if not (is_transient_openai_error(retry_text) and not timeout_occurred()):
                                 raise
                     if response is None and last_retry_error:
                         raise last_retry_error
                 else:
                     raise
+            record_model_usage(response)
             # Robust error logging for responses.create
             if hasattr(response, 'error') and response.error:
                 log_error(f"OpenAI Responses error: {response.error}\nFull response: {response}")
@@ -2085,21 +3629,19 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                     }
                     if web_search_instructions:
                         continuation_kwargs["instructions"] = web_search_instructions
-                    continuation_kwargs.update(request_timeout_kwargs)
+                    continuation_kwargs.update(request_timeout_kwargs())
                     if hasattr(response, 'id') and response.id:
                         continuation_kwargs["previous_response_id"] = response.id
                     if _is_gpt5:
                         continuation_kwargs["reasoning"] = {"effort": OPENAI_GPT5_WEB_SEARCH_RETRY_REASONING_EFFORT}
                     response = client.responses.create(**continuation_kwargs)
+                    record_model_usage(response)
                     if hasattr(response, 'output_text') and response.output_text:
                         raw_response = response.output_text.strip()
                         print(f"[DEBUG] Continuation produced output_text: {raw_response[:100]}...")
-                if timer:
-                    timer.cancel()
                 # Apply encoding fixes and mojibake cleaning
-                fixed_response = fix_text_encoding(raw_response)
-                before_mojibake_fix = fixed_response[:200]
-                fixed_response = force_clean_mojibake(fixed_response)
+                before_mojibake_fix = raw_response[:200]
+                fixed_response = clean_text(raw_response)
                 after_mojibake_fix = fixed_response[:200]
                 
                 # Log mojibake detection
@@ -2133,11 +3675,8 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 if text_responses:
                     combined_response = '\n\n'.join(text_responses)
                     print(f"[DEBUG] Found {len(text_responses)} assistant text responses")
-                    if timer:
-                        timer.cancel()
                     # Apply encoding fixes and mojibake cleaning
-                    fixed_response = fix_text_encoding(combined_response)
-                    fixed_response = force_clean_mojibake(fixed_response)
+                    fixed_response = clean_text(combined_response)
                     return fixed_response
                 
                 # If we get here, there might be an issue with the response format
@@ -2165,7 +3704,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 }
                 if web_search_instructions:
                     followup_kwargs["instructions"] = web_search_instructions
-                followup_kwargs.update(request_timeout_kwargs)
+                followup_kwargs.update(request_timeout_kwargs())
                 if hasattr(response, 'id') and response.id:
                     followup_kwargs["previous_response_id"] = response.id
                 _model_lower_followup = str(model).lower()
@@ -2173,26 +3712,20 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                     # Keep follow-up synthesis bounded for faster workflow completion.
                     followup_kwargs["reasoning"] = {"effort": OPENAI_GPT5_WEB_SEARCH_RETRY_REASONING_EFFORT}
                 followup_response = client.responses.create(**followup_kwargs)
+                record_model_usage(followup_response)
                 if hasattr(followup_response, 'output_text') and followup_response.output_text:
                     final_text = followup_response.output_text.strip()
-                    if timer:
-                        timer.cancel()
-                    final_text = fix_text_encoding(final_text)
-                    final_text = force_clean_mojibake(final_text)
+                    final_text = clean_text(final_text)
                     print("[DEBUG] Follow-up call produced output_text successfully")
                     return final_text
                 
                 # If still nothing accessible, return an error message
                 error_response = "GPT-5 response received but no accessible text content found. The model may not have generated a proper response or the response format is unexpected."
                 print(f"[DEBUG] Returning error response: {error_response}")
-                if timer:
-                    timer.cancel()
                 return error_response
                 
             except Exception as parse_error:
                 log_error(f"Error parsing GPT-5 response structure: {parse_error}")
-                if timer:
-                    timer.cancel()
                 return f"Error parsing GPT-5 response: {parse_error}"
         # Case 3: Standard Chat Completions
         else:
@@ -2212,9 +3745,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 kwargs["temperature"] = temperature
             
             # Check for timeout before making API call
-            if timeout_occurred:
-                if timer:
-                    timer.cancel()
+            if timeout_occurred():
                 return "⏰ Research timeout reached. Please try with a more specific request or use a different model."
             
             try:
@@ -2231,9 +3762,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                         del kwargs["temperature"]
                         
                         # Check for timeout before retry
-                        if timeout_occurred:
-                            if timer:
-                                timer.cancel()
+                        if timeout_occurred():
                             return "⏰ Research timeout reached. Please try with a more specific request or use a different model."
                         
                         try:
@@ -2248,9 +3777,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                         time.sleep(5)
                         
                         # Check for timeout before retry
-                        if timeout_occurred:
-                            if timer:
-                                timer.cancel()
+                        if timeout_occurred():
                             return "⏰ Research timeout reached. Please try with a more specific request or use a different model."
                         
                         try:
@@ -2261,6 +3788,7 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                     else:
                         log_error(f"OpenAI error: {e}")
                         sys.exit(1)
+            record_model_usage(response)
             # Robust error logging for chat completions
             if hasattr(response, 'error') and response.error:
                 log_error(f"OpenAI ChatCompletions error: {response.error}\nFull response: {response}")
@@ -2364,14 +3892,10 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                 raw_response = str(response.text).strip()
             
             if raw_response:
-                # Clean up timer if it exists
-                if timer:
-                    timer.cancel()
                 
                 # Apply comprehensive encoding fixes to OpenAI response
-                fixed_response = fix_text_encoding(raw_response)
-                before_mojibake_fix = fixed_response[:200]
-                fixed_response = force_clean_mojibake(fixed_response)
+                before_mojibake_fix = raw_response[:200]
+                fixed_response = clean_text(raw_response)
                 after_mojibake_fix = fixed_response[:200]
                 
                 # Log if mojibake was found and fixed
@@ -2393,43 +3917,33 @@ def call_openai_model(prompt, model="gpt-4o", temperature=0.8, web_search=False)
                     log_error(f"Output item {i}: type={getattr(item, 'type', 'unknown')}, attributes={dir(item)}")
             sys.exit(1)
     except Exception as e:
-        # Clean up timer if it exists
-        if timer:
-            timer.cancel()
         log_error(f"OpenAI error: {e}")
         sys.exit(1)
-    finally:
-        # Ensure timer is always cleaned up
-        if timer:
-            timer.cancel()
+
 
 def call_model(prompt, model="gpt-4o", temperature=0.8, web_search=False):
     """Calls the appropriate model API based on the model name."""
     # Determine provider from model name
-    if model.startswith('claude-'):
-        return call_anthropic_model(prompt, model, temperature, web_search)
-    elif model.startswith('gemini-'):
-        return call_google_model(prompt, model, temperature)
-    else:
-        # Default to OpenAI for all other models
-        return call_openai_model(prompt, model, temperature, web_search)
+    with network_timer():
+        if model.startswith('claude-'):
+            return call_anthropic_model(prompt, model, temperature, web_search)
+        elif model.startswith('gemini-'):
+            return call_google_model(prompt, model, temperature)
+        else:
+            # Default to OpenAI for all other models
+            return call_openai_model(prompt, model, temperature, web_search)
 
 
 def call_anthropic_model(prompt, model="claude-3-sonnet", temperature=0.8, web_search=False):
     """Calls the Anthropic Claude API with optional web search support."""
     try:
-        import anthropic
-        
         if not os.getenv('ANTHROPIC_API_KEY'):
             msg = "❌ Anthropic API key is not configured. Please check your .env file."
             print(msg)
             sys.exit(1)
         anthropic_timeout = ANTHROPIC_WEB_SEARCH_TIMEOUT_SECONDS if web_search else ANTHROPIC_DEFAULT_TIMEOUT_SECONDS
-        client = anthropic.Anthropic(
-            api_key=os.getenv('ANTHROPIC_API_KEY'),
-            timeout=anthropic_timeout,
-            max_retries=ANTHROPIC_MAX_RETRIES,
-        )
+        # with_options shares the pooled HTTP connection and only overrides the timeout
+        client = get_anthropic_client().with_options(timeout=anthropic_timeout)
         
         # Check if web search is requested and model supports it (uses pattern for new models)
         model_supports_web_search = anthropic_model_supports_web_search(model)
@@ -2484,6 +3998,7 @@ def call_anthropic_model(prompt, model="claude-3-sonnet", temperature=0.8, web_s
         
         try:
             response = client.messages.create(**api_params)
+            record_model_usage(response)
         except Exception as first_error:
             error_text = str(first_error).lower()
             rejected_sampling = any(
@@ -2515,6 +4030,7 @@ def call_anthropic_model(prompt, model="claude-3-sonnet", temperature=0.8, web_s
                 f"after API rejection: {', '.join(removed_sampling_params)}"
             )
             response = client.messages.create(**api_params)
+            record_model_usage(response)
         
         if hasattr(response, 'content') and response.content:
             # Extract all text content blocks and concatenate them
@@ -2528,9 +4044,8 @@ def call_anthropic_model(prompt, model="claude-3-sonnet", temperature=0.8, web_s
                 # Join all text blocks into a single response
                 full_response = '\n\n'.join(text_blocks)
                 # Apply comprehensive encoding fixes to Anthropic response
-                fixed_response = fix_text_encoding(full_response)
-                before_mojibake_fix = fixed_response[:200]
-                fixed_response = force_clean_mojibake(fixed_response)
+                before_mojibake_fix = full_response[:200]
+                fixed_response = clean_text(full_response)
                 after_mojibake_fix = fixed_response[:200]
                 
                 # Log if mojibake was found and fixed
@@ -2554,13 +4069,11 @@ def call_anthropic_model(prompt, model="claude-3-sonnet", temperature=0.8, web_s
 def call_google_model(prompt, model="gemini-2.0-flash", temperature=0.8):
     """Calls the Google Gemini API."""
     try:
-        import google.generativeai as genai
-        
-        genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
         if not os.getenv('GEMINI_API_KEY'):
             msg = "❌ Google Gemini API key is not configured. Please check your .env file."
             print(msg)
             sys.exit(1)
+        genai = get_gemini_module()
         
         # Configure the model (8192 tokens for full script + title/description output)
         generation_config = genai.types.GenerationConfig(
@@ -2572,14 +4085,14 @@ def call_google_model(prompt, model="gemini-2.0-flash", temperature=0.8):
         model_instance = genai.GenerativeModel(model, generation_config=generation_config)
         
         # Generate content
-        response = model_instance.generate_content(prompt)
+        response = model_instance.generate_content(prompt, request_options={"timeout": GOOGLE_MODEL_TIMEOUT_SECONDS})
+        record_model_usage(response)
         
         if hasattr(response, 'text'):
             raw_response = response.text.strip()
             # Apply comprehensive encoding fixes to Google Gemini response
-            fixed_response = fix_text_encoding(raw_response)
-            before_mojibake_fix = fixed_response[:200]
-            fixed_response = force_clean_mojibake(fixed_response)
+            before_mojibake_fix = raw_response[:200]
+            fixed_response = clean_text(raw_response)
             after_mojibake_fix = fixed_response[:200]
             
             # Log if mojibake was found and fixed
@@ -2600,14 +4113,117 @@ def call_google_model(prompt, model="gemini-2.0-flash", temperature=0.8):
         sys.exit(1)
 
 
-def split_text_into_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS):
+def _split_text_units(text, max_length):
+    """Split text into sentence units as (text, ends_paragraph); sentences over max_length are split hard."""
+    units = []
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text)]
+    paragraphs = [p for p in paragraphs if p] or [text]
+    for paragraph in paragraphs:
+        sentences = re.split(r'(?<=[.!?]) +', paragraph)
+        for sentence_index, sentence in enumerate(sentences):
+            # Oversized sentences are cut into equal hard pieces
+            pieces = -(-len(sentence) // max_length) if sentence else 1
+            piece_length = -(-len(sentence) // pieces) if sentence else 0
+            for piece_index in range(pieces):
+                piece = sentence[piece_index * piece_length:(piece_index + 1) * piece_length]
+                units.append((piece, piece_index == pieces - 1 and sentence_index == len(sentences) - 1))
+    return units
+
+
+def _join_units(units):
+    parts = []
+    for n, (unit_text, _) in enumerate(units):
+        if n:
+            parts.append('\n\n' if units[n - 1][1] else ' ')
+        parts.append(unit_text)
+    return ''.join(parts)
+
+
+def _pack_units(units, capacity, max_chunks=None, paragraph_cut_ratio=None):
     """
-    Splits text into chunks of up to max_length characters, preferably on sentence boundaries.
-    If a sentence is longer than max_length, it is split into hard chunks.
-    Default max_length stays below Eleven Labs v3's 3000 character limit.
+    Greedily pack units into chunks of at most capacity characters; returns (start, end) unit ranges.
+    With max_chunks and paragraph_cut_ratio, a chunk may close early at a paragraph end once it is
+    that full, as long as the rest still packs into the remaining chunks.
+    """
+    ranges = []
+    start = 0
+    length = 0
+    for n, (unit_text, _) in enumerate(units):
+        separator = (2 if units[n - 1][1] else 1) if n > start else 0
+        if n > start and length + separator + len(unit_text) > capacity:
+            ranges.append((start, n))
+            start, length, separator = n, 0, 0
+        length += separator + len(unit_text)
+        if (paragraph_cut_ratio and max_chunks and units[n][1] and n + 1 < len(units)
+                and length >= paragraph_cut_ratio * capacity
+                and len(ranges) + 1 + len(_pack_units(units[n + 1:], capacity)) <= max_chunks):
+            ranges.append((start, n + 1))
+            start, length = n + 1, 0
+    if start < len(units):
+        ranges.append((start, len(units)))
+    return ranges
+
+
+def estimate_parallel_seconds(durations, parallelism):
+    """Wall-clock estimate for running durations in order on `parallelism` workers."""
+    workers = [0.0] * max(1, int(parallelism or 1))
+    for duration in durations:
+        next_free = workers.index(min(workers))
+        workers[next_free] += duration
+    return max(workers) if durations else 0.0
+
+
+def plan_text_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS, target_chunks=None, parallelism=1):
     """
-    import re
+    Plan TTS chunks with balanced sizes on paragraph and sentence boundaries.
+    Uses the fewest chunks that fit max_length (or target_chunks, when larger and every chunk
+    keeps at least TTS_MIN_CHUNK_CHARS) and the smallest per-chunk size that fits them, so the
+    largest chunk - which sets the wall-clock time of parallel synthesis - is as small as possible.
     
+    Returns:
+        dict: chunks, sizes, boundaries ((start, end) sentence-unit ranges), paragraph_breaks
+        (whether each chunk ends a paragraph), estimated_seconds per chunk and
+        estimated_wall_seconds for the given parallelism.
+    """
+    units = _split_text_units(text, max_length)
+    total_length = len(_join_units(units))
+    if total_length == 0:
+        return {"chunks": [], "sizes": [], "boundaries": [], "paragraph_breaks": [],
+                "estimated_seconds": [], "estimated_wall_seconds": 0.0}
+    required = len(_pack_units(units, max_length))
+    chunk_count = required
+    if target_chunks and target_chunks > required:
+        chunk_count = max(required, min(int(target_chunks), len(units), total_length // max(1, TTS_MIN_CHUNK_CHARS)))
+
+    # Smallest capacity that still packs into chunk_count chunks
+    low, high = max(1, -(-total_length // chunk_count)), max_length
+    while low < high:
+        middle = (low + high) // 2
+        if len(_pack_units(units, middle)) <= chunk_count:
+            high = middle
+        else:
+            low = middle + 1
+    ranges = _pack_units(units, low, max_chunks=chunk_count, paragraph_cut_ratio=0.75)
+
+    chunks = [_join_units(units[start:end]) for start, end in ranges]
+    sizes = [len(chunk) for chunk in chunks]
+    estimated_seconds = [round(size / max(1, TTS_EST_CHARS_PER_SECOND), 2) for size in sizes]
+    return {
+        "chunks": chunks,
+        "sizes": sizes,
+        "boundaries": ranges,
+        "paragraph_breaks": [units[end - 1][1] for _, end in ranges],
+        "estimated_seconds": estimated_seconds,
+        "estimated_wall_seconds": round(estimate_parallel_seconds(estimated_seconds, parallelism), 2),
+    }
+
+
+def split_text_into_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS, target_chunks=None, parallelism=1):
+    """
+    Splits text into chunks of up to max_length characters on paragraph and sentence boundaries,
+    with sizes balanced by plan_text_chunks. If a sentence is longer than max_length, it is split into hard chunks.
+    Default max_length stays below Eleven Labs v3's 3000 character limit.
+    """
     # MOJIBAKE CHECK BEFORE TEXT CHUNKING
     print(f"🔍 split_text_into_chunks: Checking text before chunking")
     chunk_text_sample = text[:150]
@@ -2621,8 +4237,7 @@ def split_text_into_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS):
         print(f"🔧 Applying emergency cleaning before text chunking...")
         
         # Emergency cleaning
-        text = fix_text_encoding(text)
-        text = force_clean_mojibake(text)
+        text = clean_text(text)
         
         # Additional aggressive cleaning
         for pattern in ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']:
@@ -2650,27 +4265,9 @@ def split_text_into_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS):
     else:
         print("✅ Text for chunking is clean")
     
-    sentences = re.split(r'(?<=[.!?]) +', text)
-    chunks = []
-    current_chunk = ''
-    for sentence in sentences:
-        # If the sentence itself is too long, split it hard
-        while len(sentence) > max_length:
-            part = sentence[:max_length]
-            sentence = sentence[max_length:]
-            if current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = ''
-            chunks.append(part)
-        if len(current_chunk) + len(sentence) + 1 <= max_length:
-            current_chunk += (' ' if current_chunk else '') + sentence
-        else:
-            if current_chunk:
-                chunks.append(current_chunk)
-            current_chunk = sentence
-    if current_chunk:
-        chunks.append(current_chunk)
-    print(f"[DEBUG] split_text_into_chunks: {len(chunks)} chunk(s) created.")
+    plan = plan_text_chunks(text, max_length=max_length, target_chunks=target_chunks, parallelism=parallelism)
+    chunks = plan["chunks"]
+    print(f"[DEBUG] split_text_into_chunks: {len(chunks)} chunk(s) created, est. {plan['estimated_wall_seconds']}s at parallelism {parallelism}.")
     for i, chunk in enumerate(chunks):
         print(f"[DEBUG]   Chunk {i+1} length: {len(chunk)}")
     return chunks
@@ -2709,10 +4306,64 @@ def is_elevenlabs_credit_quota_error(error_message, status_code=None):
         # For 429, we'll check the error message more carefully
         if status_code == 429 and ('quota' in error_lower or 'credit' in error_lower):
             return True
-    
+
+    return False
+
+
+def is_elevenlabs_concurrency_limit_error(error_message, status_code=None):
+    """
+    Check if an ElevenLabs error means the account's concurrent request limit was hit.
+    These are transient: the request should be retried once another chunk finishes.
+    """
+    error_lower = str(error_message or "").lower()
+    if any(token in error_lower for token in ["too_many_concurrent_requests", "concurrent", "system_busy"]):
+        return True
+    if status_code == 429:
+        return not is_elevenlabs_credit_quota_error(error_message, status_code)
     return False
 
 
+def call_with_elevenlabs_concurrency_retry(request_fn, label):
+    """Run request_fn, backing off and retrying when ElevenLabs reports a concurrency-limit rejection."""
+    for attempt in range(ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS + 1):
+        try:
+            with _elevenlabs_request_slots:
+                return request_fn()
+        except Exception as e:
+            status_code = getattr(e, 'status_code', None)
+            if attempt >= ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS or not is_elevenlabs_concurrency_limit_error(str(e), status_code):
+                raise
+            wait_s = min(2 ** attempt, 8)
+            print(f"⚠️ ElevenLabs concurrency limit hit for {label}. Retrying in {wait_s}s ({attempt+1}/{ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS})...")
+            record_step_metric("retries")
+            time.sleep(wait_s)
+
+
+def run_chunk_jobs_in_order(job, count, max_workers, label="chunk"):
+    """
+    Run job(idx) for every chunk index on a bounded thread pool and return the results in chunk order.
+    The first failure cancels chunks that have not started yet and is re-raised to the caller.
+    """
+    if count <= 0:
+        return []
+    max_workers = max(1, min(int(max_workers or 1), count))
+    if max_workers == 1:
+        return [job(idx) for idx in range(count)]
+
+    print(f"[DEBUG] Running {count} {label} job(s) with concurrency {max_workers}")
+    results = [None] * count
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=label)
+    try:
+        futures = {submit_in_context(executor, job, idx): idx for idx in range(count)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+    return results
+
+
 def get_elevenlabs_model_id(eleven_config=None):
     if eleven_config:
         model_id = eleven_config.get("Model")
@@ -2811,6 +4462,26 @@ def build_elevenlabs_tts_payload(chunk_text, eleven_config=None, previous_text=N
     return payload
 
 
+def build_elevenlabs_cache_key(chunk_text, voice_id, eleven_config=None, previous_text=None, next_text=None):
+    """TTS cache key for an ElevenLabs chunk; shared by the SDK and REST paths since both produce the same audio."""
+    model_id = get_elevenlabs_model_id(eleven_config)
+    supports_context = elevenlabs_model_supports_chunk_context(model_id)
+    return build_tts_cache_key(
+        "elevenlabs",
+        text=chunk_text,
+        voice_id=voice_id,
+        model_id=model_id,
+        voice_settings=build_elevenlabs_voice_settings(eleven_config),
+        previous_text=(previous_text or None) if supports_context else None,
+        next_text=(next_text or None) if supports_context else None,
+    )
+
+
+def get_elevenlabs_client():
+    from elevenlabs.client import ElevenLabs
+    return get_shared_client('elevenlabs', lambda: ElevenLabs(api_key=ELEVENLABS_API_KEY))
+
+
 def generate_voice_audio(text, voice_id, output_path, eleven_config=None):
     """
     Enhanced Eleven Labs API call using the official Python client.
@@ -2822,12 +4493,19 @@ def generate_voice_audio(text, voice_id, output_path, eleven_config=None):
         On credit/quota errors, raises ValueError with error details
     """
     try:
-        from elevenlabs.client import ElevenLabs
-        chunks = split_text_into_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS)
+        chunks = split_text_into_chunks(
+            text,
+            max_length=ELEVENLABS_CHUNK_MAX_CHARS,
+            target_chunks=TTS_CHUNK_TARGET_PARALLELISM,
+            parallelism=ELEVENLABS_MAX_CONCURRENCY,
+        )
         print(f"[DEBUG] generate_voice_audio: Preparing to send {len(chunks)} chunk(s) to Eleven Labs API.")
         if len(chunks) == 1:
             chunk_text = chunks[0]
-            client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
+            cache_key = build_elevenlabs_cache_key(chunk_text, voice_id, eleven_config)
+            if fetch_tts_cache(cache_key, output_path):
+                return output_path
+            client = get_elevenlabs_client()
             if eleven_config:
                 voice_settings = build_elevenlabs_voice_settings(eleven_config)
                 try:
@@ -2869,29 +4547,40 @@ def generate_voice_audio(text, voice_id, output_path, eleven_config=None):
                     traceback.print_exc()
                     print("[DEBUG] Falling back to REST API...")
                     return generate_voice_audio_rest(text, voice_id, output_path, eleven_config)
-            with open(output_path, 'wb') as f:
+            with network_timer(), open(output_path, 'wb') as f:
                 for chunk in audio_stream:
                     f.write(chunk)
+            record_step_metric("tts_chars", len(chunk_text))
+            record_step_metric("bytes_in", os.path.getsize(output_path))
+            store_tts_cache(cache_key, output_path)
             print(f"✅ Audio generated successfully: {output_path}")
             return output_path
         else:
-            # Multiple chunks: process each, then merge
-            temp_audio_paths = []
-            client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
-            for idx, chunk_text in enumerate(chunks):
-                temp_path = MP3_OUTPUT_DIR / f"temp_audio_{int(time.time())}_{os.getpid()}_chunk_{idx+1}.mp3"
+            # Multiple chunks: synthesize concurrently (bounded by the account tier), then merge in order
+            client = get_elevenlabs_client()
+            voice_settings = build_elevenlabs_voice_settings(eleven_config)
+            model_id = get_elevenlabs_model_id(eleven_config)
+            run_stamp = f"{int(time.time())}_{os.getpid()}"
+            temp_paths = [MP3_OUTPUT_DIR / f"temp_audio_{run_stamp}_chunk_{idx+1}.mp3" for idx in range(len(chunks))]
+            print(f"[DEBUG] Using model: {model_id}, voice_id: {voice_id}")
+
+            def synthesize_chunk(idx):
+                chunk_text = chunks[idx]
+                temp_path = temp_paths[idx]
                 previous_text = chunks[idx - 1] if idx > 0 else None
                 next_text = chunks[idx + 1] if idx + 1 < len(chunks) else None
                 print(f"[DEBUG] Sending chunk {idx+1}/{len(chunks)} to Eleven Labs API (length: {len(chunk_text)})")
                 print(f"[DEBUG] Chunk {idx+1} preview: {chunk_text[:100]}")
-                if eleven_config:
-                    voice_settings = build_elevenlabs_voice_settings(eleven_config)
-                    model_id = get_elevenlabs_model_id(eleven_config)
-                    try:
-                        print(f"[DEBUG] Using model: {model_id}, voice_id: {voice_id}")
-                        if len(chunk_text) > ELEVENLABS_CHUNK_MAX_CHARS:
-                            print(f"[WARNING] Chunk {idx+1} is very long ({len(chunk_text)} chars). Consider splitting further if you see timeouts.")
-                        start_time = time.time()
+                if len(chunk_text) > ELEVENLABS_CHUNK_MAX_CHARS:
+                    print(f"[WARNING] Chunk {idx+1} is very long ({len(chunk_text)} chars). Consider splitting further if you see timeouts.")
+                cache_key = build_elevenlabs_cache_key(chunk_text, voice_id, eleven_config, previous_text, next_text)
+                if fetch_tts_cache(cache_key, temp_path):
+                    return temp_path
+
+                def convert_and_save():
+                    # The SDK streams lazily, so the request and the file write share one retry scope.
+                    # Only the request is timed; slot waits and retry sleeps are not network time.
+                    with network_timer():
                         audio_stream = client.text_to_speech.convert(
                             **build_elevenlabs_convert_kwargs(
                                 chunk_text,
@@ -2902,76 +4591,44 @@ def generate_voice_audio(text, voice_id, output_path, eleven_config=None):
                                 next_text=next_text,
                             )
                         )
-                        elapsed = time.time() - start_time
-                        print(f"[DEBUG] ElevenLabs SDK call for chunk {idx+1} returned in {elapsed:.3f}s (streaming)")
-                        print(f"[DEBUG] ElevenLabs SDK: Received audio stream for chunk {idx+1}. Saving to file {temp_path}...")
-                    except ValueError:
-                        # Re-raise credit/quota errors
-                        for p in temp_audio_paths:
-                            try: os.remove(p)
-                            except: pass
-                        raise
-                    except Exception as e:
-                        error_msg = str(e)
-                        print(f"[ERROR] Failed on chunk {idx+1}/{len(chunks)}. First 100 chars: {chunk_text[:100]}")
-                        traceback.print_exc()
-                        # Check if this is a credit/quota error
-                        if is_elevenlabs_credit_quota_error(error_msg, None):
-                            for p in temp_audio_paths:
-                                try: os.remove(p)
-                                except: pass
-                            raise ValueError(f"ElevenLabs credit/quota error: {error_msg}")
-                        print("[DEBUG] Falling back to REST API...")
-                        for p in temp_audio_paths:
-                            try: os.remove(p)
-                            except: pass
-                        return generate_voice_audio_rest(text, voice_id, output_path, eleven_config)
-                else:
-                    model_id = ELEVENLABS_DEFAULT_MODEL_ID
-                    try:
-                        print(f"[DEBUG] Using model: {model_id}, voice_id: {voice_id}")
-                        if len(chunk_text) > ELEVENLABS_CHUNK_MAX_CHARS:
-                            print(f"[WARNING] Chunk {idx+1} is very long ({len(chunk_text)} chars). Consider splitting further if you see timeouts.")
-                        start_time = time.time()
-                        audio_stream = client.text_to_speech.convert(
-                            **build_elevenlabs_convert_kwargs(
-                                chunk_text,
-                                voice_id,
-                                build_elevenlabs_voice_settings(),
-                                model_id,
-                                previous_text=previous_text,
-                                next_text=next_text,
-                            )
-                        )
-                        elapsed = time.time() - start_time
-                        print(f"[DEBUG] ElevenLabs SDK call for chunk {idx+1} returned in {elapsed:.3f}s (streaming)")
-                        print(f"[DEBUG] ElevenLabs SDK: Received audio stream for chunk {idx+1}. Saving to file {temp_path}...")
-                    except ValueError:
-                        # Re-raise credit/quota errors
-                        for p in temp_audio_paths:
-                            try: os.remove(p)
-                            except: pass
-                        raise
-                    except Exception as e:
-                        error_msg = str(e)
-                        print(f"[ERROR] Failed on chunk {idx+1}/{len(chunks)}. First 100 chars: {chunk_text[:100]}")
-                        traceback.print_exc()
-                        # Check if this is a credit/quota error
-                        if is_elevenlabs_credit_quota_error(error_msg, None):
-                            for p in temp_audio_paths:
-                                try: os.remove(p)
-                                except: pass
-                            raise ValueError(f"ElevenLabs credit/quota error: {error_msg}")
-                        print("[DEBUG] Falling back to REST API...")
-                        for p in temp_audio_paths:
-                            try: os.remove(p)
-                            except: pass
-                        return generate_voice_audio_rest(text, voice_id, output_path, eleven_config)
-                with open(temp_path, 'wb') as f:
-                    for chunk in audio_stream:
-                        f.write(chunk)
-                print(f"✅ Audio chunk {idx+1} generated and saved: {temp_path}")
-                temp_audio_paths.append(temp_path)
+                        with open(temp_path, 'wb') as f:
+                            for audio_bytes in audio_stream:
+                                f.write(audio_bytes)
+
+                try:
+                    start_time = time.time()
+                    call_with_elevenlabs_concurrency_retry(convert_and_save, f"chunk {idx+1}")
+                    record_step_metric("tts_chars", len(chunk_text))
+                    record_step_metric("bytes_in", os.path.getsize(temp_path))
+                    store_tts_cache(cache_key, temp_path)
+                    elapsed = time.time() - start_time
+                    print(f"✅ Audio chunk {idx+1} generated in {elapsed:.3f}s and saved: {temp_path}")
+                    return temp_path
+                except Exception:
+                    print(f"[ERROR] Failed on chunk {idx+1}/{len(chunks)}. First 100 chars: {chunk_text[:100]}")
+                    traceback.print_exc()
+                    raise
+
+            try:
+                temp_audio_paths = run_chunk_jobs_in_order(
+                    synthesize_chunk, len(chunks), ELEVENLABS_MAX_CONCURRENCY, label="elevenlabs-chunk"
+                )
+            except ValueError:
+                # Re-raise credit/quota errors
+                for p in temp_paths:
+                    try: os.remove(p)
+                    except: pass
+                raise
+            except Exception as e:
+                error_msg = str(e)
+                for p in temp_paths:
+                    try: os.remove(p)
+                    except: pass
+                # Check if this is a credit/quota error
+                if is_elevenlabs_credit_quota_error(error_msg, None):
+                    raise ValueError(f"ElevenLabs credit/quota error: {error_msg}")
+                print("[DEBUG] Falling back to REST API...")
+                return generate_voice_audio_rest(text, voice_id, output_path, eleven_config)
             # Merge all chunk audio files
             merged_path = MP3_OUTPUT_DIR / f"merged_audio_{int(time.time())}_{os.getpid()}.mp3"
             print(f"[DEBUG] Merging {len(temp_audio_paths)} chunk files into {merged_path}")
@@ -2990,6 +4647,189 @@ def generate_voice_audio(text, voice_id, output_path, eleven_config=None):
         return generate_voice_audio_rest(text, voice_id, output_path, eleven_config)
 
 
+tts_chunk_metrics = []
+_tts_chunk_metrics_lock = threading.Lock()
+
+
+def record_tts_chunk_metrics(provider, endpoint, chunk_index, ttfb_s, total_s, byte_count):
+    """Keep time-to-first-byte and throughput for one synthesized chunk."""
+    bytes_per_sec = byte_count / total_s if total_s > 0 else None
+    metrics = {
+        "provider": provider,
+        "endpoint": endpoint,
+        "chunk": chunk_index + 1,
+        "ttfb_s": round(ttfb_s, 3) if ttfb_s is not None else None,
+        "total_s": round(total_s, 3),
+        "bytes": byte_count,
+        "bytes_per_sec": round(bytes_per_sec) if bytes_per_sec else None,
+    }
+    with _tts_chunk_metrics_lock:
+        tts_chunk_metrics.append(metrics)
+    ttfb_text = f"{ttfb_s:.3f}s" if ttfb_s is not None else "n/a"
+    rate_text = f"{bytes_per_sec / 1024:.1f} KiB/s" if bytes_per_sec else "n/a"
+    print(f"[METRICS] {provider} {endpoint} chunk {chunk_index+1}: ttfb {ttfb_text}, {byte_count} bytes in {total_s:.2f}s ({rate_text})")
+    return metrics
+
+
+def write_chunk_streams_in_order(count, produce, sinks, max_workers, label="chunk"):
+    """
+    Run produce(idx, emit) for every chunk on a bounded thread pool and write each emitted
+    block to every sink, in chunk order. The head chunk is written as its bytes arrive;
+    later chunks wait in memory until every earlier chunk has finished.
+    Returns the number of bytes written. The first failure (in chunk order) is re-raised.
+    """
+    blocks = [queue.Queue() for _ in range(count)]
+
+    def job(idx):
+        try:
+            produce(idx, lambda data: blocks[idx].put(("data", data)))
+            blocks[idx].put(("done", None))
+        except BaseException as e:
+            blocks[idx].put(("error", e))
+
+    max_workers = max(1, min(int(max_workers or 1), count))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=label)
+    total_bytes = 0
+    try:
+        for idx in range(count):
+            submit_in_context(executor, job, idx)
+        for idx in range(count):
+            while True:
+                kind, payload = blocks[idx].get()
+                if kind == "error":
+                    raise payload
+                if kind == "done":
+                    break
+                for sink in sinks:
+                    sink.write(payload)
+                total_bytes += len(payload)
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+    return total_bytes
+
+
+def stream_voice_audio(text, voice_id, output_path, eleven_config=None, upload_blob_name=None):
+    """
+    Streaming variant of generate_voice_audio. Chunks are synthesized concurrently and their
+    audio is written straight into output_path in chunk order; with upload_blob_name the same
+    bytes feed a resumable GCS upload while synthesis is still running. ElevenLabs MP3 output
+    is a bare constant-bitrate frame stream, so chunk bytes concatenate without a merge.
+    
+    Returns:
+        tuple: (output_path, public URL or None when nothing was uploaded). Falls back to
+        generate_voice_audio when the SDK fails; credit/quota errors raise ValueError.
+    """
+    try:
+        client = get_elevenlabs_client()
+    except ImportError:
+        print("⚠️ ElevenLabs Python client not installed. Falling back to REST API...")
+        return generate_voice_audio_rest(text, voice_id, output_path, eleven_config), None
+
+    chunks = split_text_into_chunks(
+        text,
+        max_length=ELEVENLABS_CHUNK_MAX_CHARS,
+        target_chunks=TTS_CHUNK_TARGET_PARALLELISM,
+        parallelism=ELEVENLABS_MAX_CONCURRENCY,
+    )
+    voice_settings = build_elevenlabs_voice_settings(eleven_config)
+    model_id = get_elevenlabs_model_id(eleven_config)
+    endpoint_name = "stream" if ELEVENLABS_TTS_ENDPOINT == "stream" else "convert"
+    endpoint = getattr(client.text_to_speech, endpoint_name)
+    print(f"[DEBUG] stream_voice_audio: Streaming {len(chunks)} chunk(s) via {endpoint_name} into {output_path} (model: {model_id}, voice_id: {voice_id})")
+
+    def produce(idx, emit):
+        chunk_text = chunks[idx]
+        previous_text = chunks[idx - 1] if idx > 0 else None
+        next_text = chunks[idx + 1] if idx + 1 < len(chunks) else None
+        cache_key = build_elevenlabs_cache_key(chunk_text, voice_id, eleven_config, previous_text, next_text)
+        cached_audio = fetch_tts_cache_bytes(cache_key, ".mp3")
+        if cached_audio is not None:
+            emit(cached_audio)
+            return
+
+        def request_and_stream():
+            # Concurrency-limit rejections arrive before the first byte, so a retry never re-emits audio
+            start_time = time.time()
+            parts = []
+            first_byte_time = None
+            # Timed inside the retry so slot waits and backoff sleeps are not counted as network time
+            with network_timer():
+                audio_stream = endpoint(
+                    **build_elevenlabs_convert_kwargs(
+                        chunk_text,
+                        voice_id,
+                        voice_settings,
+                        model_id,
+                        previous_text=previous_text,
+                        next_text=next_text,
+                    )
+                )
+                for audio_bytes in audio_stream:
+                    if not audio_bytes:
+                        continue
+                    if first_byte_time is None:
+                        first_byte_time = time.time()
+                    parts.append(audio_bytes)
+                    emit(audio_bytes)
+            audio = b"".join(parts)
+            ttfb = first_byte_time - start_time if first_byte_time is not None else None
+            record_tts_chunk_metrics("elevenlabs", endpoint_name, idx, ttfb, time.time() - start_time, len(audio))
+            return audio
+
+        try:
+            audio = call_with_elevenlabs_concurrency_retry(request_and_stream, f"chunk {idx+1}")
+            record_step_metric("tts_chars", len(chunk_text))
+            record_step_metric("bytes_in", len(audio))
+        except Exception:
+            print(f"[ERROR] Failed on chunk {idx+1}/{len(chunks)}. First 100 chars: {chunk_text[:100]}")
+            raise
+        store_tts_cache(cache_key, audio)
+
+    upload_writer = None
+    upload_finished = False
+    try:
+        start_time = time.time()
+        with open(output_path, 'wb') as f:
+            sinks = [f]
+            if upload_blob_name:
+                gcs_client = get_gcs_client()
+                if gcs_client:
+                    blob = gcs_client.bucket(GCS_BUCKET_NAME).blob(upload_blob_name)
+                    upload_writer = blob.open("wb", chunk_size=GCS_UPLOAD_CHUNK_SIZE, content_type="audio/mpeg")
+                    sinks.append(upload_writer)
+            total_bytes = write_chunk_streams_in_order(
+                len(chunks), produce, sinks, ELEVENLABS_MAX_CONCURRENCY, label="elevenlabs-stream"
+            )
+        file_link = None
+        if upload_writer:
+            # Closing finalizes the resumable upload; a failed run terminates it below instead
+            with network_timer():
+                upload_writer.close()
+            upload_finished = True
+            record_step_metric("bytes_out", total_bytes)
+            record_latest_gcs_upload(upload_blob_name)
+            file_link = f"https://storage.googleapis.com/{GCS_BUCKET_NAME}/{upload_blob_name}"
+        print(f"✅ Audio streamed successfully: {output_path} ({total_bytes} bytes in {time.time() - start_time:.2f}s)")
+        return output_path, file_link
+    except Exception as e:
+        if upload_writer is not None and not upload_finished:
+            # Cancel the resumable session; closing (or garbage-collecting) the writer would
+            # publish a truncated MP3 at upload_blob_name
+            try:
+                upload_writer.terminate()
+            except Exception as abort_error:
+                print(f"⚠️ Could not cancel GCS upload of {upload_blob_name}: {abort_error}")
+        error_msg = str(e)
+        if is_elevenlabs_credit_quota_error(error_msg, getattr(e, 'status_code', None)):
+            raise ValueError(f"ElevenLabs credit/quota error: {error_msg}")
+        print(f"❌ ElevenLabs streaming error: {e}")
+        traceback.print_exc()
+        print("[DEBUG] Falling back to generate_voice_audio...")
+        return generate_voice_audio(text, voice_id, output_path, eleven_config), None
+
+
 def generate_voice_audio_rest(text, voice_id, output_path, eleven_config=None):
     """Fallback REST API method for Eleven Labs. Handles chunking and merging."""
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
@@ -3000,11 +4840,22 @@ def generate_voice_audio_rest(text, voice_id, output_path, eleven_config=None):
     }
     
     def _single_chunk(chunk_text, temp_path, previous_text=None, next_text=None):
+        cache_key = build_elevenlabs_cache_key(chunk_text, voice_id, eleven_config, previous_text, next_text)
+        if fetch_tts_cache(cache_key, temp_path):
+            return temp_path
         payload = build_elevenlabs_tts_payload(chunk_text, eleven_config, previous_text, next_text)
         try:
             print(f"[DEBUG] ElevenLabs API payload: {json.dumps(payload)[:500]}{'...' if len(json.dumps(payload)) > 500 else ''}")
             start_time = time.time()
-            response = requests.post(url, json=payload, headers=headers, timeout=180)
+            for attempt in range(ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS + 1):
+                with _elevenlabs_request_slots, network_timer():
+                    response = get_http_session().post(url, json=payload, headers=headers, timeout=180)
+                if attempt >= ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS or not is_elevenlabs_concurrency_limit_error(response.text, response.status_code):
+                    break
+                wait_s = min(2 ** attempt, 8)
+                print(f"⚠️ ElevenLabs concurrency limit hit (status {response.status_code}). Retrying in {wait_s}s ({attempt+1}/{ELEVENLABS_CONCURRENCY_RETRY_ATTEMPTS})...")
+                record_step_metric("retries")
+                time.sleep(wait_s)
             elapsed = time.time() - start_time
             print(f"[DEBUG] ElevenLabs API call took {elapsed:.2f} seconds")
             print(f"[DEBUG] ElevenLabs REST API response status: {response.status_code}")
@@ -3012,6 +4863,9 @@ def generate_voice_audio_rest(text, voice_id, output_path, eleven_config=None):
             if response.status_code == 200:
                 with open(temp_path, 'wb') as f:
                     f.write(response.content)
+                record_step_metric("tts_chars", len(chunk_text))
+                record_step_metric("bytes_in", len(response.content))
+                store_tts_cache(cache_key, temp_path)
                 print(f"✅ Audio chunk received and saved: {temp_path}")
                 return temp_path
             else:
@@ -3063,24 +4917,43 @@ def generate_voice_audio_rest(text, voice_id, output_path, eleven_config=None):
                 raise ValueError(f"ElevenLabs credit/quota error: {e}")
             return None
 
-    chunks = split_text_into_chunks(text, max_length=ELEVENLABS_CHUNK_MAX_CHARS)
+    chunks = split_text_into_chunks(
+        text,
+        max_length=ELEVENLABS_CHUNK_MAX_CHARS,
+        target_chunks=TTS_CHUNK_TARGET_PARALLELISM,
+        parallelism=ELEVENLABS_MAX_CONCURRENCY,
+    )
     if len(chunks) == 1:
         return _single_chunk(chunks[0], output_path)
     else:
-        temp_audio_paths = []
-        for idx, chunk_text in enumerate(chunks):
-            temp_path = MP3_OUTPUT_DIR / f"temp_audio_{int(time.time())}_{os.getpid()}_chunk_{idx+1}.mp3"
+        run_stamp = f"{int(time.time())}_{os.getpid()}"
+        temp_paths = [MP3_OUTPUT_DIR / f"temp_audio_{run_stamp}_chunk_{idx+1}.mp3" for idx in range(len(chunks))]
+
+        def synthesize_chunk(idx):
             previous_text = chunks[idx - 1] if idx > 0 else None
             next_text = chunks[idx + 1] if idx + 1 < len(chunks) else None
-            result = _single_chunk(chunk_text, temp_path, previous_text, next_text)
-            if result:
-                temp_audio_paths.append(result)
-            else:
-                # Clean up any previous temp files
-                for p in temp_audio_paths:
-                    try: os.remove(p)
-                    except: pass
-                return None
+            result = _single_chunk(chunks[idx], temp_paths[idx], previous_text, next_text)
+            if not result:
+                raise RuntimeError(f"ElevenLabs REST API failed on chunk {idx+1}/{len(chunks)}")
+            return result
+
+        try:
+            temp_audio_paths = run_chunk_jobs_in_order(
+                synthesize_chunk, len(chunks), ELEVENLABS_MAX_CONCURRENCY, label="elevenlabs-rest-chunk"
+            )
+        except ValueError:
+            # Re-raise credit/quota errors after cleaning up any chunks that finished
+            for p in temp_paths:
+                try: os.remove(p)
+                except: pass
+            raise
+        except Exception as e:
+            print(f"❌ {e}")
+            # Clean up any previous temp files
+            for p in temp_paths:
+                try: os.remove(p)
+                except: pass
+            return None
         merged_path = MP3_OUTPUT_DIR / f"merged_audio_{int(time.time())}_{os.getpid()}.mp3"
         print(f"[DEBUG] Merging {len(temp_audio_paths)} chunk files into {merged_path}")
         merge_multiple_audio_files(temp_audio_paths, merged_path)
@@ -3121,34 +4994,15 @@ def generate_google_voice_audio(text, voice_name, output_path):
         if len(chunks) == 1:
             return _generate_single_google_chunk(chunks[0], voice_name, output_path)
         else:
-            # Handle multiple chunks
-            temp_audio_paths = []
+            # Handle multiple chunks: keep each chunk's raw PCM in memory and encode the joined audio once
+            audio_contents = []
             for idx, chunk_text in enumerate(chunks):
-                temp_path = MP3_OUTPUT_DIR / f"temp_google_audio_{int(time.time())}_{os.getpid()}_chunk_{idx+1}.mp3"
                 print(f"[DEBUG] Sending chunk {idx+1}/{len(chunks)} to Google TTS API (length: {len(chunk_text)})")
-                result = _generate_single_google_chunk(chunk_text, voice_name, temp_path)
-                if result:
-                    temp_audio_paths.append(result)
-                else:
-                    # Clean up any previous temp files
-                    for p in temp_audio_paths:
-                        try: 
-                            os.remove(p)
-                        except: 
-                            pass
-                    return None
+                audio_contents.append(_synthesize_google_chunk(chunk_text, voice_name))
             
-            # Merge all chunks
             merged_path = MP3_OUTPUT_DIR / f"merged_google_audio_{int(time.time())}_{os.getpid()}.mp3"
-            print(f"[DEBUG] Merging {len(temp_audio_paths)} Google TTS chunk files into {merged_path}")
-            merge_multiple_audio_files(temp_audio_paths, merged_path)
-            
-            # Clean up temp files
-            for p in temp_audio_paths:
-                try: 
-                    os.remove(p)
-                except: 
-                    pass
+            print(f"[DEBUG] Joining {len(audio_contents)} Google TTS chunks into {merged_path}")
+            write_google_tts_audio_content(audio_contents, merged_path)
             
             if merged_path and os.path.exists(merged_path):
                 print(f"✅ Google TTS audio generated and merged successfully: {merged_path}")
@@ -3181,9 +5035,62 @@ def build_google_chirp3_audio_config(include_volume_gain=True, include_speaking_
     return texttospeech.AudioConfig(**audio_config_kwargs)
 
 
+def read_wav_pcm(wav_bytes):
+    """
+    Locate the PCM samples in a RIFF/WAVE buffer without copying them.
+    Returns ((channels, sample_width, frame_rate), memoryview of the data chunk).
+    """
+    view = memoryview(wav_bytes)
+    if len(view) < 12 or bytes(view[0:4]) != b"RIFF" or bytes(view[8:12]) != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE buffer")
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id = bytes(view[pos:pos + 4])
+        chunk_size = int.from_bytes(view[pos + 4:pos + 8], "little")
+        body_start = pos + 8
+        if chunk_id == b"fmt ":
+            audio_format = int.from_bytes(view[body_start:body_start + 2], "little")
+            if audio_format != 1:
+                raise ValueError(f"Unsupported WAV format {audio_format} (expected PCM)")
+            channels = int.from_bytes(view[body_start + 2:body_start + 4], "little")
+            frame_rate = int.from_bytes(view[body_start + 4:body_start + 8], "little")
+            bits_per_sample = int.from_bytes(view[body_start + 14:body_start + 16], "little")
+            fmt = (channels, bits_per_sample // 8, frame_rate)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV data chunk before fmt chunk")
+            # Streaming encoders may leave the size as a placeholder; trust the buffer length
+            body_end = min(body_start + chunk_size, len(view))
+            frame_size = fmt[0] * fmt[1]
+            body_end -= (body_end - body_start) % frame_size
+            return fmt, view[body_start:body_end]
+        pos = body_start + chunk_size + (chunk_size & 1)
+    raise ValueError("WAV buffer has no data chunk")
+
+
+def join_wav_pcm(wav_buffers):
+    """Concatenate the PCM samples of WAV buffers that share one format. Returns (format, bytes)."""
+    fmt = None
+    segments = []
+    for idx, wav_bytes in enumerate(wav_buffers):
+        chunk_fmt, pcm = read_wav_pcm(wav_bytes)
+        if fmt is None:
+            fmt = chunk_fmt
+        elif chunk_fmt != fmt:
+            raise ValueError(f"WAV chunk {idx+1} format {chunk_fmt} does not match {fmt}")
+        segments.append(pcm)
+    # The only copy of the samples: straight from the response buffers into the joined buffer
+    return fmt, b"".join(segments)
+
+
 def write_google_tts_audio_content(audio_content, output_path):
+    """Write one Google TTS response, or a list of chunk responses joined in order, to output_path."""
+    audio_contents = audio_content if isinstance(audio_content, (list, tuple)) else [audio_content]
     if GOOGLE_CHIRP3_AUDIO_SETTINGS["audio_encoding"] == texttospeech.AudioEncoding.LINEAR16:
-        audio = AudioSegment.from_file(io.BytesIO(audio_content), format="wav")
+        (channels, sample_width, frame_rate), pcm = join_wav_pcm(audio_contents)
+        audio = AudioSegment(data=pcm, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+        # The single encode of the whole step
         audio.export(
             output_path,
             format="mp3",
@@ -3191,127 +5098,147 @@ def write_google_tts_audio_content(audio_content, output_path):
         )
     else:
         with open(output_path, "wb") as out:
-            out.write(audio_content)
+            for content in audio_contents:
+                out.write(content)
     return output_path
 
 
 def _generate_single_google_chunk(text, voice_name, output_path):
     """Generate a single audio chunk using Google TTS."""
     try:
-        full_voice_name = f"en-US-Chirp3-HD-{voice_name}"
-        
-        # MOJIBAKE CHECK BEFORE GOOGLE TTS
-        print(f"🔍 _generate_single_google_chunk: Checking text before TTS")
-        tts_text_sample = text[:100]
-        print(f"🔍 TTS input text sample: {tts_text_sample}")
-        
-        mojibake_patterns = ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦', '\u00e2\u0080\u0099', '\u00e2\u0080\u009c']
-        found_tts_mojibake = [pattern for pattern in mojibake_patterns if pattern in text]
+        write_google_tts_audio_content(_synthesize_google_chunk(text, voice_name), output_path)
+        print(f"✅ Google TTS audio chunk saved: {output_path}")
+        return output_path
         
-        if found_tts_mojibake:
-            print(f"⚠️ CRITICAL: Text being sent to Google TTS contains mojibake: {found_tts_mojibake}")
-            print(f"🔧 Applying emergency cleaning before TTS...")
-            
-            # Emergency cleaning
-            text = fix_text_encoding(text)
-            text = force_clean_mojibake(text)
-            
-            # Additional aggressive cleaning
-            for pattern in ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']:
-                if pattern in text:
-                    if pattern == 'â€™':
-                        text = text.replace(pattern, "'")
-                    elif pattern == 'â€':
-                        text = text.replace(pattern, '"')
-                    elif pattern == 'â€œ':
-                        text = text.replace(pattern, '"')
-                    elif pattern == 'â€"':
-                        text = text.replace(pattern, '—')
-                    elif pattern == 'â€¦':
-                        text = text.replace(pattern, '...')
-            
-            # Verify and log
-            remaining_tts_mojibake = [pattern for pattern in mojibake_patterns if pattern in text]
-            if remaining_tts_mojibake:
-                print(f"⚠️ STILL HAS MOJIBAKE FOR TTS: {remaining_tts_mojibake}")
-            else:
-                print("✅ TTS text cleaned successfully")
-                
-            cleaned_tts_sample = text[:100]
-            print(f"🔧 Cleaned TTS text sample: {cleaned_tts_sample}")
-        else:
-            print("✅ TTS text is clean - proceeding with generation")
+    except Exception as e:
+        print(f"❌ Google TTS single chunk error: {e}")
+        traceback.print_exc()
+        return None
+
+
+def _synthesize_google_chunk(text, voice_name):
+    """Synthesize one chunk with Google TTS and return the raw audio_content (a WAV buffer for LINEAR16)."""
+    full_voice_name = f"en-US-Chirp3-HD-{voice_name}"
+    
+    # MOJIBAKE CHECK BEFORE GOOGLE TTS
+    print(f"🔍 _synthesize_google_chunk: Checking text before TTS")
+    tts_text_sample = text[:100]
+    print(f"🔍 TTS input text sample: {tts_text_sample}")
+    
+    mojibake_patterns = ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦', '\u00e2\u0080\u0099', '\u00e2\u0080\u009c']
+    found_tts_mojibake = [pattern for pattern in mojibake_patterns if pattern in text]
+    
+    if found_tts_mojibake:
+        print(f"⚠️ CRITICAL: Text being sent to Google TTS contains mojibake: {found_tts_mojibake}")
+        print(f"🔧 Applying emergency cleaning before TTS...")
         
-        # Set up the synthesis input
-        synthesis_input = texttospeech.SynthesisInput(text=text)
+        # Emergency cleaning
+        text = clean_text(text)
         
-        # Set up the voice parameters
-        voice = texttospeech.VoiceSelectionParams(
-            language_code="en-US",
-            name=full_voice_name
-        )
+        # Additional aggressive cleaning
+        for pattern in ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']:
+            if pattern in text:
+                if pattern == 'â€™':
+                    text = text.replace(pattern, "'")
+                elif pattern == 'â€':
+                    text = text.replace(pattern, '"')
+                elif pattern == 'â€œ':
+                    text = text.replace(pattern, '"')
+                elif pattern == 'â€"':
+                    text = text.replace(pattern, '—')
+                elif pattern == 'â€¦':
+                    text = text.replace(pattern, '...')
         
-        # Chirp voices can reject some audio params; try highest-fidelity first, then degrade gracefully.
-        audio_config_variants = [
-            (
-                "linear16_rate_volume_effects",
-                build_google_chirp3_audio_config()
-            ),
-            (
-                "linear16_rate_only",
-                build_google_chirp3_audio_config(include_volume_gain=False, include_effects_profile=False)
-            ),
-            (
-                "linear16_natural_rate",
-                build_google_chirp3_audio_config(
-                    include_volume_gain=False,
-                    include_speaking_rate=False,
-                    include_effects_profile=False
-                )
+        # Verify and log
+        remaining_tts_mojibake = [pattern for pattern in mojibake_patterns if pattern in text]
+        if remaining_tts_mojibake:
+            print(f"⚠️ STILL HAS MOJIBAKE FOR TTS: {remaining_tts_mojibake}")
+        else:
+            print("✅ TTS text cleaned successfully")
+            
+        cleaned_tts_sample = text[:100]
+        print(f"🔧 Cleaned TTS text sample: {cleaned_tts_sample}")
+    else:
+        print("✅ TTS text is clean - proceeding with generation")
+    
+    cache_key = build_tts_cache_key(
+        "google_chirp3",
+        text=text,
+        voice_name=full_voice_name,
+        audio_settings=GOOGLE_CHIRP3_AUDIO_SETTINGS,
+    )
+    # Cache the raw response so a hit still skips every codec pass
+    cache_suffix = ".wav" if GOOGLE_CHIRP3_AUDIO_SETTINGS["audio_encoding"] == texttospeech.AudioEncoding.LINEAR16 else ".mp3"
+    cached_content = fetch_tts_cache_bytes(cache_key, cache_suffix)
+    if cached_content is not None:
+        return cached_content
+    
+    # Set up the synthesis input
+    synthesis_input = texttospeech.SynthesisInput(text=text)
+    
+    # Set up the voice parameters
+    voice = texttospeech.VoiceSelectionParams(
+        language_code="en-US",
+        name=full_voice_name
+    )
+    
+    # Chirp voices can reject some audio params; try highest-fidelity first, then degrade gracefully.
+    audio_config_variants = [
+        (
+            "linear16_rate_volume_effects",
+            build_google_chirp3_audio_config()
+        ),
+        (
+            "linear16_rate_only",
+            build_google_chirp3_audio_config(include_volume_gain=False, include_effects_profile=False)
+        ),
+        (
+            "linear16_natural_rate",
+            build_google_chirp3_audio_config(
+                include_volume_gain=False,
+                include_speaking_rate=False,
+                include_effects_profile=False
             )
-        ]
-        
-        start_time = time.time()
-        print(f"[DEBUG] Calling Google TTS API with voice: {full_voice_name}")
-        
-        response = None
-        last_error = None
-        for config_name, audio_config in audio_config_variants:
-            try:
-                if config_name != "linear16_rate_volume_effects":
-                    print(f"[DEBUG] Retrying Google TTS with fallback config: {config_name}")
+        )
+    ]
+    
+    start_time = time.time()
+    print(f"[DEBUG] Calling Google TTS API with voice: {full_voice_name}")
+    
+    response = None
+    last_error = None
+    for config_name, audio_config in audio_config_variants:
+        try:
+            if config_name != "linear16_rate_volume_effects":
+                print(f"[DEBUG] Retrying Google TTS with fallback config: {config_name}")
+                record_step_metric("retries")
+            with network_timer():
                 response = google_tts_client.synthesize_speech(
                     input=synthesis_input, voice=voice, audio_config=audio_config
                 )
-                break
-            except Exception as call_error:
-                last_error = call_error
-                error_text = str(call_error).lower()
-                if "does not support" in error_text or "invalid argument" in error_text:
-                    continue
-                raise
-        
-        if response is None:
-            raise last_error if last_error else RuntimeError("Google TTS failed without a specific error")
-        
-        elapsed = time.time() - start_time
-        print(f"[DEBUG] Google TTS API call returned in {elapsed:.3f}s")
-        
-        write_google_tts_audio_content(response.audio_content, output_path)
-            
-        print(f"✅ Google TTS audio chunk saved: {output_path}")
-        return output_path
-        
-    except Exception as e:
-        print(f"❌ Google TTS single chunk error: {e}")
-        traceback.print_exc()
-        return None
+            break
+        except Exception as call_error:
+            last_error = call_error
+            error_text = str(call_error).lower()
+            if "does not support" in error_text or "invalid argument" in error_text:
+                continue
+            raise
+    
+    if response is None:
+        raise last_error if last_error else RuntimeError("Google TTS failed without a specific error")
+    
+    elapsed = time.time() - start_time
+    print(f"[DEBUG] Google TTS API call returned in {elapsed:.3f}s")
+    record_step_metric("tts_chars", len(text))
+    record_step_metric("bytes_in", len(response.audio_content))
+    
+    store_tts_cache(cache_key, response.audio_content, cache_suffix)
+    return response.audio_content
 
 
 def download_latest_text_file_from_drive_oauth(folder_id):
     """Downloads the latest text file from a Google Drive folder using OAuth."""
     from googleapiclient.http import MediaIoBaseDownload
-    import io
     
     try:
         drive_service = get_drive_service_oauth()
@@ -3377,8 +5304,225 @@ def upload_audio_to_drive_oauth(folder_id, filename, audio_file_path):
         print(f"❌ Error uploading audio to Google Drive: {e}")
         return None
 
+# -----------------------------------------
+# MP3 FRAME-LEVEL CONCATENATION
+# -----------------------------------------
+# Matching MP3 inputs are joined by copying their audio frames byte-for-byte,
+# which avoids a second lossy encode and never holds decoded PCM in memory.
+# Set MP3_FRAME_CONCAT=0 to always decode/re-encode with pydub instead.
+MP3_FRAME_CONCAT_ENABLED = get_env_int("MP3_FRAME_CONCAT", 1) != 0
+MP3_COPY_BLOCK_SIZE = 1024 * 1024
+MP3_SYNC_SEARCH_LIMIT = 4096
+
+# Bitrate tables (kbps) keyed by (is_mpeg1, layer), indexed by the header's bitrate index.
+MP3_BITRATES_KBPS = {
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+# Sample rates keyed by the header's version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5).
+MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def parse_mp3_frame_header(header):
+    """Parse a 4-byte MPEG audio frame header. Returns a dict, or None if it is not a usable frame."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version_bits = (header[1] >> 3) & 0x03
+    layer_bits = (header[1] >> 1) & 0x03
+    bitrate_index = (header[2] >> 4) & 0x0F
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        # Reserved version/layer, free-format or bad bitrate, reserved sample rate
+        return None
+    is_mpeg1 = version_bits == 3
+    layer = 4 - layer_bits
+    bitrate = MP3_BITRATES_KBPS[(is_mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version_bits][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    channels = 1 if ((header[3] >> 6) & 0x03) == 3 else 2
+    if layer == 1:
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 3 and not is_mpeg1:
+        frame_length = 72 * bitrate // sample_rate + padding
+    else:
+        frame_length = 144 * bitrate // sample_rate + padding
+    return {
+        "version_bits": version_bits,
+        "layer": layer,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "frame_length": frame_length,
+    }
+
+
+def _is_mp3_info_frame(frame_bytes, frame_info):
+    """Return True if the frame is a Xing/Info/VBRI header frame (metadata only, no audio)."""
+    if frame_info["layer"] != 3:
+        return False
+    if frame_info["version_bits"] == 3:
+        side_info_length = 17 if frame_info["channels"] == 1 else 32
+    else:
+        side_info_length = 9 if frame_info["channels"] == 1 else 17
+    xing_offset = 4 + side_info_length
+    if frame_bytes[xing_offset:xing_offset + 4] in (b"Xing", b"Info"):
+        return True
+    return frame_bytes[36:40] == b"VBRI"
+
+
+def _mp3_tag_bounds(f, file_size):
+    """Return (start, end) byte offsets of the file with ID3v2, ID3v1 and APEv2 tags excluded."""
+    start = 0
+    f.seek(0)
+    header = f.read(10)
+    # ID3v2 tags may be stacked; skip each one (size is syncsafe, optional 10-byte footer)
+    while len(header) == 10 and header[:3] == b"ID3":
+        tag_size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        start += 10 + tag_size + (10 if header[5] & 0x10 else 0)
+        f.seek(start)
+        header = f.read(10)
+
+    end = file_size
+    if end - start >= 128:
+        f.seek(end - 128)
+        if f.read(3) == b"TAG":
+            end -= 128
+    if end - start >= 32:
+        f.seek(end - 32)
+        footer = f.read(32)
+        if footer[:8] == b"APETAGEX":
+            tag_size = int.from_bytes(footer[12:16], "little")
+            flags = int.from_bytes(footer[20:24], "little")
+            end -= tag_size + (32 if flags & 0x80000000 else 0)
+    return start, max(start, end)
+
+
+def scan_mp3_stream(path):
+    """
+    Walk the MPEG frames of an MP3 file without decoding it.
+    Returns the byte range holding audio frames plus the stream format, or None when the
+    file is not a clean MP3 stream (in which case callers fall back to pydub).
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            start, end = _mp3_tag_bounds(f, file_size)
+
+            # Locate the first frame; tolerate a little junk after the tags.
+            f.seek(start)
+            window = f.read(min(MP3_SYNC_SEARCH_LIMIT, end - start))
+            first_frame_offset = None
+            for i in range(max(0, len(window) - 3)):
+                if window[i] == 0xFF and parse_mp3_frame_header(window[i:i + 4]):
+                    first_frame_offset = start + i
+                    break
+            if first_frame_offset is None:
+                return None
+
+            pos = first_frame_offset
+            audio_start = first_frame_offset
+            stream_format = None
+            bitrates = set()
+            frame_count = 0
+            info_frame_checked = False
+            while pos + 4 <= end:
+                f.seek(pos)
+                frame_info = parse_mp3_frame_header(f.read(4))
+                if not frame_info:
+                    return None
+                frame_format = (frame_info["version_bits"], frame_info["layer"], frame_info["sample_rate"], frame_info["channels"])
+                if stream_format is None:
+                    stream_format = frame_format
+                elif frame_format != stream_format:
+                    return None
+                if pos + frame_info["frame_length"] > end:
+                    # Truncated final frame: drop it rather than emit a partial frame
+                    break
+                if not info_frame_checked:
+                    info_frame_checked = True
+                    f.seek(pos)
+                    if _is_mp3_info_frame(f.read(64), frame_info):
+                        audio_start = pos + frame_info["frame_length"]
+                        pos = audio_start
+                        continue
+                bitrates.add(frame_info["bitrate"])
+                frame_count += 1
+                pos += frame_info["frame_length"]
+            if frame_count == 0:
+                return None
+            return {
+                "audio_start": audio_start,
+                "audio_end": pos,
+                "version_bits": stream_format[0],
+                "layer": stream_format[1],
+                "sample_rate": stream_format[2],
+                "channels": stream_format[3],
+                "bitrates": bitrates,
+                "frame_count": frame_count,
+            }
+    except Exception as e:
+        print(f"⚠️ Could not scan MP3 frames in {path}: {e}")
+        return None
+
+
+def concat_mp3_frames(audio_paths, output_path):
+    """
+    Concatenate MP3 files by streaming their audio frames into output_path without transcoding.
+    Only used when every input shares sample rate, channel count and a single constant bitrate.
+    Returns True on success, False when the inputs need the pydub decode/re-encode path.
+    """
+    if not MP3_FRAME_CONCAT_ENABLED or not audio_paths:
+        return False
+
+    start_time = time.time()
+    streams = []
+    for audio_path in audio_paths:
+        stream = scan_mp3_stream(audio_path)
+        if not stream:
+            print(f"[DEBUG] {audio_path} is not a plain MP3 frame stream; using pydub merge")
+            return False
+        streams.append(stream)
+
+    reference = streams[0]
+    for audio_path, stream in zip(audio_paths, streams):
+        if len(stream["bitrates"]) != 1 or stream["bitrates"] != reference["bitrates"]:
+            print(f"[DEBUG] Bitrate mismatch or VBR input ({audio_path}); using pydub merge")
+            return False
+        for key in ("version_bits", "layer", "sample_rate", "channels"):
+            if stream[key] != reference[key]:
+                print(f"[DEBUG] MP3 format mismatch on {key} ({audio_path}); using pydub merge")
+                return False
+
+    total_bytes = 0
+    with open(output_path, 'wb') as out:
+        for audio_path, stream in zip(audio_paths, streams):
+            with open(audio_path, 'rb') as f:
+                f.seek(stream["audio_start"])
+                remaining = stream["audio_end"] - stream["audio_start"]
+                while remaining > 0:
+                    block = f.read(min(MP3_COPY_BLOCK_SIZE, remaining))
+                    if not block:
+                        break
+                    out.write(block)
+                    remaining -= len(block)
+                    total_bytes += len(block)
+            print(f"  - Added frames: {audio_path} ({stream['frame_count']} frames)")
+
+    elapsed = time.time() - start_time
+    print(f"[DEBUG] Frame-level MP3 concat: {len(audio_paths)} files, {total_bytes} bytes, "
+          f"{reference['sample_rate']} Hz, {reference['channels']} ch, {next(iter(reference['bitrates'])) // 1000} kbps in {elapsed:.3f}s")
+    return True
+
+
 def merge_audio(intro_path, main_path, outro_path, final_path):
     try:
+        if concat_mp3_frames([intro_path, main_path, outro_path], final_path):
+            print(f"✅ Merged audio saved: {final_path}")
+            return
         intro = AudioSegment.from_file(intro_path)
         main = AudioSegment.from_file(main_path)
         outro = AudioSegment.from_file(outro_path)
@@ -3391,7 +5535,6 @@ def merge_audio(intro_path, main_path, outro_path, final_path):
 def download_latest_mp3_from_drive_oauth(folder_id):
     """Downloads the latest MP3 file from a Google Drive folder using OAuth."""
     from googleapiclient.http import MediaIoBaseDownload
-    import io
     
     try:
         drive_service = get_drive_service_oauth()
@@ -3427,7 +5570,7 @@ def download_latest_mp3_from_drive_oauth(folder_id):
                 print(f"  Download {int(status.progress() * 100)}%")
         
         # Save to temporary file
-        temp_path = MP3_OUTPUT_DIR / f"temp_{file_name}"
+        temp_path = temp_download_path(file_name)
         with open(temp_path, 'wb') as f:
             f.write(fh.getvalue())
         
@@ -3441,7 +5584,6 @@ def download_latest_mp3_from_drive_oauth(folder_id):
 def download_mp3_file_from_drive_oauth(file_url):
     """Downloads a specific MP3 file from Google Drive using its URL with OAuth."""
     from googleapiclient.http import MediaIoBaseDownload
-    import io
     
     try:
         # Extract file ID from Google Drive URL
@@ -3455,26 +5597,31 @@ def download_mp3_file_from_drive_oauth(file_url):
         drive_service = get_drive_service_oauth()
         
         # Get file metadata
-        file_metadata = drive_service.files().get(fileId=file_id, fields='name').execute()
+        file_metadata = drive_service.files().get(fileId=file_id, fields='name,md5Checksum,headRevisionId').execute()
         file_name = file_metadata.get('name', 'unknown_file.mp3')
         
-        print(f"📥 Downloading MP3 file: {file_name}")
-        
-        # Download the file content
-        request = drive_service.files().get_media(fileId=file_id)
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-        
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
-            if status:
-                print(f"  Download {int(status.progress() * 100)}%")
+        def download_content(path):
+            print(f"📥 Downloading MP3 file: {file_name}")
+            
+            # Download the file content
+            request = drive_service.files().get_media(fileId=file_id)
+            with open(path, 'wb') as fh:
+                downloader = MediaIoBaseDownload(fh, request)
+                
+                done = False
+                while done is False:
+                    status, done = downloader.next_chunk()
+                    if status:
+                        print(f"  Download {int(status.progress() * 100)}%")
         
         # Save to temporary file
-        temp_path = MP3_OUTPUT_DIR / f"temp_{file_name}"
-        with open(temp_path, 'wb') as f:
-            f.write(fh.getvalue())
+        temp_path = temp_download_path(file_name)
+        if ASSET_CACHE_ENABLED:
+            validator = file_metadata.get('md5Checksum') or file_metadata.get('headRevisionId')
+            cached_path = cached_drive_asset(file_id, file_name, validator, download_content)
+            shutil.copyfile(cached_path, temp_path)
+        else:
+            download_content(temp_path)
         
         print(f"✅ Downloaded MP3 file: {temp_path}")
         return temp_path
@@ -3492,6 +5639,11 @@ def merge_multiple_audio_files(audio_paths, output_path):
         
         print(f"🔗 Merging {len(audio_paths)} audio files...")
         
+        # Matching MP3s are joined frame-by-frame without a second lossy encode
+        if concat_mp3_frames(audio_paths, output_path):
+            print(f"✅ Merged audio saved: {output_path}")
+            return output_path
+        
         # Load the first audio file
         combined = AudioSegment.from_file(audio_paths[0])
         print(f"  - Loaded: {audio_paths[0]}")
@@ -3511,59 +5663,108 @@ def merge_multiple_audio_files(audio_paths, output_path):
         print(f"❌ Error merging audio files: {e}")
         return None
 
+def build_voice_audio_filename(timestamp, workflow_id, step_number, eleven_config, all_outputs, title_resp_idx):
+    """File name for a generated voice step: the extracted title when requested, else workflow/step/voice."""
+    voice_name_for_filename = eleven_config.get('Voice', 'Unknown') if eleven_config else 'Unknown'
+    if title_resp_idx is not None and 0 <= title_resp_idx < len(all_outputs):
+        title_text = all_outputs[title_resp_idx]
+        extracted_title = extract_title_from_text(title_text)
+        clean_title = clean_filename(extracted_title)
+        if clean_title:
+            return f'{timestamp}_{clean_title}.mp3'
+    return f'{timestamp}_workflow_{workflow_id}_step_{step_number}_{voice_name_for_filename}.mp3'
+
+# Source downloads for an audio merge step run side by side on the shared GCS client
+MERGE_DOWNLOAD_MAX_WORKERS = get_env_int("MERGE_DOWNLOAD_MAX_WORKERS", 4)
+
+def download_merge_source(loc_id, location):
+    """Download one merge source. Returns (audio_path, error_msg)."""
+    if not location:
+        return None, f"Location ID {loc_id} not found in Locations sheet."
+    
+    location_url = location['Location']
+    location_type = location['Type']
+    
+    if location_type == 'File':
+        # Download specific file
+        audio_path = download_mp3_file_from_gcs(location_url)
+    elif location_type == 'mp3':
+        # For GCS: Use the folder prefix directly to get the latest mp3
+        folder_prefix = location_url  # Already set to e.g. 'eleven-labs/'
+        audio_path = download_latest_mp3_from_gcs(folder_prefix)
+        if not audio_path:
+            return None, f"Failed to download latest mp3 from folder {folder_prefix} for location {loc_id}"
+    else:
+        return None, f"Location {loc_id} is not a file or mp3 type"
+    
+    if not audio_path:
+        return None, f"Failed to download audio from location {loc_id}"
+    return audio_path, None
+
+def download_merge_sources(source_location_ids, get_location, max_workers=None):
+    """
+    Download every source of an audio merge step concurrently.
+    Returns (audio_paths, download_errors), both in source location order. A location
+    listed more than once is downloaded once and reused.
+    """
+    unique_ids = list(dict.fromkeys(source_location_ids))
+    workers = max(1, min(max_workers or MERGE_DOWNLOAD_MAX_WORKERS, len(unique_ids)))
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {loc_id: submit_in_context(executor, download_merge_source, loc_id, get_location(loc_id)) for loc_id in unique_ids}
+        results = {loc_id: future.result() for loc_id, future in futures.items()}
+    print(f"    > Downloaded {len(unique_ids)} merge source(s) with {workers} worker(s) in {time.time() - start_time:.2f}s")
+    
+    audio_paths = []
+    download_errors = []
+    for loc_id in source_location_ids:
+        audio_path, error_msg = results[loc_id]
+        if audio_path:
+            audio_paths.append(audio_path)
+        else:
+            download_errors.append(error_msg)
+    return audio_paths, list(dict.fromkeys(download_errors))
+
 # -----------------------------------------
 # MAIN EXECUTION
 # -----------------------------------------
 if __name__ == '__main__':
     print("🚀 Starting AI Workflow Pipeline")
 
-    dfs = load_workbook()
-    if not dfs:
+    workbook = load_workbook()
+    if not workbook:
         print("❌ Failed to load or create workbook. Please check file permissions or configuration.")
         exit(1)
 
     print("✅ Workbook loaded. Starting workflow processing...")
-    gc = connect_to_google_sheet_with_retry()
-    spreadsheet = gc.open(GOOGLE_SHEET_NAME)
-    workflow_ws = spreadsheet.worksheet("Workflows")
-    outputs_ws = spreadsheet.worksheet("Outputs")
-    requests_ws = spreadsheet.worksheet("Requests")
-    prompts_ws = spreadsheet.worksheet("Prompts")
-    models_ws = spreadsheet.worksheet("Models")
-    workflow_steps_ws = spreadsheet.worksheet("Workflow Steps")
-    locations_ws = spreadsheet.worksheet("Locations")
-
-    # Try to load Eleven tab (may not exist in older sheets)
-    eleven_ws = None
-    try:
-        eleven_ws = spreadsheet.worksheet("Eleven")
-    except Exception:
-        pass  # If the Eleven tab doesn't exist, skip it
-
-    workflow_df = pd.DataFrame(workflow_ws.get_all_records())
-    outputs_df = pd.DataFrame(outputs_ws.get_all_records())
-    requests_df = pd.DataFrame(requests_ws.get_all_records())
-    prompts_df = pd.DataFrame(prompts_ws.get_all_records())
-    models_df = pd.DataFrame(models_ws.get_all_records())
-    workflow_steps_df = pd.DataFrame(workflow_steps_ws.get_all_records())
-    locations_df = pd.DataFrame(locations_ws.get_all_records()) if locations_ws is not None else pd.DataFrame(columns=["Location ID", "Location Description", "Type", "File Or Folder", "Location", "Latest"])
-    eleven_df = pd.DataFrame(eleven_ws.get_all_records()) if eleven_ws is not None else pd.DataFrame(columns=["Eleven ID", "Voice", "Model", "Stability", "Similarity Boost", "Style", "Speed"])
-
-    logs_ws = None
-    try:
-        logs_ws = spreadsheet.worksheet("Logs")
-    except Exception:
-        pass  # If the Logs tab doesn't exist, skip logging
-
-    logs_df = pd.DataFrame(logs_ws.get_all_records()) if logs_ws else pd.DataFrame(columns=["Log ID", "Log Timestamp", "Log Message"])
-
-    def _excel_col_letter(col_idx_1_based):
-        result = ''
-        n = int(col_idx_1_based)
-        while n > 0:
-            n, remainder = divmod(n - 1, 26)
-            result = chr(65 + remainder) + result
-        return result
+    spreadsheet = workbook['spreadsheet']
+    worksheets_by_title = workbook['worksheets']
+
+    def require_worksheet(title):
+        ws = worksheets_by_title.get(title)
+        if ws is None:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return ws
+
+    workflow_ws = require_worksheet("Workflows")
+    outputs_ws = require_worksheet("Outputs")
+    requests_ws = worksheets_by_title.get("Requests")
+    prompts_ws = require_worksheet("Prompts")
+    models_ws = require_worksheet("Models")
+    workflow_steps_ws = require_worksheet("Workflow Steps")
+    step_metrics_in_sheet = ensure_step_metric_headers(workflow_steps_ws)
+    locations_ws = require_worksheet("Locations")
+    # Eleven and Logs tabs may not exist in older sheets
+    eleven_ws = worksheets_by_title.get("Eleven")
+    logs_ws = worksheets_by_title.get("Logs")
+
+    # Everything below reads from the shared snapshot loaded by load_workbook
+    workflow_df = workbook_frame("Workflows")
+    prompts_df = workbook_frame("Prompts")
+    models_df = workbook_frame("Models")
+    locations_df = workbook_frame("Locations")
+    eleven_df = workbook_frame("Eleven")
+    outputs_df = workbook_frame("Outputs")
 
     def sync_script_prompt_tuning_to_prompts_tab(prompts_ws_obj, prompts_dataframe):
         """
@@ -3578,9 +5779,8 @@ if __name__ == '__main__':
             return prompts_dataframe
 
         prompt_desc_col_idx = list(prompts_dataframe.columns).index("Prompt Description") + 1
-        prompt_desc_col_letter = _excel_col_letter(prompt_desc_col_idx)
         target_prompt_ids = {"4"}
-        updates_applied = 0
+        current_descriptions = [[desc] for desc in prompts_dataframe["Prompt Description"].tolist()]
 
         for df_idx, row in prompts_dataframe.iterrows():
             prompt_id = str(row.get("Prompt ID", "")).strip()
@@ -3599,91 +5799,80 @@ if __name__ == '__main__':
             ).strip()
             updated_desc = f"{cleaned_desc}\n\n{OPUS47_SCRIPT_TUNING_APPENDIX}".strip()
             prompts_dataframe.at[df_idx, "Prompt Description"] = updated_desc
-            sheet_row_number = int(df_idx) + 2  # +1 for header, +1 for 1-based indexing
-            cell_ref = f"{prompt_desc_col_letter}{sheet_row_number}"
-            try:
-                prompts_ws_obj.update(cell_ref, [[updated_desc]])
-                updates_applied += 1
-            except Exception as e:
-                print(f"⚠️ Could not update Prompts tab cell {cell_ref} for Prompt ID {prompt_id}: {e}")
+
+        # Row 2 onwards of the description column; only changed prompts are queued
+        desired_descriptions = [[desc] for desc in prompts_dataframe["Prompt Description"].tolist()]
+        try:
+            updates_applied = queue_sheet_diff(
+                prompts_ws_obj, current_descriptions, desired_descriptions, start_row=2, start_col=prompt_desc_col_idx
+            )
+        except Exception as e:
+            updates_applied = 0
+            print(f"⚠️ Could not queue Prompts tab updates: {e}")
 
         if updates_applied > 0:
-            print(f"✅ Synced Opus 4.7+ script tuning to Prompts tab for {updates_applied} prompt(s).")
+            print(f"✅ Synced Opus 4.7+ script tuning to Prompts tab ({updates_applied} range(s)).")
         return prompts_dataframe
 
     prompts_df = sync_script_prompt_tuning_to_prompts_tab(prompts_ws, prompts_df)
 
-    def get_next_log_id():
-        if logs_df.empty or 'Log ID' not in logs_df.columns:
-            return 1
-        return int(logs_df['Log ID'].astype(int).max()) + 1
-
     def log_error(message):
         if logs_ws is not None:
-            log_row = [get_next_log_id(), pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'), str(message)]
-            logs_ws.append_row(log_row)
+            try:
+                log_row = [next_block_id(logs_ws, LOG_ID_BLOCK_SIZE), pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'), str(message)]
+                queue_sheet_append(logs_ws, log_row)
+            except Exception as e:
+                print(f"⚠️ Could not write to Logs tab: {e}")
         print(f"[LOGGED ERROR] {message}")
 
-    # Helper to get next Output ID
-    def get_next_output_id():
-        if outputs_df.empty:
-            return 1
-        return outputs_df['Output ID'].astype(int).max() + 1
-
-    # Helper to get next Workflow Steps ID
+    def checkpoint_workflow(workflow_id, workflow_code, output_record, current_output_row, all_outputs, workflow_steps_records, completed_steps, status='running'):
+        """Save everything needed to resume this workflow, skipping completed_steps."""
+        # Snapshot first: steps still running in other threads may be writing to these
+        output_record = dict(output_record)
+        all_outputs = list(all_outputs)
+        completed_steps = sorted(completed_steps)
+        next_step = next((idx for idx in range(len(all_outputs)) if idx not in completed_steps), len(all_outputs))
+        save_workflow_checkpoint({
+            'output_id': int(output_record['Output ID']),
+            'workflow_id': to_native(workflow_id),
+            'workflow_code': workflow_code,
+            'status': status,
+            'completed_steps': completed_steps,
+            'next_step': next_step,
+            'current_output_row': int(current_output_row),
+            'output_record': {col: to_native(val) for col, val in output_record.items()},
+            'all_outputs': [to_native(val) for val in all_outputs],
+            'workflow_steps_records': [[to_native(x) for x in row] for row in workflow_steps_records],
+            'saved_at': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+        })
+
+    # Helper to get the Workflow Steps ID base: each workflow reserves one whole ID per step
+    # and its rows use fractional IDs above that base (base + i + 0.1)
     def get_next_workflow_steps_id():
-        if workflow_steps_df.empty:
-            return 1
-        return workflow_steps_df['Workflow Steps ID'].astype(int).max() + 1
+        return workflow_steps_id_base
+
+    # Index the reference tabs once; every lookup below is a dict access
+    lookup_registry = build_lookup_registry(models_df, prompts_df, locations_df, eleven_df)
 
     # Helper to get model name by Model ID
     def get_model_name(model_id):
-        row = models_df[models_df['Model ID'].astype(str) == str(model_id)]
-        if not row.empty:
-            model_name = str(row.iloc[0].get('Model Name', '')).strip()
-            if model_name:
-                return model_name
-        override = MODEL_ID_OVERRIDES.get(str(model_id))
-        if override:
-            return override["name"]
-        return None
+        return lookup_registry['model_name_by_id'].get(str(model_id))
 
     # Helper to get Model ID by model name (returns the first match)
     def get_model_id_by_name(model_name):
-        row = models_df[models_df['Model Name'] == model_name]
-        if not row.empty:
-            return str(row.iloc[0]['Model ID'])
-        return None
+        return lookup_registry['model_id_by_name'].get(model_name)
 
     # Helper to get web search flag for a model by Model ID
     def get_model_web_search_by_id(model_id):
-        row = models_df[models_df['Model ID'].astype(str) == str(model_id)]
-        if not row.empty:
-            return str(row.iloc[0].get('Web Search', 'N')).strip().upper() == 'Y'
-        override = MODEL_ID_OVERRIDES.get(str(model_id))
-        if override:
-            return bool(override["web_search"])
-        return False
+        return lookup_registry['model_web_search_by_id'].get(str(model_id), False)
 
-    # Helper to get web search flag for a model by name (first match)
+    # Helper to get web search flag for a model by name (non-deprecated rows preferred)
     def get_model_web_search_by_name(model_name):
-        rows = models_df[models_df['Model Name'] == model_name]
-        if not rows.empty:
-            # Prefer non-deprecated entries when available
-            if 'Deprecated' in rows.columns:
-                active_rows = rows[rows['Deprecated'].astype(str).str.strip().str.upper() != 'Y']
-                if not active_rows.empty:
-                    rows = active_rows
-            # If any matching row has Web Search=Y, treat this model as web-search enabled
-            return any(rows['Web Search'].astype(str).str.strip().str.upper() == 'Y')
-        return False
+        return lookup_registry['model_web_search_by_name'].get(model_name, False)
 
     # Helper to get prompt description by Prompt ID
     def get_prompt_desc(prompt_id):
-        row = prompts_df[prompts_df['Prompt ID'].astype(str) == str(prompt_id)]
-        if not row.empty:
-            return row.iloc[0]['Prompt Description']
-        return None
+        return lookup_registry['prompt_desc_by_id'].get(str(prompt_id))
 
     # Helper to get default model for workflow
     # Note: Workflow ID 43 uses GPT-5.4 (M188) for web search and Claude Sonnet 4.5 (M145) for generation
@@ -3716,8 +5905,7 @@ if __name__ == '__main__':
                 print(f"🔧 Applying emergency cleaning before Drive upload...")
                 
                 # Emergency cleaning
-                text = fix_text_encoding(text)
-                text = force_clean_mojibake(text)
+                text = clean_text(text)
                 
                 # Additional aggressive cleaning
                 for pattern in ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']:
@@ -3760,10 +5948,8 @@ if __name__ == '__main__':
 
     # Helper to get Eleven Labs configuration by Eleven ID
     def get_eleven_config(eleven_id):
-        row = eleven_df[eleven_df['Eleven ID'].astype(str) == str(eleven_id)]
-        if not row.empty:
-            return row.iloc[0].to_dict()
-        return None
+        config = lookup_registry['eleven_by_id'].get(str(eleven_id))
+        return dict(config) if config else None
 
     # Helper to get voice ID by Eleven ID (this would need to be configured based on your Eleven Labs voice IDs)
     def get_voice_id_by_eleven_id(eleven_id):
@@ -3776,10 +5962,8 @@ if __name__ == '__main__':
 
     # Helper to get location by Location ID
     def get_location_by_id(location_id):
-        row = locations_df[locations_df['Location ID'].astype(str) == str(location_id)]
-        if not row.empty:
-            return row.iloc[0].to_dict()
-        return None
+        location = lookup_registry['location_by_id'].get(str(location_id))
+        return dict(location) if location else None
 
     # Parse workflow code step (e.g. P2&R1M8)
     def parse_step(step, all_outputs, custom_topic):
@@ -3904,6 +6088,8 @@ if __name__ == '__main__':
     # Check if a specific workflow ID is requested via environment variable
     # Default recommended workflow: Workflow ID 43 (uses GPT 5.1 + Claude Sonnet 4.5)
     requested_workflow_id = os.getenv('WORKFLOW_ID')
+    # Resume a failed run from its checkpoint (skips the steps it already completed)
+    resume_output_id = os.getenv('RESUME_OUTPUT_ID', '').strip()
     
     for workflow_idx, workflow_row in workflow_df.iterrows():
         # If a specific workflow ID is requested, only process that one
@@ -3928,71 +6114,62 @@ if __name__ == '__main__':
         default_model_id = get_model_id_by_name(default_model)
         steps = [s.strip() for s in workflow_code.split(',') if s.strip()]
         print(f"[DEBUG] Steps to execute: {steps}")
-        all_outputs = []  # Track output for every step, even if None
-        workflow_steps_records = []
-        current_output_id = outputs_df['Output ID'].astype(int).max() if not outputs_df.empty else 0
-        output_record = {
-            'Output ID': current_output_id + 1,
-            'Triggered Date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        # Ensure all Output columns are present in output_record
-        for col in outputs_df.columns:
-            if col not in output_record:
-                output_record[col] = ''
-        # Create the initial row in the Outputs tab
-        output_row = [to_native(output_record.get(col, '')) for col in outputs_df.columns]
-        outputs_ws.append_row(output_row)
-        # Get the row number of the newly created row
-        current_output_row = len(outputs_df) + 2  # +2 because of 1-based indexing and header row
-        print(f"[INFO] Created Output ID: {output_record['Output ID']} at row {current_output_row}")
-        executed_steps = set()
-        for i, step in enumerate(steps):
+        checkpoint = None
+        if resume_output_id:
+            checkpoint = load_workflow_checkpoint(resume_output_id)
+            if not checkpoint:
+                print(f"⚠️ No checkpoint found for Output ID {resume_output_id}. Starting workflow from step 1.")
+            elif str(checkpoint.get('workflow_id')) != str(workflow_id) or checkpoint.get('workflow_code') != workflow_code:
+                print(f"⚠️ Checkpoint for Output ID {resume_output_id} belongs to workflow {checkpoint.get('workflow_id')} "
+                      f"({checkpoint.get('workflow_code')}). Starting workflow {workflow_id} from step 1.")
+                checkpoint = None
+            elif checkpoint.get('status') == 'completed':
+                print(f"✅ Output ID {resume_output_id} already completed all steps. Nothing to resume.")
+                continue
+        if checkpoint:
+            # One slot per step; steps fill their own slot (R# indexes into it)
+            all_outputs = (list(checkpoint['all_outputs']) + [None] * len(steps))[:len(steps)]
+            workflow_steps_records = checkpoint['workflow_steps_records']
+            output_record = checkpoint['output_record']
+            current_output_row = checkpoint['current_output_row']
+            completed_steps = set(checkpoint.get('completed_steps', range(checkpoint.get('next_step', 0))))
+            for col in outputs_df.columns:
+                if col not in output_record:
+                    output_record[col] = ''
+            print(f"[RESUME] Resuming Output ID {output_record['Output ID']} at row {current_output_row} "
+                  f"with {len(completed_steps)}/{len(steps)} step(s) already completed")
+        else:
+            all_outputs = [None] * len(steps)  # Track output for every step, even if None
+            workflow_steps_records = []
+            output_record = {
+                'Output ID': reserve_ids(outputs_ws),
+                'Triggered Date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            # Ensure all Output columns are present in output_record
+            for col in outputs_df.columns:
+                if col not in output_record:
+                    output_record[col] = ''
+            # Create the initial row in the Outputs tab; the append reports the row it landed on
+            output_row = [to_native(output_record.get(col, '')) for col in outputs_df.columns]
+            current_output_row = append_sheet_row(outputs_ws, output_row)
+            completed_steps = set()
+            print(f"[INFO] Created Output ID: {output_record['Output ID']} at row {current_output_row}")
+        workflow_steps_id_base = reserve_ids(workflow_steps_ws, len(steps))
+        executed_steps = set(completed_steps)
+        for i in sorted(completed_steps):
+            print(f"[RESUME] Skipping completed step {i+1}/{len(steps)}: {steps[i]}")
+        step_records = [[] for _ in steps]  # Workflow Steps rows, kept per step so order never depends on timing
+
+        def run_step(i, step):
+            workflow_steps_records = step_records[i]
             print(f"[DEBUG] Executing step {i+1}/{len(steps)}: {step}")
             executed_steps.add(i)
             try:
                 # 1. PPU step FIRST
                 if step == 'PPU':
                     print(f"  - Step {i+1}: {step} (Posted Podcasts Update Step)")
-                    RSS_FEED_URL = 'https://anchor.fm/s/101530384/podcast/rss'
                     try:
-                        response = requests.get(RSS_FEED_URL)
-                        response.raise_for_status()
-                        root = ET.fromstring(response.content)
-                        channel = root.find('channel')
-                        items = channel.findall('item') if channel is not None else []
-                        posted_podcasts_data = []
-                        # Reverse items so oldest is first, newest is last
-                        items = items[::-1]
-                        for idx, item in enumerate(items):
-                            title = item.findtext('title', default='')
-                            description = item.findtext('description', default='')
-                            # Decode HTML entities
-                            title = html.unescape(title)
-                            description = html.unescape(description)
-                            # Remove HTML tags from description
-                            import re
-                            cleanr = re.compile('<.*?>')
-                            description_clean = re.sub(cleanr, '', description)
-                            # Description Short: up to 'Help support' (case-insensitive)
-                            desc_short = description_clean.split('Help support')[0].strip()
-                            posted_podcasts_data.append([
-                                idx + 1,  # Sequential ID starting from 1
-                                title,
-                                description_clean,
-                                desc_short
-                            ])
-                        # Update the Posted Podcasts tab
-                        try:
-                            posted_ws = spreadsheet.worksheet('Posted Podcasts')
-                            num_rows = len(posted_podcasts_data) + 1  # +1 for header
-                            num_cols = max(len(row) for row in posted_podcasts_data) if posted_podcasts_data else 4
-                            posted_ws.resize(rows=num_rows, cols=num_cols)
-                            posted_ws.update(values=posted_podcasts_data, range_name='A2')
-                            log_msg = f"Updated Posted Podcasts tab with {len(posted_podcasts_data)} episodes."
-                            print(f"    > {log_msg}")
-                        except Exception as e:
-                            log_msg = f"Failed to update Posted Podcasts tab: {e}"
-                            print(f"    > {log_msg}")
+                        log_msg = sync_posted_podcasts(spreadsheet)
                     except Exception as e:
                         log_msg = f"Failed to fetch or parse RSS feed: {e}"
                         print(f"    > {log_msg}")
@@ -4007,8 +6184,8 @@ if __name__ == '__main__':
                         '',
                         log_msg
                     ])
-                    all_outputs.append(None)
-                    continue
+                    all_outputs[i] = None
+                    return
 
                 # 2. UM step (Update Models)
                 if step == 'UM':
@@ -4032,8 +6209,8 @@ if __name__ == '__main__':
                         um_output,
                         log_msg
                     ])
-                    all_outputs.append(um_output)
-                    continue
+                    all_outputs[i] = um_output
+                    return
 
                 # 3. PPL# step THIRD
                 ppl_match = re.fullmatch(r'PPL(\d+)', step)
@@ -4041,26 +6218,8 @@ if __name__ == '__main__':
                     num_episodes = int(ppl_match.group(1))
                     print(f"  - Step {i+1}: {step} (Posted Podcast Last Step, retrieving last {num_episodes} episodes)")
                     try:
-                        posted_ws = spreadsheet.worksheet('Posted Podcasts')
-                        posted_df = pd.DataFrame(posted_ws.get_all_records())
-                        # Sort by Posted Podcasts ID descending (numeric)
-                        if 'Posted Podcasts ID' in posted_df.columns:
-                            try:
-                                posted_df['Posted Podcasts ID'] = posted_df['Posted Podcasts ID'].astype(int)
-                                posted_df_sorted = posted_df.sort_values(by='Posted Podcasts ID', ascending=False)
-                            except Exception:
-                                posted_df_sorted = posted_df.iloc[::-1]
-                        else:
-                            posted_df_sorted = posted_df.iloc[::-1]
-                        # Get the last N episodes
-                        last_episodes = posted_df_sorted.head(num_episodes)
-                        # Prepare output: Title and Description Short for each
-                        output_lines = []
-                        for idx, row in last_episodes.iterrows():
-                            title = row.get('Title', '')
-                            desc_short = row.get('Description Short', '')
-                            output_lines.append(f"Title: {title}\nDescription Short: {desc_short}")
-                        ppl_output = '\n\n'.join(output_lines)
+                        last_episodes = read_last_posted_podcasts(spreadsheet, num_episodes)
+                        ppl_output = format_posted_podcasts(last_episodes)
                         output_col_in = f'Output {2*i+1}'
                         output_col_out = f'Output {2*i+2}'
                         output_record[output_col_in] = f"PPL{num_episodes}"
@@ -4085,14 +6244,14 @@ if __name__ == '__main__':
                     # After each step, update the Outputs tab with the current output_record
                     output_row = [to_native(output_record.get(col, '')) for col in outputs_df.columns]
                     last_col_letter = colnum_to_excel_col(len(outputs_df.columns))
-                    outputs_ws.update(f'A{current_output_row}:{last_col_letter}{current_output_row}', [output_row])
+                    queue_sheet_update(outputs_ws, f'A{current_output_row}:{last_col_letter}{current_output_row}', [output_row])
                     # Only print the first 100 characters of the output
                     output_col_out = f'Output {2*i+2}'
                     output_val = output_record.get(output_col_out, '')
                     print(f"    Output (first 100): {str(output_val)[:100]}{'...' if output_val and len(str(output_val)) > 100 else ''}")
                     print(f"[INFO] Output updated for Output ID: {output_record['Output ID']} after step {i+1}")
-                    all_outputs.append(ppl_output)
-                    continue
+                    all_outputs[i] = ppl_output
+                    return
 
                 # Check for save-only step (e.g., R4SL7 or R4SL7T2)
                 save_only_match = re.fullmatch(r'R(\d+)SL(\d+)(?:T(\d+))?', step)
@@ -4111,47 +6270,20 @@ if __name__ == '__main__':
                         original_sample = str(response_to_save)[:200]
                         print(f"🔍 Original response sample: {original_sample}")
                         
-                        # Always fix encoding before saving
-                        response_to_save = fix_text_encoding(response_to_save)
-                        after_encoding_fix = str(response_to_save)[:200]
-                        
-                        response_to_save = force_clean_mojibake(response_to_save)
-                        after_mojibake_fix = str(response_to_save)[:200]
-                        
-                        # Additional aggressive cleaning for persistent patterns
-                        critical_patterns = ['â€™', 'â€', 'â€œ', 'â€"', 'â€¦']
-                        found_critical = []
-                        for pattern in critical_patterns:
-                            if pattern in response_to_save:
-                                found_critical.append(pattern)
-                                if pattern == 'â€™':
-                                    response_to_save = response_to_save.replace(pattern, "'")
-                                elif pattern == 'â€':
-                                    response_to_save = response_to_save.replace(pattern, '"')
-                                elif pattern == 'â€œ':
-                                    response_to_save = response_to_save.replace(pattern, '"')
-                                elif pattern == 'â€"':
-                                    response_to_save = response_to_save.replace(pattern, '—')
-                                elif pattern == 'â€¦':
-                                    response_to_save = response_to_save.replace(pattern, '...')
-                        
-                        if found_critical:
-                            print(f"🔧 Save-only step: Found and cleaned critical patterns: {found_critical}")
-                        
+                        # Always clean before saving
+                        response_to_save = clean_text(response_to_save)
                         final_sample = str(response_to_save)[:200]
-                        print(f"🔍 After encoding fix: {after_encoding_fix}")
-                        print(f"🔍 After mojibake fix: {after_mojibake_fix}")
                         print(f"🔍 Final cleaned text: {final_sample}")
                         
                         # Final verification
-                        remaining_issues = [p for p in critical_patterns if p in response_to_save]
+                        remaining_issues = remaining_mojibake(response_to_save)
                         if remaining_issues:
                             print(f"⚠️ CRITICAL: Save-only step still has mojibake: {remaining_issues}")
                         else:
                             print("✅ Save-only step: Text is clean, ready for saving")
-                        loc_row = locations_df[locations_df['Location ID'].astype(str) == location_id]
-                        if not loc_row.empty:
-                            folder_url = loc_row.iloc[0]['Location']
+                        location = get_location_by_id(location_id)
+                        if location:
+                            folder_url = location['Location']
                             # For GCS: Use the folder prefix directly
                             folder_prefix = folder_url.rstrip('/')  # Clean up any trailing slash
                             timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
@@ -4194,10 +6326,10 @@ if __name__ == '__main__':
                     ])
                     # Only append to prev_outputs if response_to_save is defined
                     if response_to_save is not None:
-                        all_outputs.append(response_to_save)
+                        all_outputs[i] = response_to_save
                     else:
-                        all_outputs.append(None)
-                    continue  # Skip model call for this step
+                        all_outputs[i] = None
+                    return  # Skip model call for this step
                 
                 # Check for Eleven Labs step (e.g., L8E1SL4 or L8E1SL4T2)
                 eleven_match = re.fullmatch(r'L(\d+)E(\d+)SL(\d+)(?:T(\d+))?', step)
@@ -4224,7 +6356,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Get Eleven Labs configuration
                     eleven_config = get_eleven_config(eleven_id)
@@ -4242,7 +6374,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Get voice ID
                     voice_id = get_voice_id_by_eleven_id(eleven_id)
@@ -4260,7 +6392,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Download latest text file from source location
                     source_folder_prefix = source_location['Location']  # Use GCS folder prefix directly
@@ -4279,15 +6411,31 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Generate audio using Eleven Labs
                     print(f"    > Generating audio with voice: {eleven_config['Voice']}")
                     temp_audio_path = MP3_OUTPUT_DIR / f"temp_audio_{workflow_id}_step_{i+1}.mp3"
                     
+                    # Streaming mode uploads to the save location while the audio is synthesized
+                    file_link = None
+                    stream_destination_path = None
+                    if ELEVENLABS_STREAM_TO_OUTPUT:
+                        stream_save_location = get_location_by_id(save_location_id)
+                        if stream_save_location:
+                            stream_filename = build_voice_audio_filename(
+                                pd.Timestamp.now().strftime('%Y%m%d_%H%M%S'), workflow_id, i + 1, eleven_config, all_outputs, title_resp_idx
+                            )
+                            stream_destination_path = f"{stream_save_location['Location'].rstrip('/')}/{stream_filename}"
+                    
                     # Try ElevenLabs, catch credit/quota errors for fallback to Google Voice
                     try:
-                        audio_path = generate_voice_audio(text_content, voice_id, temp_audio_path, eleven_config)
+                        if ELEVENLABS_STREAM_TO_OUTPUT:
+                            audio_path, file_link = stream_voice_audio(
+                                text_content, voice_id, temp_audio_path, eleven_config, upload_blob_name=stream_destination_path
+                            )
+                        else:
+                            audio_path = generate_voice_audio(text_content, voice_id, temp_audio_path, eleven_config)
                         
                         if not audio_path:
                             log_msg = f"Failed to generate audio with Eleven Labs for step {i+1}. Aborting workflow."
@@ -4373,28 +6521,20 @@ if __name__ == '__main__':
                             audio_path,
                             log_msg
                         ])
-                        continue
+                        return
                     
                     save_folder_prefix = save_location['Location']  # Use GCS folder prefix directly
                     timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
                     
                     # Check if custom title is requested
                     # Determine voice name for filename (could be ElevenLabs or Google Voice fallback)
-                    voice_name_for_filename = eleven_config.get('Voice', 'Unknown') if eleven_config else 'Unknown'
-                    if title_resp_idx is not None and 0 <= title_resp_idx < len(all_outputs):
-                        title_text = all_outputs[title_resp_idx]
-                        extracted_title = extract_title_from_text(title_text)
-                        clean_title = clean_filename(extracted_title)
-                        if clean_title:
-                            audio_filename = f'{timestamp}_{clean_title}.mp3'
-                        else:
-                            audio_filename = f'{timestamp}_workflow_{workflow_id}_step_{i+1}_{voice_name_for_filename}.mp3'
-                    else:
-                        audio_filename = f'{timestamp}_workflow_{workflow_id}_step_{i+1}_{voice_name_for_filename}.mp3'
+                    audio_filename = build_voice_audio_filename(timestamp, workflow_id, i + 1, eleven_config, all_outputs, title_resp_idx)
                     try:
                         print(f"[DEBUG] Using model: {get_elevenlabs_model_id(eleven_config)}, voice_id: {voice_id}")
-                        start_time = time.time()
-                        if os.path.exists(audio_path):
+                        if file_link:
+                            log_msg = f"Generated and streamed audio to Google Cloud Storage: {file_link}"
+                            print(f"    > {log_msg}")
+                        elif os.path.exists(audio_path):
                             # Clean up the path to avoid double slashes
                             clean_prefix = save_folder_prefix.rstrip('/')
                             destination_path = f"{clean_prefix}/{audio_filename}"
@@ -4429,8 +6569,8 @@ if __name__ == '__main__':
                     ])
                     
                     # Add audio path to outputs
-                    all_outputs.append(audio_path)
-                    continue  # Skip regular model call for this step
+                    all_outputs[i] = audio_path
+                    return  # Skip regular model call for this step
                 
                 # Check for Google Voice step (e.g., L8GV1SL4 or L8GV1SL4T2)
                 google_voice_match = re.fullmatch(r'L(\d+)GV(\d+)SL(\d+)(?:T(\d+))?', step)
@@ -4459,7 +6599,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Download latest text file from source location
                     source_folder_prefix = source_location['Location']  # Use GCS folder prefix directly
@@ -4478,7 +6618,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Generate audio using Google Voice
                     print(f"    > Generating audio with Google Voice: {voice_name}")
@@ -4519,7 +6659,7 @@ if __name__ == '__main__':
                             audio_path,
                             log_msg
                         ])
-                        continue
+                        return
                     
                     save_folder_prefix = save_location['Location']  # Use GCS folder prefix directly
                     timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
@@ -4564,8 +6704,8 @@ if __name__ == '__main__':
                     ])
                     
                     # Add audio path to outputs
-                    all_outputs.append(audio_path)
-                    continue  # Skip regular model call for this step
+                    all_outputs[i] = audio_path
+                    return  # Skip regular model call for this step
                 
                 # Check for Audio Merging step (e.g., L1&L9&L2SL3 or L1&L9&L2SL3T2)
                 audio_merge_match = re.fullmatch(r'L(\d+)(?:&L(\d+))*SL(\d+)(?:T(\d+))?', step)
@@ -4595,43 +6735,10 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
-                    
-                    # Download audio files from source locations
-                    audio_paths = []
-                    download_errors = []
+                        return
                     
-                    for loc_id in source_location_ids:
-                        location = get_location_by_id(loc_id)
-                        if not location:
-                            error_msg = f"Location ID {loc_id} not found in Locations sheet."
-                            download_errors.append(error_msg)
-                            continue
-                        
-                        location_url = location['Location']
-                        location_type = location['Type']
-                        
-                        if location_type == 'File':
-                            # Download specific file
-                            audio_path = download_mp3_file_from_gcs(location_url)
-                        elif location_type == 'mp3':
-                            # For GCS: Use the folder prefix directly to get the latest mp3
-                            folder_prefix = location_url  # Already set to e.g. 'eleven-labs/'
-                            audio_path = download_latest_mp3_from_gcs(folder_prefix)
-                            if not audio_path:
-                                error_msg = f"Failed to download latest mp3 from folder {folder_prefix} for location {loc_id}"
-                                download_errors.append(error_msg)
-                                continue
-                        else:
-                            error_msg = f"Location {loc_id} is not a file or mp3 type"
-                            download_errors.append(error_msg)
-                            continue
-                        
-                        if audio_path:
-                            audio_paths.append(audio_path)
-                        else:
-                            error_msg = f"Failed to download audio from location {loc_id}"
-                            download_errors.append(error_msg)
+                    # Download audio files from source locations (concurrently, kept in location order)
+                    audio_paths, download_errors = download_merge_sources(source_location_ids, get_location_by_id)
                     
                     if download_errors:
                         log_msg = f"Audio download errors: {'; '.join(download_errors)}"
@@ -4647,7 +6754,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     if len(audio_paths) < 2:
                         log_msg = f"Not enough audio files downloaded for merging. Expected at least 2, got {len(audio_paths)}"
@@ -4663,7 +6770,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Merge audio files
                     print(f"    > Merging {len(audio_paths)} audio files...")
@@ -4684,7 +6791,7 @@ if __name__ == '__main__':
                             '',
                             log_msg
                         ])
-                        continue
+                        return
                     
                     # Upload merged audio to destination location
                     save_location = get_location_by_id(save_location_id)
@@ -4702,7 +6809,7 @@ if __name__ == '__main__':
                             merged_path,
                             log_msg
                         ])
-                        continue
+                        return
                     
                     save_folder_prefix = save_location['Location']  # Use GCS folder prefix directly
                     timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
@@ -4720,7 +6827,6 @@ if __name__ == '__main__':
                         audio_filename = f'{timestamp}_merged_workflow_{workflow_id}_step_{i+1}.mp3'
                     
                     try:
-                        start_time = time.time()
                         if os.path.exists(merged_path):
                             # Clean up the path to avoid double slashes
                             clean_prefix = save_folder_prefix.rstrip('/')
@@ -4752,8 +6858,8 @@ if __name__ == '__main__':
                         log_msg
                     ])
                     # Add merged audio path to outputs
-                    all_outputs.append(merged_path)
-                    continue  # Skip regular model call for this step
+                    all_outputs[i] = merged_path
+                    return  # Skip regular model call for this step
                 
                 # Parse the step for prompt, model override, and model ID override
                 input_text, model_override, model_id_override = parse_step(step, all_outputs, custom_topic)
@@ -4809,9 +6915,9 @@ if __name__ == '__main__':
                 if sl_match:
                     location_id = sl_match.group(1)
                     title_resp_idx = int(sl_match.group(2)) - 1 if sl_match.group(2) else None
-                    loc_row = locations_df[locations_df['Location ID'].astype(str) == location_id]
-                    if not loc_row.empty:
-                        folder_url = loc_row.iloc[0]['Location']
+                    location = get_location_by_id(location_id)
+                    if location:
+                        folder_url = location['Location']
                         # For GCS: Use the folder prefix directly
                         folder_prefix = folder_url.rstrip('/')  # Clean up any trailing slash
                         timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
@@ -4830,8 +6936,7 @@ if __name__ == '__main__':
                         
                         try:
                             # Always normalize text before saving
-                            normalized_response = fix_text_encoding(response)
-                            normalized_response = force_clean_mojibake(normalized_response)
+                            normalized_response = clean_text(response)
                             file_link = upload_text_to_gcs(normalized_response, f"{folder_prefix}/{filename}")
                             log_msg = f"Saved response to Google Cloud Storage: {file_link}"
                         except Exception as e:
@@ -4851,25 +6956,57 @@ if __name__ == '__main__':
                 # After each step, update the Outputs tab with the current output_record
                 output_row = [to_native(output_record.get(col, '')) for col in outputs_df.columns]
                 last_col_letter = colnum_to_excel_col(len(outputs_df.columns))
-                outputs_ws.update(f'A{current_output_row}:{last_col_letter}{current_output_row}', [output_row])
+                queue_sheet_update(outputs_ws, f'A{current_output_row}:{last_col_letter}{current_output_row}', [output_row])
                 # Only print the first 100 characters of the output
                 output_col_out = f'Output {2*i+2}'
                 output_val = output_record.get(output_col_out, '')
                 print(f"    Output (first 100): {str(output_val)[:100]}{'...' if output_val and len(str(output_val)) > 100 else ''}")
                 print(f"[INFO] Output updated for Output ID: {output_record['Output ID']} after step {i+1}")
-                all_outputs.append(response)
+                all_outputs[i] = response
             except Exception as e:
                 error_msg = f"[ERROR] Exception in step {i+1} ({step}): {e}"
                 print(error_msg)
                 log_error(error_msg)
-                all_outputs.append(None)
+                all_outputs[i] = None
                 print("[FATAL] Workflow execution halted due to error.")
+                flush_sheet_writes("workflow error")
                 sys.exit(1)
 
+        def completed_step_records():
+            # Rows restored from a checkpoint first, then completed steps in workflow order
+            return workflow_steps_records + [row for idx in sorted(completed_steps) for row in step_records[idx]]
+
+        def on_step_done(i):
+            completed_steps.add(i)
+            checkpoint_workflow(workflow_id, workflow_code, output_record, current_output_row, all_outputs, completed_step_records(), completed_steps)
+            flush_sheet_writes_if_due()
+
+        # Checkpoint up front so a failure in the first step can still be resumed
+        checkpoint_workflow(workflow_id, workflow_code, output_record, current_output_row, all_outputs, completed_step_records(), completed_steps)
+        step_dependencies = build_step_dependencies(steps)
+        for i, step_deps in enumerate(step_dependencies):
+            print(f"[DEBUG] Step {i+1} ({steps[i]}) waits for: {[d + 1 for d in sorted(step_deps)] or 'nothing'}")
+        trace_fields = {"workflow_id": workflow_id, "output_id": output_record['Output ID']}
+        run_steps_as_dag(
+            steps,
+            lambda i, step: run_instrumented_step(run_step, i, step, step_records[i], trace_fields, step_metrics_in_sheet),
+            step_dependencies,
+            WORKFLOW_MAX_PARALLEL_STEPS,
+            completed=set(completed_steps),
+            on_step_done=on_step_done,
+        )
+
+        # Parallel steps may have queued Outputs snapshots out of order; queue the final row last
+        output_row = [to_native(output_record.get(col, '')) for col in outputs_df.columns]
+        last_col_letter = colnum_to_excel_col(len(outputs_df.columns))
+        queue_sheet_update(outputs_ws, f'A{current_output_row}:{last_col_letter}{current_output_row}', [output_row])
+
         # Write to Workflow Steps tab
-        for ws_row in workflow_steps_records:
+        for ws_row in completed_step_records():
             ws_row_native = [to_native(x) for x in ws_row]
-            workflow_steps_ws.append_row(ws_row_native)
+            queue_sheet_append(workflow_steps_ws, ws_row_native)
+        flush_sheet_writes("workflow complete")
+        checkpoint_workflow(workflow_id, workflow_code, output_record, current_output_row, all_outputs, completed_step_records(), completed_steps, status='completed')
         # Mark request as processed (disabled per user request)
         # requests_ws.update_cell(req_idx + 2, requests_df.columns.get_loc('Active') + 1, 'N')
         print(f"✅ Workflow {workflow_id} processed and logged.")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test script for the validated local cache of static audio assets.
+A fake GCS bucket answers the generation-conditional metadata request, so no credentials are needed.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.generation = bucket.objects[name][0]
+
+    def download_to_filename(self, path, if_generation_match=None):
+        generation, data = self.bucket.objects[self.name]
+        assert if_generation_match == generation
+        self.bucket.downloads += 1
+        Path(path).write_bytes(data)
+
+
+class FakeBucket:
+    def __init__(self, objects):
+        self.objects = objects
+        self.downloads = 0
+        self.metadata_requests = 0
+
+    def get_blob(self, name, if_generation_not_match=None):
+        self.metadata_requests += 1
+        if name not in self.objects:
+            return None
+        if if_generation_not_match is not None and self.objects[name][0] == if_generation_not_match:
+            raise pipeline.gcs_exceptions.NotModified("not modified")
+        return FakeBlob(self, name)
+
+
+class FakeClient:
+    def __init__(self, bucket):
+        self._bucket = bucket
+
+    def bucket(self, name):
+        return self._bucket
+
+
+def with_fake_gcs(bucket, fn):
+    original_client = pipeline.get_gcs_client
+    original_dir = pipeline.ASSET_CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline.get_gcs_client = lambda: FakeClient(bucket)
+        pipeline.ASSET_CACHE_DIR = Path(tmp)
+        try:
+            return fn()
+        finally:
+            pipeline.get_gcs_client = original_client
+            pipeline.ASSET_CACHE_DIR = original_dir
+
+
+def test_gcs_asset_revalidation():
+    print("🔍 Testing generation-validated GCS asset cache")
+    bucket = FakeBucket({"intro/intro.mp3": (1, b"intro-v1")})
+
+    def run():
+        first = pipeline.cached_gcs_asset("intro/intro.mp3")
+        assert first.read_bytes() == b"intro-v1"
+        second = pipeline.cached_gcs_asset("intro/intro.mp3")
+        assert second == first
+        assert bucket.downloads == 1, "unchanged blob must not be downloaded again"
+
+        bucket.objects["intro/intro.mp3"] = (2, b"intro-v2")
+        third = pipeline.cached_gcs_asset("intro/intro.mp3")
+        assert third.read_bytes() == b"intro-v2"
+        assert bucket.downloads == 2
+        assert pipeline.cached_gcs_asset("missing.mp3") is None
+
+        # A failed revalidation falls back to the cached copy
+        pipeline.get_gcs_client = lambda: None
+        assert pipeline.cached_gcs_asset("intro/intro.mp3").read_bytes() == b"intro-v2"
+
+    with_fake_gcs(bucket, run)
+    print(f"Metadata requests: {bucket.metadata_requests}, downloads: {bucket.downloads}")
+    print("✅ Downloads only when the generation changes")
+
+
+def test_drive_asset_revalidation():
+    print("🔍 Testing md5-validated Drive asset cache")
+    downloads = []
+
+    def download(path):
+        downloads.append(path)
+        Path(path).write_bytes(b"outro")
+
+    def run():
+        first = pipeline.cached_drive_asset("abc123", "outro.mp3", "md5-a", download)
+        second = pipeline.cached_drive_asset("abc123", "outro.mp3", "md5-a", download)
+        assert first == second and len(downloads) == 1
+        pipeline.cached_drive_asset("abc123", "outro.mp3", "md5-b", download)
+        assert len(downloads) == 2
+        assert first.suffix == ".mp3"
+
+    with_fake_gcs(FakeBucket({}), run)
+    print("✅ Drive files reused until their checksum changes")
+
+
+def main():
+    print("🚀 Asset Cache Test Suite")
+    print("=" * 60)
+    test_gcs_asset_revalidation()
+    test_drive_asset_revalidation()
+    print("\n🎉 All asset cache tests passed!")
+
+
+if __name__ == "__main__":
+    main()
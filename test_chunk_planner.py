@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for the balanced TTS chunk planner behind split_text_into_chunks.
+Pure text processing: no API calls.
+"""
+
+import re
+import sys
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def sample_text():
+    sentences = [f"Sentence number {n} talks about the news of the day in some detail." for n in range(120)]
+    paragraphs = [" ".join(sentences[i:i + 6]) for i in range(0, len(sentences), 6)]
+    return "\n\n".join(paragraphs)
+
+
+def normalise(text):
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def test_balanced_sizes():
+    print("🔍 Testing balanced chunk sizes")
+    text = sample_text()
+    plan = pipeline.plan_text_chunks(text, max_length=2900)
+    greedy_required = -(-len(text) // 2900)
+    print(f"Text length {len(text)}, sizes {plan['sizes']}")
+    assert len(plan["chunks"]) == greedy_required
+    assert max(plan["sizes"]) <= 2900
+    assert max(plan["sizes"]) - min(plan["sizes"]) < 200, "chunks should be evenly sized"
+    assert normalise(" ".join(plan["chunks"])) == normalise(text)
+    assert all(chunk.rstrip().endswith(".") for chunk in plan["chunks"]), "chunks end on sentence boundaries"
+    assert "\n\n" in plan["chunks"][0], "paragraph breaks are kept inside chunks"
+    print("✅ Same chunk count as greedy packing with no short tail")
+
+
+def test_target_parallelism_and_estimates():
+    print("🔍 Testing target parallelism and time estimates")
+    text = sample_text()
+    plan = pipeline.plan_text_chunks(text, max_length=2900, target_chunks=6, parallelism=3)
+    print(f"Sizes {plan['sizes']}, estimated {plan['estimated_seconds']}, wall {plan['estimated_wall_seconds']}s")
+    assert len(plan["chunks"]) == 6
+    assert len(plan["boundaries"]) == 6 and plan["boundaries"][0][0] == 0
+    assert plan["estimated_wall_seconds"] < sum(plan["estimated_seconds"])
+    assert pipeline.estimate_parallel_seconds([3, 1, 1, 1], 2) == 3
+    print("✅ Plan splits to the target and estimates the parallel wall time")
+
+
+def test_edge_cases():
+    print("🔍 Testing short, empty and unbroken text")
+    assert pipeline.split_text_into_chunks("Short text.") == ["Short text."]
+    assert pipeline.split_text_into_chunks("") == []
+    sizes = pipeline.plan_text_chunks("x" * 7000, max_length=2900)["sizes"]
+    assert sizes == [2334, 2334, 2332]
+    print("✅ Edge cases handled; oversized sentences split into equal pieces")
+
+
+def main():
+    print("🚀 Chunk Planner Test Suite")
+    print("=" * 60)
+    test_balanced_sizes()
+    test_target_parallelism_and_estimates()
+    test_edge_cases()
+    print("\n🎉 All chunk planner tests passed!")
+
+
+if __name__ == "__main__":
+    main()
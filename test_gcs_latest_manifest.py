@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-folder latest-file manifest in GCS.
+Uses an in-memory bucket that enforces generation preconditions.
+"""
+
+import datetime
+import sys
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+from google.api_core import exceptions as gcs_exceptions
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def generation(self):
+        return self.bucket.objects[self.name]["generation"]
+
+    @property
+    def time_created(self):
+        return self.bucket.objects[self.name]["created"]
+
+    def download_as_text(self, if_generation_match=None):
+        self.bucket.calls.append(("get", self.name))
+        obj = self.bucket.objects.get(self.name)
+        if obj is None:
+            raise gcs_exceptions.NotFound(self.name)
+        if if_generation_match is not None and obj["generation"] != if_generation_match:
+            raise gcs_exceptions.PreconditionFailed(self.name)
+        return obj["data"]
+
+    def upload_from_string(self, data, content_type=None, if_generation_match=None):
+        self.bucket.calls.append(("put", self.name))
+        if self.bucket.before_put:
+            self.bucket.before_put.pop(0)()
+        current_now = self.bucket.objects.get(self.name, {"generation": 0})["generation"]
+        if if_generation_match is not None and current_now != if_generation_match:
+            raise gcs_exceptions.PreconditionFailed(self.name)
+        self.bucket.clock += 1
+        self.bucket.objects[self.name] = {
+            "data": data if isinstance(data, str) else data.decode("utf-8"),
+            "generation": current_now + 1,
+            "created": datetime.datetime(2026, 1, 1) + datetime.timedelta(minutes=self.bucket.clock),
+        }
+
+
+class FakeBucket:
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+        self.clock = 0
+        self.before_put = []
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+    def get_blob(self, name):
+        self.calls.append(("meta", name))
+        return FakeBlob(self, name) if name in self.objects else None
+
+    def list_blobs(self, prefix=None):
+        self.calls.append(("list", prefix))
+        return [FakeBlob(self, name) for name in sorted(self.objects) if name.startswith(prefix or "")]
+
+
+class FakeClient:
+    def __init__(self, bucket):
+        self._bucket = bucket
+
+    def bucket(self, name):
+        return self._bucket
+
+
+def with_fake_bucket(test):
+    def run():
+        bucket = FakeBucket()
+        original = pipeline.get_gcs_client
+        pipeline.get_gcs_client = lambda: FakeClient(bucket)
+        try:
+            test(bucket)
+        finally:
+            pipeline.get_gcs_client = original
+    return run
+
+
+@with_fake_bucket
+def test_lookup_is_one_get(bucket):
+    print("🔍 Testing manifest-backed latest lookup")
+    for n in range(3):
+        pipeline.upload_bytes_to_gcs(f"script {n}", f"podcast/scripts/ep{n}.txt")
+    bucket.calls.clear()
+    latest = pipeline.get_latest_file_in_gcs_folder("podcast/scripts/")
+    print(f"Latest: {latest}, calls: {bucket.calls}")
+    assert latest == "podcast/scripts/ep2.txt"
+    assert bucket.calls == [("get", "podcast/scripts/_latest.json"), ("meta", "podcast/scripts/ep2.txt")]
+    manifest = pipeline.json.loads(bucket.objects["podcast/scripts/_latest.json"]["data"])
+    assert manifest["history"] == ["podcast/scripts/ep2.txt", "podcast/scripts/ep1.txt", "podcast/scripts/ep0.txt"]
+    assert "podcast/scripts/_latest.json" not in pipeline.list_files_in_gcs_folder("podcast/scripts/")
+    print("✅ Latest file found with a manifest GET and a metadata check")
+
+
+@with_fake_bucket
+def test_concurrent_update_is_retried(bucket):
+    print("🔍 Testing conditional manifest update")
+    pipeline.upload_bytes_to_gcs("a", "podcast/audio/a.mp3")
+    # Another uploader commits between our read and our write
+    bucket.before_put.append(lambda: None)  # the data upload itself
+    bucket.before_put.append(lambda: pipeline.record_latest_gcs_upload("podcast/audio/b.mp3"))
+    pipeline.upload_bytes_to_gcs("c", "podcast/audio/c.mp3")
+    manifest = pipeline.json.loads(bucket.objects["podcast/audio/_latest.json"]["data"])
+    print(f"Manifest history: {manifest['history']}")
+    assert manifest["latest"] == "podcast/audio/c.mp3"
+    assert manifest["history"] == ["podcast/audio/c.mp3", "podcast/audio/b.mp3", "podcast/audio/a.mp3"]
+    print("✅ No manifest update lost under contention")
+
+
+@with_fake_bucket
+def test_listing_fallback_seeds_manifest(bucket):
+    print("🔍 Testing fallback for folders without a manifest")
+    for name in ["eleven-labs/old.mp3", "eleven-labs/new.mp3"]:
+        bucket.blob(name).upload_from_string(b"audio")
+    assert pipeline.get_latest_file_in_gcs_folder("eleven-labs/") == "eleven-labs/new.mp3"
+    assert "eleven-labs/_latest.json" in bucket.objects
+    bucket.calls.clear()
+    assert pipeline.get_latest_file_in_gcs_folder("eleven-labs/") == "eleven-labs/new.mp3"
+    assert not any(call[0] == "list" for call in bucket.calls)
+    print("✅ Listing used once, then the manifest")
+
+
+@with_fake_bucket
+def test_manifest_revalidated(bucket):
+    print("🔍 Testing missing targets and manual uploads")
+    pipeline.upload_bytes_to_gcs("a", "podcast/audio/a.mp3")
+    pipeline.upload_bytes_to_gcs("b", "podcast/audio/b.mp3")
+    # The manifest's target was deleted by hand
+    del bucket.objects["podcast/audio/b.mp3"]
+    assert pipeline.get_latest_file_in_gcs_folder("podcast/audio/") == "podcast/audio/a.mp3"
+    manifest = pipeline.json.loads(bucket.objects["podcast/audio/_latest.json"]["data"])
+    assert manifest["latest"] == "podcast/audio/a.mp3", "manifest re-seeded from the listing"
+
+    # A file uploaded outside the pipeline shows up once the manifest is past its max age
+    bucket.blob("podcast/audio/manual.mp3").upload_from_string(b"audio")
+    assert pipeline.get_latest_file_in_gcs_folder("podcast/audio/") == "podcast/audio/a.mp3"
+    original = pipeline.GCS_LATEST_MANIFEST_MAX_AGE_SECONDS
+    pipeline.GCS_LATEST_MANIFEST_MAX_AGE_SECONDS = -1
+    try:
+        assert pipeline.get_latest_file_in_gcs_folder("podcast/audio/") == "podcast/audio/manual.mp3"
+    finally:
+        pipeline.GCS_LATEST_MANIFEST_MAX_AGE_SECONDS = original
+    print("✅ Deleted targets and aged manifests fall back to the listing")
+
+
+def main():
+    print("🚀 GCS Latest Manifest Test Suite")
+    print("=" * 60)
+    test_lookup_is_one_get()
+    test_concurrent_update_is_retried()
+    test_listing_fallback_seeds_manifest()
+    test_manifest_revalidated()
+    print("\n🎉 All GCS latest manifest tests passed!")
+
+
+if __name__ == "__main__":
+    main()
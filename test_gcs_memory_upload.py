@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for uploading artifacts to GCS from memory.
+Uses a fake storage client to check content types, metadata and chunked uploads.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeBlob:
+    def __init__(self, name, uploads):
+        self.name = name
+        self.uploads = uploads
+        self.cache_control = None
+        self.chunk_size = None
+
+    def upload_from_string(self, data, content_type=None):
+        self.uploads.append(("string", self.name, data, content_type, self.cache_control, self.chunk_size))
+
+    def upload_from_filename(self, filename, content_type=None):
+        self.uploads.append(("filename", self.name, filename, content_type, self.cache_control, self.chunk_size))
+
+    def patch(self):
+        raise AssertionError("metadata must be set before upload, not patched afterwards")
+
+
+class FakeBucket:
+    def __init__(self, uploads):
+        self.uploads = uploads
+
+    def blob(self, name):
+        return FakeBlob(name, self.uploads)
+
+
+class FakeClient:
+    def __init__(self):
+        self.uploads = []
+
+    def bucket(self, name):
+        return FakeBucket(self.uploads)
+
+
+def with_fake_client(test):
+    def run():
+        fake = FakeClient()
+        original = pipeline.get_gcs_client
+        pipeline.get_gcs_client = lambda: fake
+        try:
+            test(fake)
+        finally:
+            pipeline.get_gcs_client = original
+    return run
+
+
+@with_fake_client
+def test_text_uploaded_from_memory(fake):
+    print("🔍 Testing upload_text_to_gcs without temp files")
+    before = set(os.listdir(pipeline.MP3_OUTPUT_DIR))
+    url = pipeline.upload_text_to_gcs("Episode script — it’s here", "podcast/scripts/ep1.txt")
+    after = set(os.listdir(pipeline.MP3_OUTPUT_DIR))
+    kind, name, data, content_type, cache_control, _ = fake.uploads[0]
+    print(f"Upload: {kind} {name} {content_type} {cache_control} {data!r}")
+    assert url.endswith("podcast/scripts/ep1.txt")
+    assert kind == "string" and isinstance(data, bytes)
+    assert data.decode("utf-8") == "Episode script - it’s here"
+    assert content_type == "text/plain; charset=utf-8" and cache_control == "no-cache"
+    assert before == after
+    print("✅ Text uploaded straight from memory with UTF-8 metadata")
+
+
+@with_fake_client
+def test_text_file_not_rewritten(fake):
+    print("🔍 Testing upload_file_to_gcs for text files")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "notes.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Smart quote: â€œhiâ€")
+        mtime = os.path.getmtime(path)
+        pipeline.upload_file_to_gcs(path, "podcast/notes.txt")
+        assert os.path.getmtime(path) == mtime
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == "Smart quote: â€œhiâ€"
+    kind, _, data, content_type, _, _ = fake.uploads[0]
+    assert kind == "string" and content_type == "text/plain; charset=utf-8"
+    assert "â€" not in data.decode("utf-8")
+    print("✅ Cleaned text uploaded without writing the file back")
+
+
+@with_fake_client
+def test_large_audio_is_chunked(fake):
+    print("🔍 Testing chunked resumable audio uploads")
+    original = pipeline.GCS_RESUMABLE_THRESHOLD_BYTES
+    pipeline.GCS_RESUMABLE_THRESHOLD_BYTES = 1024
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            small, large = os.path.join(tmp, "small.mp3"), os.path.join(tmp, "large.mp3")
+            with open(small, "wb") as f:
+                f.write(b"\0" * 100)
+            with open(large, "wb") as f:
+                f.write(b"\0" * 4096)
+            pipeline.upload_audio_to_gcs(small, "podcast/audio/small.mp3")
+            pipeline.upload_audio_to_gcs(large, "podcast/audio/large.mp3")
+    finally:
+        pipeline.GCS_RESUMABLE_THRESHOLD_BYTES = original
+    assert fake.uploads[0][3] == "audio/mpeg" and fake.uploads[0][5] is None
+    assert fake.uploads[1][5] == pipeline.GCS_UPLOAD_CHUNK_SIZE
+    assert pipeline.GCS_UPLOAD_CHUNK_SIZE % (256 * 1024) == 0
+    print("✅ Large MP3s use chunked resumable uploads")
+
+
+def main():
+    print("🚀 GCS Memory Upload Test Suite")
+    print("=" * 60)
+    test_text_uploaded_from_memory()
+    test_text_file_not_rewritten()
+    test_large_audio_is_chunked()
+    print("\n🎉 All GCS memory upload tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for Google TTS PCM assembly.
+Builds LINEAR16 WAV buffers locally, joins them and checks that synthesized
+chunks are cached as raw WAV. No Google credentials or ffmpeg needed.
+"""
+
+import io
+import struct
+import sys
+import tempfile
+import wave
+from pathlib import Path
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def make_wav(samples, frame_rate=24000, channels=1):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(frame_rate)
+        w.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return buf.getvalue()
+
+
+def test_join_wav_pcm():
+    print("🔍 Testing PCM join")
+    first, second = make_wav([1, 2, 3]), make_wav([4, 5])
+    fmt, pcm = pipeline.join_wav_pcm([first, second])
+    print(f"Format: {fmt}, bytes: {len(pcm)}")
+    assert fmt == (1, 2, 24000)
+    assert pcm == struct.pack("<5h", 1, 2, 3, 4, 5)
+    try:
+        pipeline.join_wav_pcm([first, make_wav([6], frame_rate=16000)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("mismatched sample rates must not be joined")
+    print("✅ Samples joined in order; mismatched formats rejected")
+
+
+def test_placeholder_data_size():
+    print("🔍 Testing streaming-style data size placeholder")
+    wav = bytearray(make_wav([7, 8, 9]))
+    data_pos = bytes(wav).index(b"data")
+    wav[data_pos + 4:data_pos + 8] = (0xFFFFFFFF).to_bytes(4, "little")
+    fmt, pcm = pipeline.read_wav_pcm(bytes(wav))
+    assert bytes(pcm) == struct.pack("<3h", 7, 8, 9)
+    print("✅ Data chunk bounded by the buffer length")
+
+
+class FakeResponse:
+    def __init__(self, audio_content):
+        self.audio_content = audio_content
+
+
+class FakeTTSClient:
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize_speech(self, input=None, voice=None, audio_config=None):
+        self.calls += 1
+        return FakeResponse(make_wav([self.calls] * 4))
+
+
+def test_chunks_cached_as_wav():
+    print("🔍 Testing raw WAV chunk cache")
+    original = (pipeline.TTS_CACHE_DIR, pipeline.TTS_CACHE_GCS_PREFIX, pipeline.google_tts_client)
+    fake_client = FakeTTSClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline.TTS_CACHE_DIR = Path(tmp) / "tts_cache"
+        pipeline.TTS_CACHE_GCS_PREFIX = ""
+        pipeline.google_tts_client = fake_client
+        try:
+            first = pipeline._synthesize_google_chunk("Hello from the podcast.", "Alnilam")
+            again = pipeline._synthesize_google_chunk("Hello from the podcast.", "Alnilam")
+            cached_files = [p.name for p in pipeline.TTS_CACHE_DIR.iterdir()]
+        finally:
+            pipeline.TTS_CACHE_DIR, pipeline.TTS_CACHE_GCS_PREFIX, pipeline.google_tts_client = original
+    print(f"API calls: {fake_client.calls}, cache files: {cached_files}")
+    assert fake_client.calls == 1
+    assert first == again
+    assert len(cached_files) == 1 and cached_files[0].endswith(".wav")
+    print("✅ Cache hit returns the raw WAV without another API call")
+
+
+def main():
+    print("🚀 Google PCM Assembly Test Suite")
+    print("=" * 60)
+    test_join_wav_pcm()
+    test_placeholder_data_size()
+    test_chunks_cached_as_wav()
+    print("\n🎉 All Google PCM assembly tests passed!")
+
+
+if __name__ == "__main__":
+    main()
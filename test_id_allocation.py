@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script for counter-based Output / Workflow Steps / Log ID allocation.
+A fake spreadsheet implements the developer metadata create, read and filtered update,
+so concurrent reservations can be simulated without Google credentials.
+"""
+
+import sys
+import threading
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeSpreadsheet:
+    def __init__(self, sheet_id):
+        self.id = sheet_id
+        self.metadata = []
+        self.lock = threading.Lock()
+        self.reads = 0
+        self.updates = 0
+
+    def fetch_sheet_metadata(self, params=None):
+        assert params == {"fields": "developerMetadata"}
+        with self.lock:
+            self.reads += 1
+            return {"developerMetadata": [dict(entry) for entry in self.metadata]}
+
+    def batch_update(self, body):
+        request = body["requests"][0]
+        with self.lock:
+            if "createDeveloperMetadata" in request:
+                entry = dict(request["createDeveloperMetadata"]["developerMetadata"])
+                entry["metadataId"] = len(self.metadata) + 1
+                self.metadata.append(entry)
+                return {"replies": [{"createDeveloperMetadata": {"developerMetadata": entry}}]}
+            update = request["updateDeveloperMetadata"]
+            lookup = update["dataFilters"][0]["developerMetadataLookup"]
+            self.updates += 1
+            matched = [e for e in self.metadata
+                       if e["metadataId"] == lookup["metadataId"] and e["metadataValue"] == lookup["metadataValue"]]
+            for entry in matched:
+                entry["metadataValue"] = update["developerMetadata"]["metadataValue"]
+            return {"replies": [{"updateDeveloperMetadata": {"developerMetadata": matched}}]}
+
+
+class FakeHistoryWorksheet:
+    def __init__(self, title, spreadsheet, ids):
+        self.title = title
+        self.spreadsheet = spreadsheet
+        self.ids = ids
+        self.column_reads = 0
+        self.appended = []
+
+    def col_values(self, col):
+        self.column_reads += 1
+        return ["ID"] + [str(i) for i in self.ids]
+
+    def append_rows(self, rows, value_input_option=None):
+        self.appended.extend(rows)
+        row = len(self.ids) + len(self.appended) + 1
+        return {"updates": {"updatedRange": f"'{self.title}'!A{row}:C{row}"}}
+
+
+def test_seed_and_cached_reservations():
+    print("🔍 Testing counter seeding and cached reservations")
+    spreadsheet = FakeSpreadsheet("ids-seed")
+    outputs_ws = FakeHistoryWorksheet("Outputs", spreadsheet, [1, 2, 7])
+    steps_ws = FakeHistoryWorksheet("Workflow Steps", spreadsheet, ["10.1", "11.1", "12.05"])
+
+    assert pipeline.reserve_ids(outputs_ws) == 8
+    assert pipeline.reserve_ids(outputs_ws) == 9
+    assert pipeline.reserve_ids(steps_ws, 5) == 13
+    assert pipeline.reserve_ids(steps_ws, 2) == 18
+    assert outputs_ws.column_reads == 1 and steps_ws.column_reads == 1, "history is read once to seed"
+    reads = spreadsheet.reads
+    pipeline.reserve_ids(outputs_ws)
+    assert spreadsheet.reads == reads, "cached counter needs no metadata read"
+    print(f"Metadata reads: {spreadsheet.reads}, swaps: {spreadsheet.updates}")
+    print("✅ Counters seeded from the ID column once, then advanced in one call each")
+
+
+def test_concurrent_runs_get_distinct_ids():
+    print("🔍 Testing two runs reserving from the same counter")
+    spreadsheet = FakeSpreadsheet("ids-race")
+    outputs_ws = FakeHistoryWorksheet("Outputs", spreadsheet, [41])
+    pipeline.reserve_ids(outputs_ws)
+    # Another run advances the counter behind this process's cache
+    spreadsheet.metadata[0]["metadataValue"] = "50"
+    assert pipeline.reserve_ids(outputs_ws, 3) == 51, "stale cache must not hand out taken IDs"
+
+    results = []
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        results.append(pipeline.reserve_ids(outputs_ws))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == [54, 55, 56, 57]
+    assert spreadsheet.metadata[0]["metadataValue"] == "57"
+    print("✅ Compare-and-swap retries after a concurrent reservation")
+
+
+def test_log_id_blocks():
+    print("🔍 Testing block reservation for Log IDs")
+    spreadsheet = FakeSpreadsheet("ids-logs")
+    logs_ws = FakeHistoryWorksheet("Logs", spreadsheet, [3])
+    ids = [pipeline.next_block_id(logs_ws, 5) for _ in range(7)]
+    assert ids == [4, 5, 6, 7, 8, 9, 10]
+    assert spreadsheet.updates == 2, "one compare-and-swap per block, not per log line"
+    assert spreadsheet.metadata[0]["metadataValue"] == "13"
+    print("✅ Log IDs handed out locally from reserved blocks")
+
+
+def test_append_row_number():
+    print("🔍 Testing row number from the append response")
+    worksheet = FakeHistoryWorksheet("Outputs", FakeSpreadsheet("ids-append"), [1, 2, 3])
+    assert pipeline.append_sheet_row(worksheet, [4, "2026-01-01 00:00:00"]) == 5
+    assert pipeline.append_sheet_row(worksheet, [5, "2026-01-01 00:00:00"]) == 6
+    print("✅ Output row taken from updatedRange")
+
+
+def main():
+    print("🚀 ID Allocation Test Suite")
+    print("=" * 60)
+    test_seed_and_cached_reservations()
+    test_concurrent_runs_get_distinct_ids()
+    test_log_id_blocks()
+    test_append_row_number()
+    print("\n🎉 All ID allocation tests passed!")
+
+
+if __name__ == "__main__":
+    main()
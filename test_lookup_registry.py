@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the indexed lookup registry built from the reference tabs.
+Checks first-row-wins semantics, deprecated handling and MODEL_ID_OVERRIDES merging.
+"""
+
+import sys
+
+import pandas as pd
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def build_registry():
+    models_df = pd.DataFrame([
+        {"Model ID": 1, "Model Name": "gpt-4o", "Web Search": "N", "Deprecated": "N"},
+        {"Model ID": 2, "Model Name": "gpt-4o", "Web Search": "Y", "Deprecated": "Y"},
+        {"Model ID": 3, "Model Name": "o3", "Web Search": "Y", "Deprecated": "N"},
+        {"Model ID": 4, "Model Name": "", "Web Search": "N", "Deprecated": "N"},
+        {"Model ID": 1, "Model Name": "duplicate", "Web Search": "Y", "Deprecated": "N"},
+    ])
+    prompts_df = pd.DataFrame([{"Prompt ID": 4, "Prompt Description": "Write the script."}])
+    locations_df = pd.DataFrame([{"Location ID": 7, "Location": "podcast/scripts/"}])
+    eleven_df = pd.DataFrame([{"Eleven ID": 1, "Voice": "Liam", "Stability": 0.5}])
+    return pipeline.build_lookup_registry(models_df, prompts_df, locations_df, eleven_df)
+
+
+def test_model_lookups():
+    print("🔍 Testing model lookups")
+    registry = build_registry()
+    assert registry['model_name_by_id']['1'] == "gpt-4o"
+    assert registry['model_name_by_id']['4'] is None
+    assert registry['model_id_by_name']['gpt-4o'] == "1"
+    assert registry['model_web_search_by_id']['3'] is True
+    # Only the deprecated gpt-4o row has web search, so the active row decides
+    assert registry['model_web_search_by_name']['gpt-4o'] is False
+    assert registry['model_web_search_by_name']['o3'] is True
+    print("✅ Model lookups match the old DataFrame scans")
+
+
+def test_overrides_are_merged():
+    print("🔍 Testing MODEL_ID_OVERRIDES merging")
+    registry = build_registry()
+    assert registry['model_name_by_id']['188'] == pipeline.MODEL_ID_OVERRIDES['188']['name']
+    assert registry['model_web_search_by_id']['188'] is True
+    assert registry['model_web_search_by_id']['187'] is False
+    assert registry['model_web_search_by_name']['gpt-5.4'] is True
+    print("✅ Overrides fill in models missing from the Models tab")
+
+
+def test_other_tabs():
+    print("🔍 Testing prompt, location and Eleven lookups")
+    registry = build_registry()
+    assert registry['prompt_desc_by_id']['4'] == "Write the script."
+    assert registry['location_by_id']['7']['Location'] == "podcast/scripts/"
+    assert registry['eleven_by_id']['1']['Voice'] == "Liam"
+    assert '99' not in registry['location_by_id']
+    print("✅ Reference tabs indexed by ID")
+
+
+def main():
+    print("🚀 Lookup Registry Test Suite")
+    print("=" * 60)
+    test_model_lookups()
+    test_overrides_are_merged()
+    test_other_tabs()
+    print("\n🎉 All lookup registry tests passed!")
+
+
+if __name__ == "__main__":
+    main()
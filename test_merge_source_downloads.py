@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent source downloads of the audio merge (L#&L#SL#) step.
+GCS downloads are replaced with sleeping stubs so no credentials are needed.
+"""
+
+import sys
+import threading
+import time
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+LOCATIONS = {
+    '1': {'Location': 'intro/intro.mp3', 'Type': 'File'},
+    '2': {'Location': 'eleven-labs/', 'Type': 'mp3'},
+    '3': {'Location': 'outro/outro.mp3', 'Type': 'File'},
+    '4': {'Location': 'scripts/', 'Type': 'txt'},
+    '5': {'Location': 'empty-folder/', 'Type': 'mp3'},
+}
+
+
+def with_stub_downloads(fn):
+    original_file = pipeline.download_mp3_file_from_gcs
+    original_latest = pipeline.download_latest_mp3_from_gcs
+    calls = []
+    lock = threading.Lock()
+
+    def fake_file(blob_name):
+        with lock:
+            calls.append(blob_name)
+        time.sleep(0.2 if 'intro' in blob_name else 0.05)
+        return f"/tmp/{blob_name.replace('/', '_')}"
+
+    def fake_latest(folder_prefix):
+        with lock:
+            calls.append(folder_prefix)
+        time.sleep(0.1)
+        return None if folder_prefix == 'empty-folder/' else f"/tmp/latest_{folder_prefix.strip('/')}.mp3"
+
+    pipeline.download_mp3_file_from_gcs = fake_file
+    pipeline.download_latest_mp3_from_gcs = fake_latest
+    try:
+        return fn(calls)
+    finally:
+        pipeline.download_mp3_file_from_gcs = original_file
+        pipeline.download_latest_mp3_from_gcs = original_latest
+
+
+def test_downloads_overlap_and_keep_order():
+    print("🔍 Testing concurrent downloads in location order")
+
+    def run(calls):
+        start = time.time()
+        paths, errors = pipeline.download_merge_sources(['1', '2', '3'], LOCATIONS.get, max_workers=4)
+        return paths, errors, time.time() - start
+
+    paths, errors, elapsed = with_stub_downloads(run)
+    print(f"Paths: {paths}, elapsed {elapsed:.2f}s")
+    assert paths == ["/tmp/intro_intro.mp3", "/tmp/latest_eleven-labs.mp3", "/tmp/outro_outro.mp3"]
+    assert errors == []
+    assert elapsed < 0.3, "downloads should overlap"
+    print("✅ Slowest source sets the pace; order preserved")
+
+
+def test_errors_and_repeated_sources():
+    print("🔍 Testing error messages and repeated locations")
+
+    def run(calls):
+        result = pipeline.download_merge_sources(['1', '4', '5', '99', '3', '1'], LOCATIONS.get)
+        return result, list(calls)
+
+    (paths, errors), calls = with_stub_downloads(run)
+    print(f"Paths: {paths}\nErrors: {errors}")
+    assert paths == ["/tmp/intro_intro.mp3", "/tmp/outro_outro.mp3", "/tmp/intro_intro.mp3"]
+    assert errors == [
+        "Location 4 is not a file or mp3 type",
+        "Failed to download latest mp3 from folder empty-folder/ for location 5",
+        "Location ID 99 not found in Locations sheet.",
+    ]
+    assert calls.count('intro/intro.mp3') == 1, "repeated location should be downloaded once"
+    print("✅ Same error messages as the sequential loop; duplicates fetched once")
+
+
+def test_temp_paths_are_private():
+    print("🔍 Testing temp paths for the same source")
+    first = pipeline.gcs_temp_download_path('intro/intro.mp3')
+    second = pipeline.gcs_temp_download_path('intro/intro.mp3')
+    print(f"Paths: {first.name}, {second.name}")
+    assert first != second, "parallel steps reading one source need separate files"
+    assert first.parent == pipeline.MP3_OUTPUT_DIR and first.name.endswith('_intro_intro.mp3')
+    assert pipeline.temp_download_path('outro.mp3').name.startswith('temp_')
+    print("✅ Each download gets its own temp file")
+
+
+def main():
+    print("🚀 Merge Source Download Test Suite")
+    print("=" * 60)
+    test_downloads_overlap_and_keep_order()
+    test_errors_and_repeated_sources()
+    test_temp_paths_are_private()
+    print("\n🎉 All merge source download tests passed!")
+
+
+if __name__ == "__main__":
+    main()
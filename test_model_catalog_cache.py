@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent provider discovery, the model catalog TTL cache and the
+unchanged-catalog shortcut in update_models_tab. Providers and the sheet are faked.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import gspread
+import pandas as pd
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeModelsWorksheet:
+    def __init__(self, spreadsheet):
+        self.title = 'Models'
+        self.spreadsheet = spreadsheet
+        self.grid = []
+
+    @property
+    def rows(self):
+        return self.grid[1:]
+
+
+class FakeSpreadsheet:
+    def __init__(self):
+        self.id = 'models-sheet'
+        self.batch_updates = 0
+        self.models_ws = FakeModelsWorksheet(self)
+
+    def worksheet(self, title):
+        assert title == 'Models'
+        return self.models_ws
+
+    def values_batch_update(self, body):
+        self.batch_updates += 1
+        for entry in body['data']:
+            start = entry['range'].split('!')[1].split(':')[0]
+            row, col = gspread.utils.a1_to_rowcol(start)
+            for r, values in enumerate(entry['values']):
+                while len(self.models_ws.grid) < row + r:
+                    self.models_ws.grid.append([])
+                target = self.models_ws.grid[row + r - 1]
+                while len(target) < col - 1 + len(values):
+                    target.append('')
+                target[col - 1:col - 1 + len(values)] = values
+
+
+def slow(models):
+    def fetch():
+        fetch.calls += 1
+        time.sleep(0.15)
+        return models
+    fetch.calls = 0
+    return fetch
+
+
+def with_fake_providers(fn):
+    names = ('fetch_openai_models', 'fetch_anthropic_models', 'fetch_google_models', 'ASSET_CACHE_DIR', 'MODEL_CATALOG_CACHE_GCS_BLOB')
+    originals = {name: getattr(pipeline, name) for name in names}
+    fetchers = {
+        'fetch_openai_models': slow([{'id': 'gpt-4o', 'provider': 'openai', 'web_search': True}]),
+        'fetch_anthropic_models': slow([{'id': 'claude-sonnet-4-5', 'provider': 'anthropic', 'web_search': True}]),
+        'fetch_google_models': slow([{'id': 'gemini-2.5-pro', 'provider': 'google', 'web_search': False}]),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, fetcher in fetchers.items():
+            setattr(pipeline, name, fetcher)
+        pipeline.ASSET_CACHE_DIR = Path(tmp)
+        pipeline.MODEL_CATALOG_CACHE_GCS_BLOB = ""
+        try:
+            return fn(fetchers)
+        finally:
+            for name, value in originals.items():
+                setattr(pipeline, name, value)
+
+
+def test_concurrent_fetch_and_ttl_cache():
+    print("🔍 Testing concurrent provider fetch and TTL cache")
+
+    def run(fetchers):
+        start = time.time()
+        first = pipeline.fetch_model_catalog()
+        elapsed = time.time() - start
+        second = pipeline.fetch_model_catalog()
+        refreshed = pipeline.fetch_model_catalog(force_refresh=True)
+        return first, elapsed, second, refreshed, fetchers
+
+    first, elapsed, second, refreshed, fetchers = with_fake_providers(run)
+    print(f"First fetch {elapsed:.2f}s from {first['source']}, second from {second['source']}")
+    assert [m['id'] for m in first['models']] == ['gpt-4o', 'claude-sonnet-4-5', 'gemini-2.5-pro']
+    assert elapsed < 0.35, "providers should be queried concurrently"
+    assert second['source'] == 'cache' and second['hash'] == first['hash']
+    assert refreshed['source'] == 'providers'
+    assert all(f.calls == 2 for f in fetchers.values())
+    print("✅ Providers fetched side by side; cached catalog reused within the TTL")
+
+
+def test_update_models_tab_skips_unchanged_catalog():
+    print("🔍 Testing Models tab rewrite skipping")
+
+    def run(fetchers):
+        spreadsheet = FakeSpreadsheet()
+        models_df = pd.DataFrame(columns=pipeline.MODELS_TAB_HEADERS)
+        first_log = pipeline.update_models_tab(spreadsheet, models_df)
+        pipeline.flush_sheet_writes("test")
+        sheet_df = pd.DataFrame(spreadsheet.models_ws.rows, columns=pipeline.MODELS_TAB_HEADERS)
+        second_log = pipeline.update_models_tab(spreadsheet, sheet_df.copy())
+        pipeline.flush_sheet_writes("test")
+        # A manual edit to the tab forces the rewrite again
+        edited_df = sheet_df.copy()
+        edited_df.loc[0, 'Model Default'] = 'Y'
+        spreadsheet.models_ws.grid[1][2] = 'Y'
+        third_log = pipeline.update_models_tab(spreadsheet, edited_df)
+        pipeline.flush_sheet_writes("test")
+        return spreadsheet, first_log, second_log, third_log
+
+    spreadsheet, first_log, second_log, third_log = with_fake_providers(run)
+    print(f"Logs:\n  {first_log}\n  {second_log}\n  {third_log}")
+    assert "Updated Models tab" in first_log
+    assert "already up to date" in second_log
+    assert "Updated Models tab" in third_log
+    assert "0 changed range(s)" in third_log, "the edit is kept and nothing else differs"
+    assert spreadsheet.batch_updates == 1
+    assert spreadsheet.models_ws.rows[0][2] == 'Y'
+    print("✅ Unchanged catalog and tab skip the sheet write")
+
+
+def main():
+    print("🚀 Model Catalog Cache Test Suite")
+    print("=" * 60)
+    test_concurrent_fetch_and_ttl_cache()
+    test_update_models_tab_skips_unchanged_catalog()
+    print("\n🎉 All model catalog cache tests passed!")
+
+
+if __name__ == "__main__":
+    main()
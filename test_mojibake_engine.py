@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled single-pass mojibake cleaner.
+Compares the regex engine with the ordered str.replace rule chain and checks
+that already-cleaned text is not cleaned again.
+"""
+
+import sys
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+SAMPLES = [
+    "OpenAIâ€™s new model â€œthinksâ€ longer â€” and it shows.",
+    "CafÃ© owners said â\u0080\u009cwowâ\u0080\u009d â\u0080\u0094 twiceâ\u0080¦",
+    "Price: Â£20 â€¢ Tier 1 â€¢ Tier 2â€¦",
+    "Windows quotes \x93like this\x94 and \x91this\x92 \x96 done \x97 end",
+    "It’s already clean — mostly… right?",
+    "Plain ASCII text with nothing to do.",
+    "",
+]
+
+
+def test_engine_matches_rule_chain():
+    print("🔍 Testing engine against the ordered rule chain")
+    for sample in SAMPLES:
+        expected = pipeline._apply_mojibake_rules(sample)
+        actual = pipeline.force_clean_mojibake(sample)
+        print(f"  {sample[:40]!r} -> {actual[:40]!r}")
+        assert actual == expected, (sample, actual, expected)
+    assert pipeline.force_clean_mojibake("It’s — fine…") == "It’s - fine..."
+    print("✅ Single regex pass matches the sequential replacements")
+
+
+def test_clean_marker_skips_work():
+    print("🔍 Testing already-clean marker")
+    cleaned = pipeline.clean_text(SAMPLES[0])
+    assert isinstance(cleaned, pipeline.CleanText)
+    assert pipeline.clean_text(cleaned) is cleaned
+    assert pipeline.fix_text_encoding(cleaned) is cleaned
+    assert pipeline.force_clean_mojibake(cleaned) is cleaned
+    # Derived strings lose the marker and are cleaned again
+    assert not isinstance(cleaned + "â€™", pipeline.CleanText)
+    assert pipeline.force_clean_mojibake(cleaned + " \x93ok\x94") == cleaned + " \"ok\""
+    print("✅ Cleaned text passes through later stages untouched")
+
+
+def test_single_table_for_every_stage():
+    print("🔍 Testing the patterns the upload and save steps used to handle themselves")
+    triple = "Ã¢â‚¬â„¢Tis Ã¢â‚¬Â"
+    assert pipeline.clean_text(triple) == "'Tis \""
+    assert pipeline.remaining_mojibake(pipeline.clean_text(SAMPLES[0] + triple)) == []
+    assert 'â€™' in pipeline.remaining_mojibake("still â€™ here")
+    # The fix_text_encoding fallback reads the same table
+    assert pipeline.fix_text_encoding("OpenAIâ€™s model") == "OpenAI's model"
+    print("✅ One compiled table covers every cleaning stage")
+
+
+def test_non_string_input():
+    print("🔍 Testing non-string input")
+    assert pipeline.force_clean_mojibake(42) == "42"
+    assert pipeline.clean_text(None) == "None"
+    print("✅ Non-strings are converted like before")
+
+
+def main():
+    print("🚀 Mojibake Engine Test Suite")
+    print("=" * 60)
+    test_engine_matches_rule_chain()
+    test_clean_marker_skips_work()
+    test_single_table_for_every_stage()
+    test_non_string_input()
+    print("\n🎉 All mojibake engine tests passed!")
+
+
+if __name__ == "__main__":
+    main()
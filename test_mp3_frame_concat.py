@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test script for frame-level MP3 concatenation.
+Builds synthetic MPEG-1 Layer III files (with ID3v2, Xing and ID3v1 tags) so no encoder is needed.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append('.')
+from ai_podcast_pipeline_for_cursor import (
+    parse_mp3_frame_header,
+    scan_mp3_stream,
+    concat_mp3_frames,
+    merge_multiple_audio_files,
+)
+
+# MPEG-1 Layer III, 44.1 kHz, joint stereo; byte 2 carries the bitrate index.
+HEADER_128K = bytes([0xFF, 0xFB, 0x90, 0x40])
+HEADER_192K = bytes([0xFF, 0xFB, 0xB0, 0x40])
+
+
+def build_frame(header, fill):
+    frame_length = parse_mp3_frame_header(header)["frame_length"]
+    return header + bytes([fill]) * (frame_length - 4)
+
+
+def build_xing_frame(header):
+    frame = bytearray(build_frame(header, 0))
+    frame[36:40] = b"Xing"
+    return bytes(frame)
+
+
+def build_id3v2_tag():
+    body = b"TIT2" + (6).to_bytes(4, "big") + b"\x00\x00" + b"\x00Intro"
+    size = len(body)
+    syncsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x04\x00\x00" + syncsafe + body
+
+
+def write_mp3(path, header, frame_count, fill, with_tags=True):
+    frames = b"".join(build_frame(header, fill) for _ in range(frame_count))
+    with open(path, 'wb') as f:
+        if with_tags:
+            f.write(build_id3v2_tag())
+            f.write(build_xing_frame(header))
+        f.write(frames)
+        if with_tags:
+            f.write(b"TAG" + b"\x00" * 125)
+    return frames
+
+
+def test_header_parsing():
+    print("🔍 Testing frame header parsing")
+    info = parse_mp3_frame_header(HEADER_128K)
+    print(f"Parsed header: {info}")
+    assert info["bitrate"] == 128000
+    assert info["sample_rate"] == 44100
+    assert info["channels"] == 2
+    assert info["frame_length"] == 417
+    assert parse_mp3_frame_header(b"RIFF") is None
+    print("✅ Header parsed correctly")
+
+
+def test_scan_strips_tags():
+    print("🔍 Testing tag and Xing stripping")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "a.mp3")
+        frames = write_mp3(path, HEADER_128K, 10, 0x11)
+        stream = scan_mp3_stream(path)
+        print(f"Scan result: {stream}")
+        assert stream["frame_count"] == 10
+        assert stream["audio_end"] - stream["audio_start"] == len(frames)
+        assert stream["bitrates"] == {128000}
+    print("✅ ID3v2, Xing and ID3v1 excluded from the audio range")
+
+
+def test_concat_matching_files():
+    print("🔍 Testing frame concat of matching files")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"chunk_{i}.mp3") for i in range(3)]
+        expected = b"".join(write_mp3(p, HEADER_128K, 5 + i, 0x20 + i) for i, p in enumerate(paths))
+        output_path = os.path.join(tmp, "merged.mp3")
+        result = merge_multiple_audio_files(paths, output_path)
+        assert result == output_path
+        with open(output_path, 'rb') as f:
+            merged = f.read()
+        print(f"Merged bytes: {len(merged)} (expected {len(expected)})")
+        assert merged == expected
+        assert scan_mp3_stream(output_path)["frame_count"] == 18
+    print("✅ Matching files concatenated frame-for-frame")
+
+
+def test_mismatched_bitrate_falls_back():
+    print("🔍 Testing bitrate mismatch fallback")
+    with tempfile.TemporaryDirectory() as tmp:
+        a = os.path.join(tmp, "a.mp3")
+        b = os.path.join(tmp, "b.mp3")
+        write_mp3(a, HEADER_128K, 4, 0x01)
+        write_mp3(b, HEADER_192K, 4, 0x02)
+        output_path = os.path.join(tmp, "merged.mp3")
+        assert concat_mp3_frames([a, b], output_path) is False
+        assert not os.path.exists(output_path)
+    print("✅ Mismatched inputs left to the pydub path")
+
+
+def main():
+    print("🚀 MP3 Frame Concat Test Suite")
+    print("=" * 60)
+    test_header_parsing()
+    test_scan_strips_tags()
+    test_concat_matching_files()
+    test_mismatched_bitrate_falls_back()
+    print("\n🎉 All MP3 frame concat tests passed!")
+
+
+if __name__ == "__main__":
+    main()
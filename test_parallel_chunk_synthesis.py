@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded parallel chunk synthesis engine.
+Checks ordering, concurrency limits, failure propagation and concurrency-limit error detection
+without calling the ElevenLabs API.
+"""
+
+import sys
+import threading
+import time
+
+sys.path.append('.')
+from ai_podcast_pipeline_for_cursor import (
+    run_chunk_jobs_in_order,
+    is_elevenlabs_concurrency_limit_error,
+    call_with_elevenlabs_concurrency_retry,
+)
+
+
+def test_results_keep_chunk_order():
+    """Chunks finishing out of order must still be returned in chunk order."""
+    print("🔍 Testing result ordering")
+
+    def job(idx):
+        time.sleep(0.05 * (5 - idx))
+        return f"chunk_{idx}"
+
+    results = run_chunk_jobs_in_order(job, 5, 3)
+    print(f"Results: {results}")
+    assert results == [f"chunk_{idx}" for idx in range(5)]
+    print("✅ Results returned in chunk order")
+
+
+def test_concurrency_is_bounded():
+    """No more than max_workers jobs may run at once."""
+    print("🔍 Testing concurrency bound")
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def job(idx):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.1)
+        with lock:
+            state["active"] -= 1
+        return idx
+
+    start = time.time()
+    run_chunk_jobs_in_order(job, 6, 2)
+    elapsed = time.time() - start
+    print(f"Peak concurrency: {state['peak']}, elapsed: {elapsed:.2f}s")
+    assert state["peak"] == 2
+    assert elapsed < 0.55, "jobs should overlap instead of running sequentially"
+    print("✅ Concurrency bounded and jobs overlapped")
+
+
+def test_failure_propagates():
+    """A failing chunk must surface its exception to the caller."""
+    print("🔍 Testing failure propagation")
+
+    def job(idx):
+        if idx == 2:
+            raise ValueError("ElevenLabs credit/quota error: quota_exceeded")
+        return idx
+
+    try:
+        run_chunk_jobs_in_order(job, 4, 2)
+    except ValueError as e:
+        print(f"Caught expected error: {e}")
+    else:
+        raise AssertionError("expected ValueError from failing chunk")
+    print("✅ Failure propagated")
+
+
+def test_concurrency_error_detection():
+    """Concurrency rejections are retryable; credit errors are not."""
+    print("🔍 Testing concurrency-limit error detection")
+    assert is_elevenlabs_concurrency_limit_error("too_many_concurrent_requests", 429)
+    assert is_elevenlabs_concurrency_limit_error("system_busy")
+    assert is_elevenlabs_concurrency_limit_error("rate limited", 429)
+    assert not is_elevenlabs_concurrency_limit_error("quota_exceeded", 429)
+    assert not is_elevenlabs_concurrency_limit_error("voice not found", 404)
+    print("✅ Concurrency-limit errors detected correctly")
+
+
+def test_concurrency_retry():
+    """A request rejected for concurrency is retried until it succeeds."""
+    print("🔍 Testing concurrency retry")
+    calls = {"count": 0}
+
+    class BusyError(Exception):
+        status_code = 429
+
+    def request_fn():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise BusyError("too_many_concurrent_requests")
+        return "ok"
+
+    assert call_with_elevenlabs_concurrency_retry(request_fn, "chunk 1") == "ok"
+    assert calls["count"] == 2
+    print("✅ Concurrency rejection retried")
+
+
+def main():
+    print("🚀 Parallel Chunk Synthesis Test Suite")
+    print("=" * 60)
+    test_results_keep_chunk_order()
+    test_concurrency_is_bounded()
+    test_failure_propagates()
+    test_concurrency_error_detection()
+    test_concurrency_retry()
+    print("\n🎉 All parallel chunk synthesis tests passed!")
+
+
+if __name__ == "__main__":
+    main()
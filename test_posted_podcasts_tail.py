@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the PPL# tail read of the Posted Podcasts tab.
+The worksheet is faked and records which ranges are requested.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import gspread
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+HEADERS = ['Posted Podcasts ID', 'Title', 'Description', 'Description Short']
+
+
+class FakePostedWorksheet:
+    def __init__(self, episode_count, blank_rows=0):
+        self.grid = [HEADERS] + [[str(n), f"Episode {n}", f"Long {n}", f"Short {n}"] for n in range(1, episode_count + 1)]
+        self.grid += [[] for _ in range(blank_rows)]
+        self.row_count = len(self.grid)
+        self.col_count = 4
+        self.requested = []
+        self.full_reads = 0
+
+    def batch_get(self, ranges):
+        self.requested.append(list(ranges))
+        results = []
+        for range_name in ranges:
+            start, end = range_name.split(':')
+            first_row, _ = gspread.utils.a1_to_rowcol(start)
+            last_row, _ = gspread.utils.a1_to_rowcol(end)
+            results.append(self.grid[first_row - 1:last_row])
+        return results
+
+    def get_all_records(self):
+        self.full_reads += 1
+        return [dict(zip(HEADERS, row)) for row in self.grid[1:] if row]
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self.posted_ws = worksheet
+
+    def worksheet(self, title):
+        assert title == 'Posted Podcasts'
+        return self.posted_ws
+
+
+def with_state(state, fn):
+    original = pipeline.ASSET_CACHE_DIR, pipeline.POSTED_PODCASTS_STATE_GCS_BLOB
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline.ASSET_CACHE_DIR = Path(tmp)
+        pipeline.POSTED_PODCASTS_STATE_GCS_BLOB = ""
+        if state:
+            pipeline.save_posted_podcasts_state(state)
+        try:
+            return fn()
+        finally:
+            pipeline.ASSET_CACHE_DIR, pipeline.POSTED_PODCASTS_STATE_GCS_BLOB = original
+
+
+def test_tail_read():
+    print("🔍 Testing tail range read")
+    ws = FakePostedWorksheet(500)
+    records = with_state(None, lambda: pipeline.read_last_posted_podcasts(FakeSpreadsheet(ws), 15))
+    assert ws.requested == [["A1:D1", "A487:D501"]]
+    assert ws.full_reads == 0
+    assert [r['Posted Podcasts ID'] for r in records][:3] == ['500', '499', '498'] and len(records) == 15
+    output = pipeline.format_posted_podcasts(records[:2])
+    assert output == "Title: Episode 500\nDescription Short: Short 500\n\nTitle: Episode 499\nDescription Short: Short 499"
+    print("✅ Only the header and the last N rows are requested")
+
+
+def test_stale_state_and_fallback():
+    print("🔍 Testing stale sync state and blank-row fallback")
+    ws = FakePostedWorksheet(45)
+    state = {"url": pipeline.POSTED_PODCASTS_RSS_URL, "guids": [], "rows": 40}
+    records = with_state(state, lambda: pipeline.read_last_posted_podcasts(FakeSpreadsheet(ws), 5))
+    assert ws.requested == [["A1:D1", "A42:D46"]] and ws.full_reads == 0
+    assert records[0]['Title'] == "Episode 45", "rows added since the last sync must be read"
+
+    blank = FakePostedWorksheet(40, blank_rows=960)
+    records = with_state(None, lambda: pipeline.read_last_posted_podcasts(FakeSpreadsheet(blank), 5))
+    assert blank.full_reads == 1, "a blank tail falls back to the full read"
+    assert [r['Posted Podcasts ID'] for r in records] == ['40', '39', '38', '37', '36']
+
+    small = FakePostedWorksheet(3)
+    records = with_state(None, lambda: pipeline.read_last_posted_podcasts(FakeSpreadsheet(small), 15))
+    assert small.requested == [["A1:D1", "A2:D4"]] and len(records) == 3
+    assert with_state(None, lambda: pipeline.read_last_posted_podcasts(FakeSpreadsheet(FakePostedWorksheet(0)), 5)) == []
+    print("✅ Grid size is the tail; blank tails and short tabs read whole")
+
+
+def main():
+    print("🚀 Posted Podcasts Tail Read Test Suite")
+    print("=" * 60)
+    test_tail_read()
+    test_stale_state_and_fallback()
+    print("\n🎉 All Posted Podcasts tail read tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared provider clients and call deadlines.
+Client factories are replaced with local stubs so no API keys are used.
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def test_shared_client_created_once():
+    print("🔍 Testing shared client registry")
+    created = []
+
+    def factory():
+        time.sleep(0.05)
+        created.append(object())
+        return created[-1]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pipeline.get_shared_client('test-provider', factory)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    pipeline._shared_clients.pop('test-provider', None)
+    assert len(created) == 1
+    assert all(r is created[0] for r in results)
+    assert pipeline.get_openai_client() is pipeline.client
+    print("✅ One client per provider, even under concurrent first use")
+
+
+def test_deadlines():
+    print("🔍 Testing deadline helpers")
+    assert pipeline.deadline_after(None) is None
+    assert pipeline.remaining_seconds(None) is None
+    assert not pipeline.deadline_passed(None)
+    deadline = pipeline.deadline_after(0.1)
+    assert 0 < pipeline.remaining_seconds(deadline) <= 0.1
+    time.sleep(0.12)
+    assert pipeline.deadline_passed(deadline)
+    assert pipeline.remaining_seconds(deadline) == 0.0
+    print("✅ Remaining time shrinks to zero at the deadline")
+
+
+def test_gemini_request_timeout():
+    print("🔍 Testing Gemini request deadline")
+    seen = {}
+
+    class FakeModel:
+        def __init__(self, model, generation_config=None):
+            pass
+
+        def generate_content(self, prompt, request_options=None):
+            seen['request_options'] = request_options
+            return SimpleNamespace(text=" Gemini answer ", usage_metadata=None)
+
+    fake_genai = SimpleNamespace(
+        types=SimpleNamespace(GenerationConfig=lambda **kwargs: kwargs),
+        GenerativeModel=FakeModel,
+    )
+    original_module, original_key = pipeline.get_gemini_module, os.environ.get('GEMINI_API_KEY')
+    pipeline.get_gemini_module = lambda: fake_genai
+    os.environ['GEMINI_API_KEY'] = 'test'
+    try:
+        assert pipeline.call_google_model("prompt") == "Gemini answer"
+    finally:
+        pipeline.get_gemini_module = original_module
+        if original_key is None:
+            os.environ.pop('GEMINI_API_KEY', None)
+        else:
+            os.environ['GEMINI_API_KEY'] = original_key
+    assert seen['request_options'] == {"timeout": pipeline.GOOGLE_MODEL_TIMEOUT_SECONDS}
+    print("✅ generate_content is called with a timeout")
+
+
+def main():
+    print("🚀 Provider Client Test Suite")
+    print("=" * 60)
+    test_shared_client_created_once()
+    test_deadlines()
+    test_gemini_request_timeout()
+    print("\n🎉 All provider client tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test script for the conditional, incremental Posted Podcasts RSS sync (PPU).
+The feed and the Posted Podcasts worksheet are faked, so no network or sheet calls are made.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def feed_xml(episode_numbers):
+    """RSS document listing the given episodes newest first, like the real feed."""
+    items = "".join(
+        f"<item><title>Episode {n}</title><guid>ep-{n}</guid>"
+        f"<description>&lt;p&gt;Story {n}&lt;/p&gt; Help support the show</description></item>"
+        for n in sorted(episode_numbers, reverse=True)
+    )
+    return f"<?xml version='1.0'?><rss><channel><title>Show</title>{items}</channel></rss>".encode()
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.bytes_sent = 0
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), 64):
+            self.bytes_sent += 64
+            yield self.body[start:start + 64]
+
+    def close(self):
+        pass
+
+
+class FakeFeed:
+    def __init__(self, episode_numbers):
+        self.episodes = list(episode_numbers)
+        self.requests = []
+        self.responses = []
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        assert stream, "the feed must be streamed"
+        self.requests.append(dict(headers or {}))
+        etag = f'"v{len(self.episodes)}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            response = FakeResponse(304)
+        else:
+            response = FakeResponse(200, feed_xml(self.episodes), {"ETag": etag})
+        self.responses.append(response)
+        return response
+
+
+class FakePostedWorksheet:
+    def __init__(self):
+        self.title = 'Posted Podcasts'
+        self.row_count = 1000
+        self.rows = []
+        self.appends = 0
+        self.rewrites = 0
+
+    def resize(self, rows, cols):
+        self.row_count = rows
+
+    def update(self, values, range_name):
+        assert range_name == 'A2'
+        self.rows = [list(row) for row in values]
+        self.rewrites += 1
+
+    def append_rows(self, rows, value_input_option=None, insert_data_option=None):
+        assert insert_data_option == 'INSERT_ROWS'
+        self.rows.extend(list(row) for row in rows)
+        self.row_count += len(rows)
+        self.appends += 1
+
+
+class FakeSpreadsheet:
+    def __init__(self):
+        self.posted_ws = FakePostedWorksheet()
+
+    def worksheet(self, title):
+        assert title == 'Posted Podcasts'
+        return self.posted_ws
+
+
+def with_fake_feed(feed, fn):
+    originals = (pipeline.get_http_session, pipeline.ASSET_CACHE_DIR, pipeline.POSTED_PODCASTS_STATE_GCS_BLOB)
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline.get_http_session = lambda: feed
+        pipeline.ASSET_CACHE_DIR = Path(tmp)
+        pipeline.POSTED_PODCASTS_STATE_GCS_BLOB = ""
+        try:
+            return fn()
+        finally:
+            pipeline.get_http_session, pipeline.ASSET_CACHE_DIR, pipeline.POSTED_PODCASTS_STATE_GCS_BLOB = originals
+
+
+def test_incremental_sync():
+    print("🔍 Testing full first sync, 304 revalidation and append-only updates")
+    feed = FakeFeed(range(1, 41))
+    spreadsheet = FakeSpreadsheet()
+    ws = spreadsheet.posted_ws
+
+    def run():
+        first = pipeline.sync_posted_podcasts(spreadsheet)
+        second = pipeline.sync_posted_podcasts(spreadsheet)
+        feed.episodes.append(41)
+        third = pipeline.sync_posted_podcasts(spreadsheet)
+        return first, second, third
+
+    first, second, third = with_fake_feed(feed, run)
+    print(f"Logs:\n  {first}\n  {second}\n  {third}")
+    assert ws.rewrites == 1 and ws.appends == 1
+    assert ws.rows[0] == [1, "Episode 1", "Story 1 Help support the show", "Story 1"]
+    assert ws.rows[-1][:2] == [41, "Episode 41"] and len(ws.rows) == 41
+    assert feed.requests[1] == {"If-None-Match": '"v40"'}
+    assert "not modified" in second and "Appended 1 new episode" in third
+    full_bytes = len(feed.responses[0].body)
+    assert feed.responses[2].bytes_sent < full_bytes / 4, "parsing stops at the first known episode"
+    print("✅ Unchanged feed costs a 304; a new episode is one appended row")
+
+
+def test_rebuild_when_tab_changed():
+    print("🔍 Testing rebuild when the tab no longer matches the saved state")
+    feed = FakeFeed(range(1, 6))
+    spreadsheet = FakeSpreadsheet()
+    ws = spreadsheet.posted_ws
+
+    def run():
+        pipeline.sync_posted_podcasts(spreadsheet)
+        feed.episodes.append(6)
+        ws.row_count += 3  # rows added by hand
+        return pipeline.sync_posted_podcasts(spreadsheet)
+
+    log_msg = with_fake_feed(feed, run)
+    assert "Updated Posted Podcasts tab with 6 episodes" in log_msg
+    assert ws.rewrites == 2 and ws.appends == 0
+    assert [row[0] for row in ws.rows] == [1, 2, 3, 4, 5, 6]
+    assert ws.row_count == 7
+    print("✅ Mismatched tab rebuilt from the full feed")
+
+
+def main():
+    print("🚀 RSS Incremental Sync Test Suite")
+    print("=" * 60)
+    test_incremental_sync()
+    test_rebuild_when_tab_changed()
+    print("\n🎉 All RSS incremental sync tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for the process-wide GCS, Drive and HTTP client registry.
+Client constructors are stubbed so no credentials files are needed.
+"""
+
+import sys
+import threading
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeCredentials:
+    def __init__(self):
+        self.valid = True
+        self.expired = False
+        self.refresh_token = "refresh"
+
+
+def test_gcs_client_created_once():
+    print("🔍 Testing shared GCS client")
+    original = pipeline.storage.Client.from_service_account_json
+    created = []
+
+    def fake_from_json(path):
+        created.append(object())
+        return created[-1]
+
+    pipeline._shared_clients.pop('gcs', None)
+    pipeline.storage.Client.from_service_account_json = fake_from_json
+    try:
+        first = pipeline.get_gcs_client()
+        second = pipeline.get_gcs_client()
+    finally:
+        pipeline.storage.Client.from_service_account_json = original
+        pipeline._shared_clients.pop('gcs', None)
+    assert first is second and len(created) == 1
+    print("✅ Credentials parsed once for every storage call")
+
+
+def test_failed_client_is_not_cached():
+    print("🔍 Testing GCS client creation failure")
+    original = pipeline.storage.Client.from_service_account_json
+
+    def failing_from_json(path):
+        raise FileNotFoundError(path)
+
+    pipeline._shared_clients.pop('gcs', None)
+    pipeline.storage.Client.from_service_account_json = failing_from_json
+    try:
+        assert pipeline.get_gcs_client() is None
+        assert 'gcs' not in pipeline._shared_clients
+    finally:
+        pipeline.storage.Client.from_service_account_json = original
+    print("✅ A failed client is retried on the next call")
+
+
+def test_drive_service_per_thread():
+    print("🔍 Testing Drive credentials sharing")
+    original_load, original_build = pipeline.load_drive_credentials_oauth, pipeline.build
+    loads, builds = [], []
+
+    def fake_load():
+        loads.append(FakeCredentials())
+        return loads[-1]
+
+    def fake_build(name, version, credentials=None):
+        builds.append(credentials)
+        return object()
+
+    pipeline._shared_clients.pop('drive_credentials', None)
+    pipeline.load_drive_credentials_oauth = fake_load
+    pipeline.build = fake_build
+    services = []
+    try:
+        services.append(pipeline.get_drive_service_oauth())
+        services.append(pipeline.get_drive_service_oauth())
+        worker = threading.Thread(target=lambda: services.append(pipeline.get_drive_service_oauth()))
+        worker.start()
+        worker.join()
+    finally:
+        pipeline.load_drive_credentials_oauth, pipeline.build = original_load, original_build
+        pipeline._shared_clients.pop('drive_credentials', None)
+        pipeline._drive_local.service = None
+    assert len(loads) == 1
+    assert services[0] is services[1] and services[2] is not services[0]
+    assert all(creds is loads[0] for creds in builds)
+    print("✅ Credentials loaded once; one service per thread")
+
+
+def test_http_session_shared():
+    print("🔍 Testing shared HTTP session")
+    assert pipeline.get_http_session() is pipeline.get_http_session()
+    print("✅ REST calls share one connection pool")
+
+
+def main():
+    print("🚀 Shared Client Registry Test Suite")
+    print("=" * 60)
+    test_gcs_client_created_once()
+    test_failed_client_is_not_cached()
+    test_drive_service_per_thread()
+    test_http_session_shared()
+    print("\n🎉 All shared client tests passed!")
+
+
+if __name__ == "__main__":
+    main()
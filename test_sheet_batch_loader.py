@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for the single-request startup sheet loader.
+Uses a fake spreadsheet so no Google credentials are needed.
+"""
+
+import sys
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeSpreadsheet:
+    def __init__(self, values_by_range):
+        self.values_by_range = values_by_range
+        self.requests = []
+
+    def values_batch_get(self, ranges):
+        self.requests.append(list(ranges))
+        return {"valueRanges": [{"range": r, "values": self.values_by_range.get(r, [])} for r in ranges]}
+
+
+def test_records_match_get_all_records():
+    print("🔍 Testing record conversion")
+    values = [
+        ["Workflow ID", "Workflow Code", "Active"],
+        ["43", "P1M188,P4&R1M145", "Y"],
+        ["44", "PPU"],
+    ]
+    records = pipeline.sheet_values_to_records(values)
+    print(f"Records: {records}")
+    assert records == [
+        {"Workflow ID": 43, "Workflow Code": "P1M188,P4&R1M145", "Active": "Y"},
+        {"Workflow ID": 44, "Workflow Code": "PPU", "Active": ""},
+    ]
+    assert pipeline.sheet_values_to_records([]) == []
+    print("✅ Records numericised and padded like get_all_records")
+
+
+def test_single_batch_request():
+    print("🔍 Testing one values_batch_get for all tabs")
+    spreadsheet = FakeSpreadsheet({
+        "'Workflows'": [["Workflow ID"], ["43"]],
+        "'Outputs'!1:1": [["Output ID", "Triggered Date", "Output 1"]],
+        "'Outputs'!A2:A": [["1"], ["2"], ["3"]],
+        "'Workflow Steps'!A1:A": [["Workflow Steps ID"], ["10.1"], ["11.1"]],
+    })
+    results = pipeline.batch_get_sheet_ranges(spreadsheet, {
+        "Workflows": [None],
+        "Outputs": ["1:1", "A2:A"],
+        "Workflow Steps": ["A1:A"],
+    })
+    assert len(spreadsheet.requests) == 1
+    assert spreadsheet.requests[0] == ["'Workflows'", "'Outputs'!1:1", "'Outputs'!A2:A", "'Workflow Steps'!A1:A"]
+
+    header_values, id_values = results["Outputs"]
+    print(f"Outputs ranges: {results['Outputs']}")
+    assert header_values == [["Output ID", "Triggered Date", "Output 1"]]
+    assert id_values == [["1"], ["2"], ["3"]]
+    steps = pipeline.sheet_values_to_records(results["Workflow Steps"][0])
+    assert [row["Workflow Steps ID"] for row in steps] == [10.1, 11.1]
+    print("✅ All tabs loaded in a single request")
+
+
+def main():
+    print("🚀 Sheet Batch Loader Test Suite")
+    print("=" * 60)
+    test_records_match_get_all_records()
+    test_single_batch_request()
+    print("\n🎉 All sheet batch loader tests passed!")
+
+
+if __name__ == "__main__":
+    main()
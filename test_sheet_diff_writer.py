@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for the cell-level sheet diff used by the Models and Prompts tab writers.
+Only the batched write queue is exercised; nothing is sent to Google Sheets.
+"""
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def test_diff_grid():
+    print("🔍 Testing grid diffs")
+    current = [["ID", "Name", "Flag"], [1, "a", "N"], [2, "b", "N"]]
+    assert pipeline.diff_sheet_grid(current, [list(row) for row in current]) == []
+
+    changed = [["ID", "Name", "Flag"], [1, "a", "Y"], [2, "b", "N"]]
+    assert pipeline.diff_sheet_grid(current, changed) == [("C2:C2", [["Y"]])]
+
+    appended = current + [[3, "c", "N"], [4, "d", "Y"]]
+    assert pipeline.diff_sheet_grid(current, appended) == [("A4:C5", [[3, "c", "N"], [4, "d", "Y"]])]
+
+    # Numpy scalars and NaN compare like the plain values the sheet returns
+    assert pipeline.diff_sheet_grid([[1, ""]], [[np.int64(1), float("nan")]]) == []
+
+    shorter = [["ID", "Name", "Flag"], [1, "a", "N"]]
+    assert pipeline.diff_sheet_grid(current, shorter) == [("A3:C3", [["", "", ""]])]
+
+    offset = pipeline.diff_sheet_grid([["x"], ["y"]], [["x"], ["z"]], start_row=2, start_col=4)
+    assert offset == [("D3:D3", [["z"]])]
+    print("✅ Only changed cells produce ranges; appended rows merge into one block")
+
+
+def test_queue_sheet_diff():
+    print("🔍 Testing diff queueing")
+    worksheet = SimpleNamespace(title="Prompts", spreadsheet=SimpleNamespace(id="diff-sheet"))
+    current = [["old one"], ["same"], ["old three"]]
+    desired = [["new one"], ["same"], ["new three"]]
+    assert pipeline.queue_sheet_diff(worksheet, current, current) == 0
+    assert "diff-sheet" not in pipeline._pending_sheet_updates
+    assert pipeline.queue_sheet_diff(worksheet, current, desired, start_row=2, start_col=3) == 2
+    pending = pipeline._pending_sheet_updates.pop("diff-sheet")[1]
+    assert pending == {"'Prompts'!C2:C2": [["new one"]], "'Prompts'!C4:C4": [["new three"]]}
+    print("✅ Unchanged tabs queue nothing; changes share one batch")
+
+
+def main():
+    print("🚀 Sheet Diff Writer Test Suite")
+    print("=" * 60)
+    test_diff_grid()
+    test_queue_sheet_diff()
+    print("\n🎉 All sheet diff writer tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the batched Google Sheets writer.
+Uses in-memory fake worksheets to check coalescing, flush ordering and 429 backoff.
+"""
+
+import sys
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeSpreadsheet:
+    def __init__(self, calls):
+        self.id = "sheet-1"
+        self.calls = calls
+
+    def values_batch_update(self, body):
+        self.calls.append(("values_batch_update", body))
+
+
+class FakeWorksheet:
+    def __init__(self, title, worksheet_id, spreadsheet, calls):
+        self.title = title
+        self.id = worksheet_id
+        self.spreadsheet = spreadsheet
+        self.calls = calls
+
+    def append_rows(self, rows, value_input_option=None):
+        self.calls.append(("append_rows", self.title, rows))
+
+
+class QuotaError(Exception):
+    code = 429
+
+
+def test_writes_are_coalesced():
+    print("🔍 Testing append/update coalescing")
+    calls = []
+    spreadsheet = FakeSpreadsheet(calls)
+    steps_ws = FakeWorksheet("Workflow Steps", 1, spreadsheet, calls)
+    outputs_ws = FakeWorksheet("Outputs", 2, spreadsheet, calls)
+
+    for n in range(3):
+        pipeline.queue_sheet_append(steps_ws, [n + 0.1, "step"])
+    pipeline.queue_sheet_update(outputs_ws, "A5:C5", [["1", "old", ""]])
+    pipeline.queue_sheet_update(outputs_ws, "A5:C5", [["1", "new", "out"]])
+    pipeline.queue_sheet_update(outputs_ws, "A6:C6", [["2", "x", "y"]])
+
+    api_calls = pipeline.flush_sheet_writes("test")
+    print(f"API calls: {api_calls}, recorded: {calls}")
+    assert api_calls == 2
+    assert calls[0] == ("append_rows", "Workflow Steps", [[0.1, "step"], [1.1, "step"], [2.1, "step"]])
+    body = calls[1][1]
+    assert [item["range"] for item in body["data"]] == ["'Outputs'!A5:C5", "'Outputs'!A6:C6"]
+    assert body["data"][0]["values"] == [["1", "new", "out"]]
+    assert pipeline.flush_sheet_writes("empty") == 0
+    print("✅ Rows batched per worksheet and latest range update wins")
+
+
+class BrokenWorksheet(FakeWorksheet):
+    def append_rows(self, rows, value_input_option=None):
+        raise ValueError("Unable to parse range")
+
+
+def test_failed_flush_keeps_writes():
+    print("🔍 Testing a flush where one append fails")
+    calls = []
+    spreadsheet = FakeSpreadsheet(calls)
+    logs_ws = BrokenWorksheet("Logs", 3, spreadsheet, calls)
+    outputs_ws = FakeWorksheet("Outputs", 4, spreadsheet, calls)
+
+    pipeline.queue_sheet_append(logs_ws, [1, "first"])
+    pipeline.queue_sheet_update(outputs_ws, "A2:B2", [["1", "done"]])
+    try:
+        pipeline.flush_sheet_writes("test")
+        raise AssertionError("a failed append must be reported")
+    except RuntimeError as e:
+        print(f"Raised: {e}")
+    assert calls == [("values_batch_update", calls[0][1])], "updates still sent when an append fails"
+
+    pipeline.queue_sheet_append(logs_ws, [2, "second"])
+    pending_rows = pipeline._pending_sheet_appends[3][1]
+    assert pending_rows == [[1, "first"], [2, "second"]], "unsent rows stay ahead of newer ones"
+    pipeline._pending_sheet_appends.pop(3)
+    assert pipeline.flush_sheet_writes_if_due() == 0
+    print("✅ Unsent rows re-queued in order and the failure surfaced")
+
+
+def test_backoff_on_quota_errors():
+    print("🔍 Testing 429 backoff")
+    original_backoff = pipeline.SHEETS_WRITE_BACKOFF_SECONDS
+    pipeline.SHEETS_WRITE_BACKOFF_SECONDS = 0
+    attempts = {"count": 0}
+
+    def request_fn():
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise QuotaError("APIError: [429]: Quota exceeded for quota metric 'Write requests'")
+        return "ok"
+
+    try:
+        assert pipeline.call_sheets_with_backoff(request_fn, "test") == "ok"
+    finally:
+        pipeline.SHEETS_WRITE_BACKOFF_SECONDS = original_backoff
+    assert attempts["count"] == 3
+    assert not pipeline.is_sheets_retryable_error(ValueError("Unable to parse range"))
+    print("✅ Quota errors retried, other errors not")
+
+
+def main():
+    print("🚀 Sheet Write Buffer Test Suite")
+    print("=" * 60)
+    test_writes_are_coalesced()
+    test_failed_flush_keeps_writes()
+    test_backoff_on_quota_errors()
+    print("\n🎉 All sheet write buffer tests passed!")
+
+
+if __name__ == "__main__":
+    main()
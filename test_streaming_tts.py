@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming ElevenLabs synthesis into the output file and a GCS upload.
+The SDK client and the bucket are replaced with local fakes, so no API calls are made.
+"""
+
+import gc
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeTextToSpeech:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def stream(self, **kwargs):
+        with self.lock:
+            self.calls.append(kwargs["text"])
+        # Earlier chunks are slower, so later chunks finish first and must wait their turn
+        delay = 0.15 if kwargs["text"].startswith("First") else 0.02
+        for n in range(3):
+            time.sleep(delay / 3)
+            yield f"<{kwargs['text'][:5]}:{n}>".encode()
+
+    convert = stream
+
+
+class FakeClient:
+    def __init__(self):
+        self.text_to_speech = FakeTextToSpeech()
+
+
+class FakeUpload(io.BytesIO):
+    def __init__(self, uploads, name):
+        super().__init__()
+        self.uploads = uploads
+        self.name_ = name
+
+    def close(self):
+        # Like BlobWriter: closing finalizes the upload unless it was terminated
+        if not self.closed:
+            self.uploads[self.name_] = self.getvalue()
+        super().close()
+
+    def terminate(self):
+        self.uploads.setdefault("terminated", []).append(self.name_)
+        io.BytesIO.close(self)
+
+
+class FakeBlob:
+    def __init__(self, uploads, name):
+        self.uploads = uploads
+        self.name = name
+
+    def open(self, mode, chunk_size=None, content_type=None):
+        assert mode == "wb" and content_type == "audio/mpeg"
+        return FakeUpload(self.uploads, self.name)
+
+
+class FakeGcsClient:
+    def __init__(self):
+        self.uploads = {}
+
+    def bucket(self, name):
+        return self
+
+    def blob(self, name):
+        return FakeBlob(self.uploads, name)
+
+
+def test_ordered_writer():
+    print("🔍 Testing in-order writes from concurrent producers")
+
+    def produce(idx, emit):
+        time.sleep(0.05 * (3 - idx))
+        emit(f"{idx}a".encode())
+        emit(f"{idx}b".encode())
+
+    out = io.BytesIO()
+    total = pipeline.write_chunk_streams_in_order(3, produce, [out], 3)
+    assert out.getvalue() == b"0a0b1a1b2a2b"
+    assert total == 12
+
+    def failing(idx, emit):
+        if idx == 1:
+            raise RuntimeError("chunk failed")
+        emit(b"x")
+
+    try:
+        pipeline.write_chunk_streams_in_order(3, failing, [io.BytesIO()], 2)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the chunk failure to propagate")
+    print("✅ Chunks written in order; failures re-raised")
+
+
+def test_stream_voice_audio():
+    print("🔍 Testing streaming synthesis with upload and metrics")
+    text = "First sentence here. " * 200 + "Second part of the episode. " * 200
+    fake_client = FakeClient()
+    fake_gcs = FakeGcsClient()
+    originals = (pipeline.get_elevenlabs_client, pipeline.get_gcs_client, pipeline.record_latest_gcs_upload,
+                 pipeline.TTS_CACHE_ENABLED, pipeline.ELEVENLABS_TTS_ENDPOINT)
+    pipeline.get_elevenlabs_client = lambda: fake_client
+    pipeline.get_gcs_client = lambda: fake_gcs
+    pipeline.record_latest_gcs_upload = lambda name: None
+    pipeline.TTS_CACHE_ENABLED = False
+    pipeline.ELEVENLABS_TTS_ENDPOINT = "stream"
+    pipeline.tts_chunk_metrics.clear()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "episode.mp3")
+            path, link = pipeline.stream_voice_audio(text, "voice", output_path, upload_blob_name="shows/episode.mp3")
+            with open(path, "rb") as f:
+                written = f.read()
+    finally:
+        (pipeline.get_elevenlabs_client, pipeline.get_gcs_client, pipeline.record_latest_gcs_upload,
+         pipeline.TTS_CACHE_ENABLED, pipeline.ELEVENLABS_TTS_ENDPOINT) = originals
+
+    chunks = pipeline.split_text_into_chunks(text, max_length=pipeline.ELEVENLABS_CHUNK_MAX_CHARS)
+    expected = b"".join(f"<{c[:5]}:{n}>".encode() for c in chunks for n in range(3))
+    print(f"Chunks: {len(chunks)}, bytes: {len(written)}, link: {link}")
+    assert len(chunks) > 1
+    assert written == expected
+    assert fake_gcs.uploads["shows/episode.mp3"] == expected
+    assert link.endswith("/shows/episode.mp3")
+    metrics = pipeline.tts_chunk_metrics
+    assert sorted(m["chunk"] for m in metrics) == list(range(1, len(chunks) + 1))
+    assert all(m["endpoint"] == "stream" and m["ttfb_s"] is not None and m["bytes_per_sec"] for m in metrics)
+    print("✅ Episode file and upload match the chunk order; TTFB recorded per chunk")
+
+
+class FailingTextToSpeech(FakeTextToSpeech):
+    def stream(self, **kwargs):
+        if kwargs["text"].startswith("Second"):
+            time.sleep(0.05)
+            raise RuntimeError("connection reset mid-episode")
+        yield from FakeTextToSpeech.stream(self, **kwargs)
+
+    convert = stream
+
+
+def test_failed_stream_cancels_upload():
+    print("🔍 Testing that a failed chunk cancels the GCS upload")
+    text = "First sentence here. " * 200 + "Second part of the episode. " * 200
+    fake_client = FakeClient()
+    fake_client.text_to_speech = FailingTextToSpeech()
+    fake_gcs = FakeGcsClient()
+    fallbacks = []
+    originals = (pipeline.get_elevenlabs_client, pipeline.get_gcs_client, pipeline.generate_voice_audio,
+                 pipeline.TTS_CACHE_ENABLED, pipeline.ELEVENLABS_TTS_ENDPOINT)
+    pipeline.get_elevenlabs_client = lambda: fake_client
+    pipeline.get_gcs_client = lambda: fake_gcs
+    pipeline.generate_voice_audio = lambda text, voice_id, output_path, eleven_config=None: fallbacks.append(output_path) or output_path
+    pipeline.TTS_CACHE_ENABLED = False
+    pipeline.ELEVENLABS_TTS_ENDPOINT = "stream"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "episode.mp3")
+            path, link = pipeline.stream_voice_audio(text, "voice", output_path, upload_blob_name="shows/episode.mp3")
+    finally:
+        (pipeline.get_elevenlabs_client, pipeline.get_gcs_client, pipeline.generate_voice_audio,
+         pipeline.TTS_CACHE_ENABLED, pipeline.ELEVENLABS_TTS_ENDPOINT) = originals
+    gc.collect()
+    print(f"Uploads: {sorted(fake_gcs.uploads)}")
+    assert "shows/episode.mp3" not in fake_gcs.uploads, "no truncated object may be published"
+    assert fake_gcs.uploads["terminated"] == ["shows/episode.mp3"]
+    assert link is None and fallbacks == [path]
+    print("✅ Resumable upload terminated before falling back")
+
+
+class BusyOnceTextToSpeech(FakeTextToSpeech):
+    def __init__(self):
+        super().__init__()
+        self.rejected = False
+
+    def stream(self, **kwargs):
+        if kwargs["text"].startswith("Second") and not self.rejected:
+            self.rejected = True
+            raise RuntimeError("too_many_concurrent_requests")
+        yield from FakeTextToSpeech.stream(self, **kwargs)
+
+    convert = stream
+
+
+def test_retry_sleep_not_network_time():
+    print("🔍 Testing that concurrency backoff is not counted as network time")
+    text = "First sentence here. " * 200 + "Second part of the episode. " * 200
+    fake_client = FakeClient()
+    fake_client.text_to_speech = BusyOnceTextToSpeech()
+    originals = (pipeline.get_elevenlabs_client, pipeline.TTS_CACHE_ENABLED, pipeline.ELEVENLABS_TTS_ENDPOINT,
+                 pipeline.STEP_TRACE_PATH)
+    pipeline.get_elevenlabs_client = lambda: fake_client
+    pipeline.TTS_CACHE_ENABLED = False
+    pipeline.ELEVENLABS_TTS_ENDPOINT = "stream"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            pipeline.STEP_TRACE_PATH = Path(tmp) / "step_trace.jsonl"
+            output_path = os.path.join(tmp, "episode.mp3")
+            records = [[1.1, "2024-01-01", 43, 43, "R4E1", "R4E1", "prompt", "output", "log"]]
+            metrics = pipeline.run_instrumented_step(
+                lambda i, step: pipeline.stream_voice_audio(text, "voice", output_path), 0, "R4E1", records, {}
+            )
+    finally:
+        (pipeline.get_elevenlabs_client, pipeline.TTS_CACHE_ENABLED, pipeline.ELEVENLABS_TTS_ENDPOINT,
+         pipeline.STEP_TRACE_PATH) = originals
+    print(f"Metrics: {metrics}")
+    assert fake_client.text_to_speech.rejected and metrics["retries"] == 1
+    assert metrics["wall_s"] >= 1.0, "the retry waits a second"
+    assert metrics["network_s"] < 0.9, "the backoff sleep must not be timed"
+    print("✅ Only the SDK request and stream are timed")
+
+
+def main():
+    print("🚀 Streaming TTS Test Suite")
+    print("=" * 60)
+    test_ordered_writer()
+    test_stream_voice_audio()
+    test_failed_stream_cancels_upload()
+    test_retry_sleep_not_network_time()
+    print("\n🎉 All streaming TTS tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed TTS audio cache.
+Verifies key sensitivity, store/fetch round trips, LRU eviction and that a cache hit skips the network.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+@contextmanager
+def temp_cache_dir():
+    """Point the cache at a throwaway directory for the duration of a test."""
+    original = (pipeline.TTS_CACHE_DIR, pipeline.TTS_CACHE_GCS_PREFIX)
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline.TTS_CACHE_DIR = Path(tmp) / "tts_cache"
+        pipeline.TTS_CACHE_GCS_PREFIX = ""
+        try:
+            yield tmp
+        finally:
+            pipeline.TTS_CACHE_DIR, pipeline.TTS_CACHE_GCS_PREFIX = original
+
+
+def test_cache_key_sensitivity():
+    print("🔍 Testing cache key sensitivity")
+    base = pipeline.build_elevenlabs_cache_key("Hello there.", "voice-1", None, "before", "after")
+    assert base == pipeline.build_elevenlabs_cache_key("Hello there.", "voice-1", None, "before", "after")
+    assert base != pipeline.build_elevenlabs_cache_key("Hello there!", "voice-1", None, "before", "after")
+    assert base != pipeline.build_elevenlabs_cache_key("Hello there.", "voice-2", None, "before", "after")
+    assert base != pipeline.build_elevenlabs_cache_key("Hello there.", "voice-1", {"Stability": 0.9}, "before", "after")
+    # eleven_v3 ignores previous_text/next_text, so context only matters for models that use it
+    assert base == pipeline.build_elevenlabs_cache_key("Hello there.", "voice-1", None, "other", "after")
+    v2_config = {"Model": "eleven_turbo_v2_5"}
+    assert pipeline.build_elevenlabs_cache_key("Hello there.", "voice-1", v2_config, "before", "after") != \
+        pipeline.build_elevenlabs_cache_key("Hello there.", "voice-1", v2_config, "other", "after")
+    print(f"Key: {base}")
+    print("✅ Cache key changes with text, voice, settings and context")
+
+
+def test_cache_outlives_mp3_cleanup():
+    print("🔍 Testing cache location")
+    assert pipeline.TTS_CACHE_DIR.parent == pipeline.ASSET_CACHE_DIR, "CI restores the asset cache directory"
+    assert pipeline.MP3_OUTPUT_DIR not in pipeline.TTS_CACHE_DIR.parents
+    print("✅ Local tier kept in the persistent cache directory, away from generated_mp3/")
+
+
+def test_store_and_fetch_round_trip():
+    print("🔍 Testing store/fetch round trip")
+    with temp_cache_dir() as tmp:
+        source = os.path.join(tmp, "source.mp3")
+        with open(source, 'wb') as f:
+            f.write(b"fake-mp3-bytes")
+        key = pipeline.build_tts_cache_key("test", text="abc")
+        target = os.path.join(tmp, "target.mp3")
+        assert pipeline.fetch_tts_cache(key, target) is False
+        pipeline.store_tts_cache(key, source)
+        assert pipeline.fetch_tts_cache(key, target) is True
+        with open(target, 'rb') as f:
+            assert f.read() == b"fake-mp3-bytes"
+    print("✅ Cached audio restored byte-for-byte")
+
+
+def test_lru_eviction():
+    print("🔍 Testing LRU eviction")
+    with temp_cache_dir():
+        pipeline.TTS_CACHE_DIR.mkdir(parents=True)
+        now = time.time()
+        for i, name in enumerate(["old", "middle", "new"]):
+            path = pipeline.TTS_CACHE_DIR / f"{name}.mp3"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (now - 100 + i * 10, now - 100 + i * 10))
+        pipeline.evict_tts_cache(max_bytes=200)
+        remaining = sorted(p.name for p in pipeline.TTS_CACHE_DIR.iterdir())
+        print(f"Remaining entries: {remaining}")
+        assert remaining == ["middle.mp3", "new.mp3"]
+    print("✅ Least recently used entry evicted first")
+
+
+def test_rest_cache_hit_skips_network():
+    print("🔍 Testing that a cache hit skips the ElevenLabs request")
+    with temp_cache_dir() as tmp:
+        text = "A short line for the cache test."
+        source = os.path.join(tmp, "cached.mp3")
+        with open(source, 'wb') as f:
+            f.write(b"cached-audio")
+        pipeline.store_tts_cache(pipeline.build_elevenlabs_cache_key(text, "voice-1"), source)
+
+        def fail_post(*args, **kwargs):
+            raise AssertionError("network should not be called on a cache hit")
+
+        original_post = pipeline.requests.post
+        pipeline.requests.post = fail_post
+        try:
+            output_path = os.path.join(tmp, "out.mp3")
+            result = pipeline.generate_voice_audio_rest(text, "voice-1", output_path)
+        finally:
+            pipeline.requests.post = original_post
+        assert result == output_path
+        with open(output_path, 'rb') as f:
+            assert f.read() == b"cached-audio"
+    print("✅ Cache hit served without a network call")
+
+
+def main():
+    print("🚀 TTS Cache Test Suite")
+    print("=" * 60)
+    test_cache_key_sensitivity()
+    test_cache_outlives_mp3_cleanup()
+    test_store_and_fetch_round_trip()
+    test_lru_eviction()
+    test_rest_cache_hit_skips_network()
+    print("\n🎉 All TTS cache tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared workbook snapshot.
+Checks that startup loads every tab in one request and that writes invalidate
+only the tab they touch. Uses fake gspread objects.
+"""
+
+import sys
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+class FakeWorksheet:
+    def __init__(self, title, worksheet_id, spreadsheet):
+        self.title = title
+        self.id = worksheet_id
+        self.spreadsheet = spreadsheet
+
+    def append_rows(self, rows, value_input_option=None):
+        self.spreadsheet.calls.append(("append_rows", self.title))
+
+
+class FakeSpreadsheet:
+    def __init__(self):
+        self.id = "snapshot-sheet"
+        self.calls = []
+        self.values = {
+            "'Workflows'": [["Workflow ID", "Workflow Code", "Active"], ["43", "P1M188", "Y"]],
+            "'Prompts'": [["Prompt ID", "Prompt Description"], ["1", "Research"]],
+            "'Models'": [["Model ID", "Model Name"], ["188", "gpt-5.4"]],
+            "'Locations'": [["Location ID", "Location"]],
+            "'Outputs'!1:1": [["Output ID", "Triggered Date"]],
+            "'Workflow Steps'!1:1": [["Workflow Steps ID"]],
+        }
+        self._worksheets = [FakeWorksheet(title, n, self) for n, title in enumerate(
+            ["Workflows", "Prompts", "Models", "Locations", "Outputs", "Workflow Steps", "Posted Podcasts"])]
+
+    def worksheets(self):
+        self.calls.append(("worksheets",))
+        return self._worksheets
+
+    def values_batch_get(self, ranges):
+        self.calls.append(("values_batch_get", list(ranges)))
+        return {"valueRanges": [{"range": r, "values": self.values.get(r, [])} for r in ranges]}
+
+
+def test_startup_loads_once():
+    print("🔍 Testing single startup load")
+    spreadsheet = FakeSpreadsheet()
+    snapshot = pipeline.load_workbook_snapshot(spreadsheet)
+    print(f"Calls: {[c[0] for c in spreadsheet.calls]}")
+    assert [c[0] for c in spreadsheet.calls] == ["worksheets", "values_batch_get"]
+    assert not any("Posted Podcasts" in r for r in spreadsheet.calls[1][1])
+    assert "'Outputs'!1:1" in spreadsheet.calls[1][1], "history tabs load only their header row"
+    assert list(pipeline.workbook_frame("Outputs").columns) == ["Output ID", "Triggered Date"]
+    assert pipeline.workbook_frame("Workflows").iloc[0]["Workflow Code"] == "P1M188"
+    assert list(pipeline.workbook_frame("Locations").columns) == pipeline.WORKBOOK_EMPTY_COLUMNS["Locations"]
+    assert list(pipeline.workbook_frame("Logs").columns) == pipeline.WORKBOOK_EMPTY_COLUMNS["Logs"]
+    assert len(spreadsheet.calls) == 2, "reads must come from the snapshot"
+    assert snapshot is pipeline._workbook_snapshot
+    print("✅ One metadata call and one values_batch_get for all tabs")
+
+
+def test_write_invalidates_only_that_tab():
+    print("🔍 Testing per-tab invalidation")
+    spreadsheet = FakeSpreadsheet()
+    pipeline.load_workbook_snapshot(spreadsheet)
+    outputs_ws = spreadsheet._worksheets[4]
+    pipeline.queue_sheet_append(outputs_ws, [3, "2026-01-01 00:00:00"])
+    assert pipeline._workbook_snapshot['stale'] == {"Outputs"}
+
+    steps_df = pipeline.workbook_frame("Workflow Steps")
+    assert len(spreadsheet.calls) == 2 and list(steps_df.columns) == ["Workflow Steps ID"]
+    outputs_df = pipeline.workbook_frame("Outputs")
+    print(f"Calls after refresh: {spreadsheet.calls[2:]}")
+    assert spreadsheet.calls[2] == ("append_rows", "Outputs"), "pending writes flush before re-reading"
+    assert spreadsheet.calls[3] == ("values_batch_get", ["'Outputs'!1:1"])
+    assert list(outputs_df.columns) == ["Output ID", "Triggered Date"]
+    assert not pipeline._workbook_snapshot['stale']
+    print("✅ Only the written tab is re-read, after its writes are flushed")
+
+
+def main():
+    print("🚀 Workbook Snapshot Test Suite")
+    print("=" * 60)
+    test_startup_loads_once()
+    test_write_invalidates_only_that_tab()
+    print("\n🎉 All workbook snapshot tests passed!")
+
+
+if __name__ == "__main__":
+    main()
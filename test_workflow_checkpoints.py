@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for workflow checkpoints used by RESUME_OUTPUT_ID.
+Round-trips a checkpoint through the local store (GCS mirroring disabled).
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def test_checkpoint_round_trip():
+    print("🔍 Testing checkpoint save/load round trip")
+    original = (pipeline.CHECKPOINT_DIR, pipeline.CHECKPOINT_GCS_PREFIX)
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline.CHECKPOINT_DIR = Path(tmp) / "checkpoints"
+        pipeline.CHECKPOINT_GCS_PREFIX = ""
+        try:
+            checkpoint = {
+                'output_id': 321,
+                'workflow_id': 43,
+                'workflow_code': 'P1M188,P4&R1M145,R2SL7',
+                'status': 'running',
+                'next_step': 2,
+                'current_output_row': 322,
+                'output_record': {'Output ID': 321, 'Output 1': 'P1', 'Output 2': 'Research brief — “quoted”'},
+                'all_outputs': ['Research brief — “quoted”', None],
+                'workflow_steps_records': [[1000.1, '2026-01-01 00:00:00', 43, 43, 'P1M188', 'P1M188', 'in', 'out', 'ok']],
+            }
+            assert pipeline.load_workflow_checkpoint(321) is None
+            pipeline.save_workflow_checkpoint(checkpoint)
+            loaded = pipeline.load_workflow_checkpoint(321)
+            print(f"Loaded checkpoint: next_step={loaded['next_step']}, outputs={len(loaded['all_outputs'])}")
+            assert loaded == checkpoint
+            assert pipeline.load_workflow_checkpoint("321") == checkpoint
+        finally:
+            pipeline.CHECKPOINT_DIR, pipeline.CHECKPOINT_GCS_PREFIX = original
+    print("✅ Checkpoint restored exactly")
+
+
+def main():
+    print("🚀 Workflow Checkpoint Test Suite")
+    print("=" * 60)
+    test_checkpoint_round_trip()
+    print("\n🎉 All workflow checkpoint tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the workflow step dependency graph and DAG scheduler.
+No sheets or model calls: steps are simulated with sleeps.
+"""
+
+import sys
+import threading
+import time
+
+sys.path.append('.')
+import ai_podcast_pipeline_for_cursor as pipeline
+
+
+def test_dependencies_from_references():
+    print("🔍 Testing dependency extraction")
+    steps = ["PPU", "PPL5", "P1M188", "P2&R2&R3M145SL7", "P3&R4M145", "R5SL8", "L7E1SL9T5", "L10&L9SL11T5"]
+    deps = pipeline.build_step_dependencies(steps)
+    for i, step_deps in enumerate(deps):
+        print(f"  Step {i+1} {steps[i]}: {sorted(d + 1 for d in step_deps)}")
+    assert deps == [set(), {0}, set(), {1, 2}, {3}, {4}, {3, 4}, {4, 6}]
+    print("✅ R#, T#, L#/SL# and PPU/PPL dependencies detected")
+
+
+def test_unknown_step_is_barrier():
+    print("🔍 Testing barrier for unrecognised steps")
+    deps = pipeline.build_step_dependencies(["P1", "P2", "X9?", "P3"])
+    assert deps == [set(), set(), {0, 1}, {2}]
+    print("✅ Unknown steps keep sequential semantics")
+
+
+def test_independent_steps_run_concurrently():
+    print("🔍 Testing concurrent execution along the critical path")
+    steps = ["P1", "P2", "P3", "P4&R1&R2&R3"]
+    deps = pipeline.build_step_dependencies(steps)
+    finished = []
+    lock = threading.Lock()
+
+    def run_step(i, step):
+        time.sleep(0.2)
+        with lock:
+            if i == 3:
+                assert {0, 1, 2} <= set(finished), "step 4 started before its inputs were ready"
+            finished.append(i)
+
+    done_order = []
+    start = time.time()
+    pipeline.run_steps_as_dag(steps, run_step, deps, 3, on_step_done=done_order.append)
+    elapsed = time.time() - start
+    print(f"Finished order: {finished}, elapsed {elapsed:.2f}s")
+    assert finished[-1] == 3
+    assert sorted(done_order) == [0, 1, 2, 3]
+    assert elapsed < 0.7, "independent steps should overlap"
+    print("✅ Independent steps overlapped; dependent step waited")
+
+
+def test_resume_and_failure():
+    print("🔍 Testing completed-step skipping and failure propagation")
+    steps = ["P1", "P2&R1", "P3&R2", "P4"]
+    deps = pipeline.build_step_dependencies(steps)
+    ran = []
+
+    def run_step(i, step):
+        ran.append(i)
+        if i == 1:
+            sys.exit(1)
+
+    try:
+        pipeline.run_steps_as_dag(steps, run_step, deps, 2, completed={0})
+    except SystemExit:
+        pass
+    else:
+        raise AssertionError("expected the failing step to stop the workflow")
+    print(f"Steps run: {sorted(ran)}")
+    assert 0 not in ran
+    assert 2 not in ran, "dependent of the failed step must not run"
+    print("✅ Completed steps skipped and failure re-raised")
+
+
+def main():
+    print("🚀 Workflow Step Scheduler Test Suite")
+    print("=" * 60)
+    test_dependencies_from_references()
+    test_unknown_step_is_barrier()
+    test_independent_steps_run_concurrently()
+    test_resume_and_failure()
+    print("\n🎉 All workflow step scheduler tests passed!")
+
+
+if __name__ == "__main__":
+    main()